@@ -1,13 +1,649 @@
 # ai_analyzer/growth_analyzer.py
 import openai
+import orjson
 from django.conf import settings
+from django.core.cache import cache
+from .openai_client import (
+    append_batch_request, create_async_openai_client, get_openai_client,
+    retrieve_batch_contents, submit_batch
+)
+from collections import OrderedDict, deque
+import asyncio
+import hashlib
+import heapq
+import itertools
 import json
+import operator
+import re
+import threading
 import time
 import logging
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# AI enhancement responses are cached by a hash of the exact request
+# (Redis in production, LocMem in development)
+_RESPONSE_CACHE = cache
+_ENHANCEMENT_CACHE_PREFIX = "growth:enh:"
+_ENHANCEMENT_CACHE_TTL = 1800  # 30 minutes
+# Parsed AI recommendations are also kept in-process, in front of the shared
+# cache, so repeat regenerations skip the cache round-trip and JSON parsing
+_AI_RECOMMENDATION_LRU_SIZE = 1024
+
+# Final recommendation lists are cached by a hash of the input data, so
+# re-analyzing an unchanged site (e.g. dashboard refresh) skips all work
+_RESULT_CACHE_PREFIX = "growth:full:"
+_RESULT_CACHE_TTL = 3600  # 1 hour
+
+_ENHANCEMENT_MODEL = "gpt-3.5-turbo"
+_ENHANCEMENT_MAX_TOKENS = 600  # 2-3 recommendations fit comfortably
+_ENHANCEMENT_TEMPERATURE = 0  # Deterministic output so cached responses stay valid
+_ENHANCEMENT_SEED = 42
+# JSON mode guarantees a parseable object and skips prose around it
+_ENHANCEMENT_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Static instructions go first, in the system message, so every enhancement
+# request shares the same prefix and benefits from OpenAI prompt caching;
+# the user message carries only the per-site details
+_ENHANCEMENT_SYSTEM_PROMPT = """As a digital marketing expert, review and enhance the growth recommendations for the business described by the user.
+
+Please:
+1. Suggest 2-3 additional high-impact recommendations not in the list
+2. Ensure recommendations are specific to this business
+3. Focus on quick wins and high ROI activities
+4. Consider the current trust score level
+
+Respond with a JSON object of the form {"recommendations": [...]}, where each recommendation has the same structure: title, description, category, priority, estimated_impact, effort_required, timeline."""
+
+_BULK_ENHANCEMENT_SYSTEM_PROMPT = """As a digital marketing expert, review and enhance the growth recommendations for each of the businesses listed by the user.
+
+For each business:
+1. Suggest 2-3 additional high-impact recommendations not in its list
+2. Ensure recommendations are specific to that business
+3. Focus on quick wins and high ROI activities
+4. Consider its current trust score level
+
+Return a JSON object keyed by business index ("0", "1", ...), where each value is a JSON array with structure: title, description, category, priority, estimated_impact, effort_required, timeline."""
+
+# Bulk enhancement packs several sites into one request, with the per-site
+# completion budget for each; the group size keeps the combined response
+# within the model's output token limit
+_BULK_GROUP_SIZE = 4
+
+# Pending OpenAI Batch API enhancement requests (see openai_client.submit_batch)
+_BATCH_PENDING_FILENAME = 'growth_pending.jsonl'
+
+# Default OpenAI rate limits used to pace concurrent enhancement requests
+_DEFAULT_REQUESTS_PER_MINUTE = 3500
+_DEFAULT_TOKENS_PER_MINUTE = 90000
+
+# Recommendation scoring weights. Category weights and effort bonuses are in
+# tenths, so composite scores are computed exactly in integer arithmetic and
+# converted once (e.g. 3 * 9 + 3 = 30 -> 3.0) instead of rounding floats
+_PRIORITY_WEIGHTS = {'high': 3, 'medium': 2, 'low': 1}
+_CATEGORY_WEIGHTS = {
+    'technical': 10,
+    'seo': 9,
+    'user_experience': 8,
+    'content': 7,
+    'reputation': 6,
+    'social_media': 5
+}
+_DEFAULT_CATEGORY_WEIGHT = 5
+# Keyed by the leading effort level, e.g. "Low - Content editing" (lower effort = higher score)
+_EFFORT_BONUS = {'low': 3, 'medium': 1, 'high': 0}
+
+# Lists up to this size are ranked with a keyless tuple sort
+_SMALL_SORT_SIZE = 16
+
+# Fallback video detection for crawls that predate the has_video flag
+_VIDEO_PATTERN = re.compile(r'\bvideos?\b', re.IGNORECASE)
+
+
+def _canonical_json(value) -> bytes:
+    """Serialize a value to sorted-key JSON bytes for stable hashing"""
+    return orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+
+def _enhancement_cache_key(model: str, prompt: str, max_tokens: int, temperature: float) -> str:
+    """Build a deterministic cache key for an AI enhancement request"""
+    payload = _canonical_json({
+        'model': model,
+        'prompt': prompt,
+        'max_tokens': max_tokens,
+        'temperature': temperature
+    })
+    return _ENHANCEMENT_CACHE_PREFIX + hashlib.sha256(payload).hexdigest()
+
+
+def _result_cache_key(data: Dict, ai_enabled: bool) -> str:
+    """Build a deterministic cache key for the recommendations of a dataset"""
+    payload = _canonical_json(data)
+    mode = 'ai' if ai_enabled else 'rules'
+    return f"{_RESULT_CACHE_PREFIX}{mode}:{hashlib.sha256(payload).hexdigest()}"
+
+
+class _RecommendationLRU:
+    """Thread-safe in-process LRU cache of parsed AI recommendation lists"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """Return a copy of the cached recommendations, or None"""
+        with self._lock:
+            recommendations = self._entries.get(key)
+            if recommendations is None:
+                return None
+            self._entries.move_to_end(key)
+
+        # Copies, since ranking stamps a composite_score on each record
+        return [dict(rec) for rec in recommendations]
+
+    def set(self, key: str, recommendations: List[Dict]):
+        """Store a copy of the recommendations, evicting the least recently used entry"""
+        with self._lock:
+            self._entries[key] = [dict(rec) for rec in recommendations]
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+_AI_RECOMMENDATION_CACHE = _RecommendationLRU(_AI_RECOMMENDATION_LRU_SIZE)
+
+
+class _RateLimiter:
+    """
+    Rolling one-minute window of OpenAI request and token usage
+
+    Callers wait before sending a request that would exceed either limit,
+    so concurrent requests are paced before the provider starts throttling.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._window = deque()  # (timestamp, tokens) per request
+        self._tokens_in_window = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int):
+        """Wait until a request consuming the given tokens fits in the window"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._window and now - self._window[0][0] >= 60:
+                    _, expired_tokens = self._window.popleft()
+                    self._tokens_in_window -= expired_tokens
+
+                if (len(self._window) < self.requests_per_minute
+                        and self._tokens_in_window + tokens <= self.tokens_per_minute) or not self._window:
+                    self._window.append((now, tokens))
+                    self._tokens_in_window += tokens
+                    return
+
+                # Sleep until the oldest request leaves the window
+                await asyncio.sleep(60 - (now - self._window[0][0]))
+
+
+# Static recommendation templates, built once at import. Generators return
+# shallow copies because prioritization stamps a composite_score on each dict;
+# dynamic fields are overlaid with {**template, ...}.
+_SSL_REC = {
+    'category': 'technical',
+    'title': 'Install SSL Certificate',
+    'description': 'Secure your website with HTTPS encryption to protect user data and improve search rankings.',
+    'priority': 'high',
+    'estimated_impact': 'High - Improves SEO rankings and user trust',
+    'effort_required': 'Low - Technical setup, 1-2 hours',
+    'timeline': '1-2 days',
+    'cost_estimate': 'Free - $100/year',
+    'implementation_steps': (
+        'Purchase SSL certificate from hosting provider',
+        'Install and configure SSL certificate',
+        'Update internal links to HTTPS',
+        'Set up 301 redirects from HTTP to HTTPS'
+    )
+}
+
+_PAGE_SPEED_REC_TEMPLATE = {
+    'category': 'technical',
+    'title': 'Optimize Page Loading Speed',
+    'estimated_impact': 'High - Better user experience, reduced bounce rate, improved SEO',
+    'effort_required': 'Medium - Development work required',
+    'timeline': '1-2 weeks',
+    'cost_estimate': '$500 - $2,000',
+    'implementation_steps': (
+        'Optimize and compress images',
+        'Minify CSS, JavaScript, and HTML',
+        'Enable browser caching',
+        'Use Content Delivery Network (CDN)',
+        'Optimize server response time'
+    )
+}
+
+_MOBILE_REC = {
+    'category': 'technical',
+    'title': 'Implement Mobile-Responsive Design',
+    'description': 'Ensure your website works perfectly on all mobile devices and screen sizes.',
+    'priority': 'high',
+    'estimated_impact': 'Very High - 60%+ of traffic is mobile',
+    'effort_required': 'High - Design and development work',
+    'timeline': '2-4 weeks',
+    'cost_estimate': '$2,000 - $10,000',
+    'implementation_steps': (
+        'Audit current mobile experience',
+        'Design responsive layouts',
+        'Implement responsive CSS framework',
+        'Test across multiple devices',
+        'Optimize mobile page speed'
+    )
+}
+
+_ROBOTS_TXT_REC = {
+    'category': 'technical',
+    'title': 'Create Robots.txt File',
+    'description': 'Add robots.txt to guide search engine crawlers and improve SEO.',
+    'priority': 'low',
+    'estimated_impact': 'Medium - Better search engine crawling',
+    'effort_required': 'Low - Simple file creation',
+    'timeline': '1 day',
+    'cost_estimate': 'Free',
+    'implementation_steps': (
+        'Create robots.txt file',
+        'Add crawling directives',
+        'Include sitemap reference',
+        'Upload to website root directory'
+    )
+}
+
+_CONTENT_VOLUME_REC_TEMPLATE = {
+    'category': 'content',
+    'title': 'Expand Content Volume',
+    'estimated_impact': 'High - Better search rankings and user engagement',
+    'effort_required': 'Medium - Content creation required',
+    'timeline': '2-4 weeks',
+    'cost_estimate': '$1,000 - $5,000',
+    'implementation_steps': (
+        'Conduct keyword research',
+        'Create content calendar',
+        'Write comprehensive page content',
+        'Add blog or resources section',
+        'Optimize content for target keywords'
+    )
+}
+
+_ALT_TEXT_REC_TEMPLATE = {
+    'category': 'content',
+    'description': 'Improve accessibility and SEO by adding descriptive alt text to all images.',
+    'priority': 'medium',
+    'estimated_impact': 'Medium - Improved accessibility and SEO',
+    'effort_required': 'Low - Content editing',
+    'timeline': '1-2 days',
+    'cost_estimate': '$200 - $500',
+    'implementation_steps': (
+        'Audit all images on website',
+        'Write descriptive alt text for each image',
+        'Update image tags with alt attributes',
+        'Implement alt text best practices for future images'
+    )
+}
+
+_CONTENT_MARKETING_REC = {
+    'category': 'content',
+    'title': 'Develop Content Marketing Strategy',
+    'description': 'Create a blog or resources section to attract organic traffic and establish expertise.',
+    'priority': 'medium',
+    'estimated_impact': 'High - Long-term organic traffic growth',
+    'effort_required': 'High - Ongoing content creation',
+    'timeline': '4-8 weeks to establish',
+    'cost_estimate': '$2,000 - $10,000',
+    'implementation_steps': (
+        'Research target audience and topics',
+        'Create editorial calendar',
+        'Set up blog/resources section',
+        'Write initial content pieces',
+        'Promote content on social media'
+    )
+}
+
+_VIDEO_CONTENT_REC = {
+    'category': 'content',
+    'title': 'Add Video Content',
+    'description': 'Incorporate video content to improve engagement and time on site.',
+    'priority': 'low',
+    'estimated_impact': 'Medium - Higher engagement and conversions',
+    'effort_required': 'Medium - Video production',
+    'timeline': '2-3 weeks',
+    'cost_estimate': '$1,000 - $5,000',
+    'implementation_steps': (
+        'Plan video content strategy',
+        'Create product demos or explainer videos',
+        'Set up video hosting and embedding',
+        'Optimize videos for SEO',
+        'Add video transcripts for accessibility'
+    )
+}
+
+_META_DESCRIPTION_REC = {
+    'category': 'seo',
+    'title': 'Add Meta Description',
+    'description': 'Write compelling meta descriptions to improve click-through rates from search results.',
+    'priority': 'medium',
+    'estimated_impact': 'Medium - Higher CTR from search results',
+    'effort_required': 'Low - Content writing',
+    'timeline': '1-2 days',
+    'cost_estimate': '$100 - $500',
+    'implementation_steps': (
+        'Research target keywords for each page',
+        'Write unique meta descriptions (150-160 characters)',
+        'Include primary keywords naturally',
+        'Add compelling calls-to-action',
+        'Test and optimize based on performance'
+    )
+}
+
+_TITLE_TAGS_REC = {
+    'category': 'seo',
+    'title': 'Optimize Title Tags',
+    'description': 'Improve title tags for better search engine rankings and click-through rates.',
+    'priority': 'high',
+    'estimated_impact': 'High - Direct impact on search rankings',
+    'effort_required': 'Low - Content optimization',
+    'timeline': '1-2 days',
+    'cost_estimate': '$200 - $500',
+    'implementation_steps': (
+        'Research primary keywords for each page',
+        'Write compelling titles (50-60 characters)',
+        'Include target keywords at the beginning',
+        'Make titles unique for each page',
+        'A/B test title variations'
+    )
+}
+
+_STRUCTURED_DATA_REC = {
+    'category': 'seo',
+    'title': 'Implement Structured Data Markup',
+    'description': 'Add schema markup to help search engines understand your content better and enhance search results.',
+    'priority': 'medium',
+    'estimated_impact': 'Medium - Enhanced search result appearance',
+    'effort_required': 'Medium - Technical implementation',
+    'timeline': '1 week',
+    'cost_estimate': '$500 - $1,500',
+    'implementation_steps': (
+        'Identify relevant schema types for your business',
+        'Implement JSON-LD structured data',
+        'Add organization and local business markup',
+        'Include product/service markup if applicable',
+        'Test with Google\'s Rich Results Tool'
+    )
+}
+
+_LOCAL_SEO_REC = {
+    'category': 'seo',
+    'title': 'Optimize for Local SEO',
+    'description': 'Improve local search visibility with Google My Business and local citations.',
+    'priority': 'high',
+    'estimated_impact': 'High - Local customer acquisition',
+    'effort_required': 'Medium - Local optimization work',
+    'timeline': '2-3 weeks',
+    'cost_estimate': '$500 - $2,000',
+    'implementation_steps': (
+        'Claim and optimize Google My Business listing',
+        'Ensure NAP consistency across directories',
+        'Build local citations and directories',
+        'Collect and manage customer reviews',
+        'Create location-specific content'
+    )
+}
+
+_SOCIAL_PRESENCE_REC = {
+    'category': 'social_media',
+    'title': 'Establish Social Media Presence',
+    'description': 'Create business profiles on major social media platforms to increase brand awareness.',
+    'priority': 'medium',
+    'estimated_impact': 'Medium - Brand awareness and traffic',
+    'effort_required': 'Medium - Ongoing content management',
+    'timeline': '2-3 weeks to establish',
+    'cost_estimate': '$1,000 - $3,000',
+    'implementation_steps': (
+        'Create business profiles on Facebook, Instagram, LinkedIn',
+        'Optimize profiles with complete business information',
+        'Develop content strategy and posting schedule',
+        'Create initial content and start posting regularly',
+        'Engage with followers and build community'
+    )
+}
+
+# Generic recommendations used when analysis fails
+_FALLBACK_RECOMMENDATIONS = (
+    {
+        'category': 'technical',
+        'title': 'Improve Website Security',
+        'description': 'Ensure your website has SSL certificate and basic security measures.',
+        'priority': 'high',
+        'estimated_impact': 'High - User trust and SEO',
+        'effort_required': 'Low',
+        'timeline': '1-2 days',
+        'cost_estimate': 'Free - $100'
+    },
+    {
+        'category': 'seo',
+        'title': 'Optimize Page Titles and Descriptions',
+        'description': 'Review and improve title tags and meta descriptions for better search visibility.',
+        'priority': 'high',
+        'estimated_impact': 'High - Search rankings',
+        'effort_required': 'Low',
+        'timeline': '1 week',
+        'cost_estimate': '$200 - $500'
+    },
+    {
+        'category': 'content',
+        'title': 'Create Quality Content',
+        'description': 'Develop valuable content that addresses your audience\'s needs and questions.',
+        'priority': 'medium',
+        'estimated_impact': 'High - Long-term growth',
+        'effort_required': 'Medium',
+        'timeline': '2-4 weeks',
+        'cost_estimate': '$1,000 - $5,000'
+    }
+)
+
+# Rule topics that overlap across categories, keyed as in _deduplicate_recommendations
+# (category, first three title words) and mapped to the topic they duplicate
+_DUPLICATE_TOPICS = {
+    ('user_experience', ('optimize', 'website', 'loading')): ('technical', ('optimize', 'page', 'loading'))
+}
+
+# Core platforms checked for presence, with display labels, and the
+# collector flags that indicate a profile was found
+_SOCIAL_PLATFORMS = (('facebook', 'Facebook'), ('instagram', 'Instagram'), ('linkedin', 'LinkedIn'))
+_PLATFORM_FOUND_KEYS = ('account_found', 'page_found', 'channel_found')
+
+_SOCIAL_EXPANSION_REC_TEMPLATE = {
+    'category': 'social_media',
+    'priority': 'medium',
+    'estimated_impact': 'Medium - Increased brand awareness and reach',
+    'effort_required': 'Medium - Profile setup and content creation',
+    'timeline': '2-4 weeks',
+    'cost_estimate': '$500 - $2,000'
+}
+_SOCIAL_EXPANSION_STEPS = (
+    'Develop platform-specific content strategy',
+    'Create initial content and posting schedule',
+    'Cross-promote existing social accounts',
+    'Monitor engagement and adjust strategy'
+)
+
+_SOCIAL_ENGAGEMENT_REC = {
+    'category': 'social_media',
+    'title': 'Improve Social Media Engagement',
+    'description': 'Enhance content quality and posting consistency to boost follower engagement.',
+    'priority': 'medium',
+    'estimated_impact': 'Medium - Higher engagement and reach',
+    'effort_required': 'Medium - Content strategy development',
+    'timeline': '4-6 weeks',
+    'cost_estimate': '$1,000 - $5,000',
+    'implementation_steps': (
+        'Analyze current content performance',
+        'Develop engaging content themes and formats',
+        'Create consistent posting schedule',
+        'Use interactive content (polls, Q&A, live videos)',
+        'Respond promptly to comments and messages'
+    )
+}
+
+_NAVIGATION_REC = {
+    'category': 'user_experience',
+    'title': 'Improve Site Navigation and Internal Linking',
+    'description': 'Add more internal links and improve navigation to help users find content easily.',
+    'priority': 'medium',
+    'estimated_impact': 'Medium - Better user experience and SEO',
+    'effort_required': 'Medium - Design and content work',
+    'timeline': '1-2 weeks',
+    'cost_estimate': '$500 - $2,000',
+    'implementation_steps': (
+        'Audit current site structure and navigation',
+        'Design intuitive navigation menu',
+        'Add relevant internal links within content',
+        'Create breadcrumb navigation',
+        'Add related content suggestions'
+    )
+}
+
+_CONTACT_ACCESSIBILITY_REC = {
+    'category': 'user_experience',
+    'title': 'Improve Contact Information Accessibility',
+    'description': 'Make it easier for customers to reach you by prominently displaying contact information.',
+    'priority': 'high',
+    'estimated_impact': 'High - Better customer communication and trust',
+    'effort_required': 'Low - Content addition',
+    'timeline': '1 day',
+    'cost_estimate': '$100 - $300',
+    'implementation_steps': (
+        'Add clear contact information to header/footer',
+        'Create dedicated contact page',
+        'Include multiple contact methods (phone, email, form)',
+        'Add business hours and location if applicable',
+        'Test contact forms for functionality'
+    )
+}
+
+_LOADING_SPEED_REC_TEMPLATE = {
+    'category': 'user_experience',
+    'title': 'Optimize Website Loading Speed',
+    'priority': 'high',
+    'estimated_impact': 'High - Reduced bounce rate, better conversions',
+    'effort_required': 'Medium - Technical optimization',
+    'timeline': '1-2 weeks',
+    'cost_estimate': '$500 - $2,000',
+    'implementation_steps': (
+        'Optimize image sizes and formats',
+        'Minimize HTTP requests',
+        'Enable compression and caching',
+        'Optimize database queries',
+        'Use performance monitoring tools'
+    )
+}
+
+_REPUTATION_MANAGEMENT_REC = {
+    'category': 'reputation',
+    'title': 'Implement Online Reputation Management',
+    'description': 'Establish presence on review platforms and actively manage your online reputation.',
+    'priority': 'medium',
+    'estimated_impact': 'High - Customer trust and credibility',
+    'effort_required': 'Medium - Ongoing management',
+    'timeline': '2-4 weeks to establish',
+    'cost_estimate': '$500 - $2,000',
+    'implementation_steps': (
+        'Create Google My Business listing',
+        'Set up monitoring for online mentions',
+        'Develop review generation strategy',
+        'Create response templates for reviews',
+        'Implement customer feedback system'
+    )
+}
+
+_REVIEW_GENERATION_REC_TEMPLATE = {
+    'category': 'reputation',
+    'title': 'Implement Review Generation Strategy',
+    'priority': 'high',
+    'estimated_impact': 'High - Increased customer trust and conversions',
+    'effort_required': 'Medium - Process development and implementation',
+    'timeline': '3-4 weeks',
+    'cost_estimate': '$1,000 - $3,000',
+    'implementation_steps': (
+        'Create customer review request process',
+        'Send follow-up emails after purchases/services',
+        'Add review request prompts on website',
+        'Train staff to request reviews in person',
+        'Monitor and respond to all reviews promptly'
+    )
+}
+
+_RATING_IMPROVEMENT_REC_TEMPLATE = {
+    'category': 'reputation',
+    'title': 'Improve Customer Satisfaction and Ratings',
+    'priority': 'high',
+    'estimated_impact': 'Very High - Better reputation drives more customers',
+    'effort_required': 'High - Operational improvements required',
+    'timeline': '2-3 months',
+    'cost_estimate': '$2,000 - $10,000',
+    'implementation_steps': (
+        'Analyze negative feedback for common issues',
+        'Implement customer service improvements',
+        'Train staff on customer satisfaction best practices',
+        'Create customer feedback loop and resolution process',
+        'Monitor ratings improvement over time'
+    )
+}
+
+
+class _JSONArrayStreamParser:
+    """
+    Incrementally parse objects from a streamed JSON array
+
+    Text is fed in as it arrives; each element of the first array in the
+    text (e.g. the value of {"recommendations": [...]}) is returned as soon
+    as it is complete, without waiting for the closing bracket.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._in_array = False
+
+    def feed(self, text: str) -> List:
+        """Add streamed text and return the array elements it completed"""
+        self._buffer += text
+        items = []
+
+        if not self._in_array:
+            start = self._buffer.find('[', self._position)
+            if start == -1:
+                return items
+            self._position = start + 1
+            self._in_array = True
+
+        while True:
+            # Skip whitespace and separators between elements
+            while self._position < len(self._buffer) and self._buffer[self._position] in ' \t\r\n,':
+                self._position += 1
+            if self._position >= len(self._buffer) or self._buffer[self._position] == ']':
+                return items
+
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                return items  # Element not complete yet
+
+            items.append(item)
+            self._position = end
+
 
 class GrowthAnalyzer:
     """
@@ -25,11 +661,11 @@ class GrowthAnalyzer:
         # Initialize OpenAI client if API key is available
         if settings.OPENAI_API_KEY:
             try:
-                self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+                # Shared client: one connection pool for every analyzer in the process
+                self.client = get_openai_client()
                 self.openai_available = True
-                logger.info("OpenAI client initialized for growth analysis")
             except Exception as e:
-                logger.error(f"Failed to initialize OpenAI client: {e}")
+                logger.error("Failed to initialize OpenAI client: %s", e)
                 self.openai_available = False
         else:
             logger.warning("OpenAI API key not provided, using rule-based recommendations")
@@ -66,168 +702,373 @@ class GrowthAnalyzer:
         try:
             logger.info("Starting growth recommendations generation")
 
-            # Extract data components
-            website_data = data.get('website_data', {})
-            seo_data = data.get('seo_data', {})
-            social_data = data.get('social_data', {})
-            reputation_data = data.get('reputation_data', {})
-            competitor_data = data.get('competitor_data', {})
-            trust_score = data.get('trust_score', {})
+            result_cache_key = _result_cache_key(data, self.openai_available)
+            cached_recommendations = _RESPONSE_CACHE.get(result_cache_key)
+            if cached_recommendations is not None:
+                logger.info("Returning cached growth recommendations")
+                return cached_recommendations
+
+            all_recommendations = self._generate_rule_based_recommendations(data)
+
+            # Use AI to enhance recommendations if available (nothing to enhance for empty input)
+            ai_recommendations = []
+            if self.openai_available and all_recommendations:
+                ai_recommendations = self._enhance_with_ai(all_recommendations, data)
+
+            # Rule-based only if AI failed; don't cache that so the next request retries AI
+            ai_failed = ai_recommendations is None
+            if ai_failed:
+                ai_recommendations = []
+
+            # Prioritize and keep the top 12 recommendations
+            top_recommendations = self._rank_recommendations(all_recommendations, ai_recommendations)
+
+            logger.info("Generated %d growth recommendations", len(all_recommendations) + len(ai_recommendations))
+            if not ai_failed:
+                _RESPONSE_CACHE.set(result_cache_key, top_recommendations, _RESULT_CACHE_TTL)
+            return top_recommendations
+
+        except Exception as e:
+            logger.error("Error generating growth recommendations: %s", e)
+            return self._get_fallback_recommendations()
+
+    def generate_recommendations_stream(self, data: Dict) -> Iterator[Dict]:
+        """
+        Stream growth recommendations as they become available
+
+        The top rule-based recommendations are yielded immediately; AI
+        recommendations follow one by one while the OpenAI response is still
+        being generated, so a UI can render progressively.
+
+        Args:
+            data: Analysis data (see generate_recommendations)
+
+        Yields:
+            Recommendation dictionaries
+        """
+        try:
+            recommendations = self._generate_rule_based_recommendations(data)
+            top_recommendations = self._rank_recommendations(recommendations, [])
+        except Exception as e:
+            logger.error("Error generating growth recommendations: %s", e)
+            # Generic fallback advice, not worth enhancing with AI
+            yield from self._get_fallback_recommendations()
+            return
+
+        yield from top_recommendations
+
+        if not self.openai_available or not recommendations:
+            return
+
+        try:
+            request_kwargs = self._build_enhancement_request(recommendations, data)
+
+            cache_key = _enhancement_cache_key(**self._cache_params(request_kwargs))
+            cached_content = _RESPONSE_CACHE.get(cache_key)
+            if cached_content is not None:
+                for ai_rec in self._parse_ai_recommendations(cached_content):
+                    yield {**ai_rec, 'ai_enhanced': True}
+                return
+
+            parser = _JSONArrayStreamParser()
+            content_parts = []
+            stream = self.client.chat.completions.create(**request_kwargs, stream=True)
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+
+                content_parts.append(delta)
+                for ai_rec in parser.feed(delta):
+                    yield {**ai_rec, 'ai_enhanced': True}
+
+            # Cache the full response only if it parses as a whole
+            content = ''.join(content_parts)
+            orjson.loads(content)
+            _RESPONSE_CACHE.set(cache_key, content, _ENHANCEMENT_CACHE_TTL)
+
+            logger.info("Successfully streamed AI recommendations")
+
+        except Exception as e:
+            logger.error("Error streaming AI recommendations: %s", e)
+
+    async def generate_recommendations_async(self, data: Dict) -> List[Dict]:
+        """
+        Async variant of generate_recommendations
+
+        The OpenAI enhancement is awaited on an AsyncOpenAI client so the event
+        loop stays free for other work (e.g. other reports) during the round-trip.
+        Sync callers can use asgiref's async_to_sync.
+        """
+        if not self.openai_available:
+            return await self._generate_recommendations_async(data)
+
+        async with self._create_async_client() as client:
+            return await self._generate_recommendations_async(data, client)
+
+    async def generate_many(self, datasets: List[Dict], concurrency: int = 20,
+                            requests_per_minute: int = _DEFAULT_REQUESTS_PER_MINUTE,
+                            tokens_per_minute: int = _DEFAULT_TOKENS_PER_MINUTE) -> List[List[Dict]]:
+        """
+        Generate growth recommendations for many sites concurrently
+
+        Unlike generate_recommendations_bulk, each site gets its own OpenAI
+        request, so one failure does not affect the others. Up to `concurrency`
+        requests are in flight at once, paced to stay within the rate limits.
+
+        Returns:
+            List of recommendation lists, in the same order as datasets
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        rate_limiter = _RateLimiter(requests_per_minute, tokens_per_minute)
+
+        async def generate_one(data: Dict, client: openai.AsyncOpenAI = None) -> List[Dict]:
+            async with semaphore:
+                return await self._generate_recommendations_async(data, client, rate_limiter)
+
+        logger.info("Starting concurrent growth recommendations generation for %d sites", len(datasets))
+
+        if not self.openai_available:
+            return await asyncio.gather(*(generate_one(data) for data in datasets))
+
+        async with self._create_async_client() as client:
+            return await asyncio.gather(*(generate_one(data, client) for data in datasets))
+
+    async def _generate_recommendations_async(self, data: Dict, client: openai.AsyncOpenAI = None,
+                                              rate_limiter: _RateLimiter = None) -> List[Dict]:
+        """Generate recommendations for one site, enhancing with AI when a client is given"""
+        try:
+            logger.info("Starting async growth recommendations generation")
+
+            result_cache_key = _result_cache_key(data, client is not None)
+            cached_recommendations = await _RESPONSE_CACHE.aget(result_cache_key)
+            if cached_recommendations is not None:
+                logger.info("Returning cached growth recommendations")
+                return cached_recommendations
 
-            # Generate recommendations by category
-            all_recommendations = []
+            all_recommendations = self._generate_rule_based_recommendations(data)
 
-            # Technical recommendations
-            technical_recs = self._generate_technical_recommendations(website_data, seo_data)
-            all_recommendations.extend(technical_recs)
+            ai_recommendations = []
+            if client is not None and all_recommendations:
+                ai_recommendations = await self._enhance_with_ai_async(
+                    client, all_recommendations, data, rate_limiter
+                )
 
-            # Content recommendations
-            content_recs = self._generate_content_recommendations(website_data, seo_data, competitor_data)
-            all_recommendations.extend(content_recs)
+            ai_failed = ai_recommendations is None
+            if ai_failed:
+                ai_recommendations = []
 
-            # SEO recommendations
-            seo_recs = self._generate_seo_recommendations(website_data, seo_data, competitor_data)
-            all_recommendations.extend(seo_recs)
+            top_recommendations = self._rank_recommendations(all_recommendations, ai_recommendations)
 
-            # Social media recommendations
-            social_recs = self._generate_social_recommendations(social_data, website_data)
-            all_recommendations.extend(social_recs)
+            logger.info("Generated %d growth recommendations", len(all_recommendations) + len(ai_recommendations))
+            if not ai_failed:
+                await _RESPONSE_CACHE.aset(result_cache_key, top_recommendations, _RESULT_CACHE_TTL)
+            return top_recommendations
 
-            # User experience recommendations
-            ux_recs = self._generate_ux_recommendations(website_data, seo_data)
-            all_recommendations.extend(ux_recs)
+        except Exception as e:
+            logger.error("Error generating growth recommendations: %s", e)
+            return self._get_fallback_recommendations()
+
+    def generate_recommendations_bulk(self, datasets: List[Dict]) -> List[List[Dict]]:
+        """
+        Generate growth recommendations for several sites at once
+
+        AI enhancement for a group of sites is done in a single OpenAI request
+        instead of one request per site, saving a round-trip per site.
+
+        Args:
+            datasets: List of analysis data dictionaries (see generate_recommendations)
+
+        Returns:
+            List of recommendation lists, in the same order as datasets
+        """
+        try:
+            logger.info("Starting bulk growth recommendations generation for %d sites", len(datasets))
 
-            # Reputation recommendations
-            reputation_recs = self._generate_reputation_recommendations(reputation_data, trust_score)
-            all_recommendations.extend(reputation_recs)
+            recommendation_sets = [self._generate_rule_based_recommendations(data) for data in datasets]
 
             # Use AI to enhance recommendations if available
+            ai_recommendation_sets = [[] for _ in datasets]
             if self.openai_available:
-                enhanced_recommendations = self._enhance_with_ai(all_recommendations, data)
-                if enhanced_recommendations:
-                    all_recommendations = enhanced_recommendations
+                for start in range(0, len(datasets), _BULK_GROUP_SIZE):
+                    end = start + _BULK_GROUP_SIZE
+                    if any(recommendation_sets[start:end]):
+                        ai_recommendation_sets[start:end] = self._enhance_with_ai_bulk(
+                            recommendation_sets[start:end], datasets[start:end]
+                        )
 
-            # Prioritize and rank recommendations
-            prioritized_recommendations = self._prioritize_recommendations(all_recommendations)
+            results = [
+                self._rank_recommendations(recommendations, ai_recommendations)
+                for recommendations, ai_recommendations in zip(recommendation_sets, ai_recommendation_sets)
+            ]
 
-            logger.info(f"Generated {len(prioritized_recommendations)} growth recommendations")
-            return prioritized_recommendations[:12]  # Return top 12 recommendations
+            logger.info("Generated growth recommendations for %d sites", len(results))
+            return results
 
         except Exception as e:
-            logger.error(f"Error generating growth recommendations: {e}")
-            return self._get_fallback_recommendations()
+            logger.error("Error generating bulk growth recommendations: %s", e)
+            return [self._get_fallback_recommendations() for _ in datasets]
+
+    def enqueue_for_batch(self, data: Dict, job_id: str) -> List[Dict]:
+        """
+        Queue AI enhancement for a site on the OpenAI Batch API
+
+        Intended for scheduled pipelines where results can arrive within 24h.
+        The enhancement request is appended to the pending batch file; call
+        flush_batch() to submit everything queued so far.
+
+        Args:
+            data: Analysis data (see generate_recommendations)
+            job_id: Identifier used to match the batch result back (e.g. report ID)
+
+        Returns:
+            Rule-based recommendations to use until the batch result is applied
+        """
+        recommendations = self._generate_rule_based_recommendations(data)
+        if not recommendations:
+            return []
+
+        if not self.openai_available:
+            logger.warning("OpenAI not available, not queueing growth enhancement for batch job %s", job_id)
+            return self._rank_recommendations(recommendations, [])
+
+        append_batch_request(
+            _BATCH_PENDING_FILENAME, str(job_id), self._build_enhancement_request(recommendations, data)
+        )
+
+        logger.info("Queued growth enhancement for batch job %s", job_id)
+        return self._rank_recommendations(recommendations, [])
+
+    def flush_batch(self) -> Optional[str]:
+        """
+        Submit all queued enhancement requests as one OpenAI batch
+
+        Returns:
+            The OpenAI batch ID, or None if nothing was queued
+        """
+        if not self.openai_available:
+            logger.warning("OpenAI not available, cannot submit growth batch")
+            return None
+
+        batch_id = submit_batch(self.client, _BATCH_PENDING_FILENAME)
+        if batch_id:
+            logger.info("Submitted growth enhancement batch %s", batch_id)
+        return batch_id
+
+    def collect_batch_results(self, batch_id: str) -> Optional[Dict[str, List[Dict]]]:
+        """
+        Fetch AI recommendations from a finished OpenAI batch
+
+        Returns:
+            Mapping of job ID to AI recommendations, or None while the batch is still running
+        """
+        contents = retrieve_batch_contents(self.client, batch_id)
+        if contents is None:
+            return None
+
+        results = {}
+        for job_id, content in contents.items():
+            try:
+                results[job_id] = self._parse_ai_recommendations(content)
+            except Exception as e:
+                logger.error("Error parsing batch result for job %s: %s", job_id, e)
+
+        logger.info("Collected %d results from growth enhancement batch %s", len(results), batch_id)
+        return results
+
+    def apply_batch_recommendations(self, recommendations: List[Dict], ai_recommendations: List[Dict]) -> List[Dict]:
+        """Merge AI recommendations from a batch result into the rule-based ones from enqueue_for_batch"""
+        return self._rank_recommendations(recommendations, ai_recommendations)
+
+    def _generate_rule_based_recommendations(self, data: Dict) -> List[Dict]:
+        """Run all rule-based recommendation generators over the analysis data"""
+        # Extract data components
+        website_data = data.get('website_data', {})
+        seo_data = data.get('seo_data', {})
+        social_data = data.get('social_data', {})
+        reputation_data = data.get('reputation_data', {})
+        competitor_data = data.get('competitor_data', {})
+        trust_score = data.get('trust_score', {})
+
+        # Generate recommendations by category
+        return self._deduplicate_recommendations(itertools.chain(
+            self._generate_technical_recommendations(website_data, seo_data),
+            self._generate_content_recommendations(website_data, seo_data, competitor_data),
+            self._generate_seo_recommendations(website_data, seo_data, competitor_data),
+            self._generate_social_recommendations(social_data, website_data),
+            self._generate_ux_recommendations(website_data, seo_data),
+            self._generate_reputation_recommendations(reputation_data, trust_score)
+        ))
+
+    def _deduplicate_recommendations(self, recommendations: Iterable[Dict]) -> List[Dict]:
+        """Collapse recommendations on the same topic, keeping the higher priority one"""
+        unique = {}
+        for rec in recommendations:
+            key = (rec['category'], tuple(rec['title'].lower().split()[:3]))
+            key = _DUPLICATE_TOPICS.get(key, key)
+
+            existing = unique.get(key)
+            if existing is None or (_PRIORITY_WEIGHTS.get(rec['priority'], 1)
+                                    > _PRIORITY_WEIGHTS.get(existing['priority'], 1)):
+                unique[key] = rec
+
+        return list(unique.values())
+
+    def _create_async_client(self) -> openai.AsyncOpenAI:
+        """Create an AsyncOpenAI client for the current event loop"""
+        return create_async_openai_client()
 
     def _generate_technical_recommendations(self, website_data: Dict, seo_data: Dict) -> List[Dict]:
         """Generate technical improvement recommendations"""
+        # Nothing to assess if the website crawl failed
+        if not website_data or 'error' in website_data:
+            return []
+
         recommendations = []
 
         # SSL Certificate
         if not website_data.get('has_ssl'):
-            recommendations.append({
-                'category': 'technical',
-                'title': 'Install SSL Certificate',
-                'description': 'Secure your website with HTTPS encryption to protect user data and improve search rankings.',
-                'priority': 'high',
-                'estimated_impact': 'High - Improves SEO rankings and user trust',
-                'effort_required': 'Low - Technical setup, 1-2 hours',
-                'timeline': '1-2 days',
-                'cost_estimate': 'Free - $100/year',
-                'implementation_steps': [
-                    'Purchase SSL certificate from hosting provider',
-                    'Install and configure SSL certificate',
-                    'Update internal links to HTTPS',
-                    'Set up 301 redirects from HTTP to HTTPS'
-                ]
-            })
+            recommendations.append(dict(_SSL_REC))
 
         # Page Speed Optimization
         page_speed = seo_data.get('page_speed', {})
         performance_score = page_speed.get('performance_score', 0)
         if performance_score < 70:
             recommendations.append({
-                'category': 'technical',
-                'title': 'Optimize Page Loading Speed',
+                **_PAGE_SPEED_REC_TEMPLATE,
                 'description': f'Current performance score is {performance_score}/100. Improve website speed for better user experience and SEO.',
-                'priority': 'high' if performance_score < 50 else 'medium',
-                'estimated_impact': 'High - Better user experience, reduced bounce rate, improved SEO',
-                'effort_required': 'Medium - Development work required',
-                'timeline': '1-2 weeks',
-                'cost_estimate': '$500 - $2,000',
-                'implementation_steps': [
-                    'Optimize and compress images',
-                    'Minify CSS, JavaScript, and HTML',
-                    'Enable browser caching',
-                    'Use Content Delivery Network (CDN)',
-                    'Optimize server response time'
-                ]
+                'priority': 'high' if performance_score < 50 else 'medium'
             })
 
         # Mobile Optimization
         mobile_friendly = seo_data.get('mobile_friendly', {})
         if not mobile_friendly.get('mobile_friendly'):
-            recommendations.append({
-                'category': 'technical',
-                'title': 'Implement Mobile-Responsive Design',
-                'description': 'Ensure your website works perfectly on all mobile devices and screen sizes.',
-                'priority': 'high',
-                'estimated_impact': 'Very High - 60%+ of traffic is mobile',
-                'effort_required': 'High - Design and development work',
-                'timeline': '2-4 weeks',
-                'cost_estimate': '$2,000 - $10,000',
-                'implementation_steps': [
-                    'Audit current mobile experience',
-                    'Design responsive layouts',
-                    'Implement responsive CSS framework',
-                    'Test across multiple devices',
-                    'Optimize mobile page speed'
-                ]
-            })
+            recommendations.append(dict(_MOBILE_REC))
 
         # Robots.txt and Sitemap
         if not seo_data.get('robots_txt'):
-            recommendations.append({
-                'category': 'technical',
-                'title': 'Create Robots.txt File',
-                'description': 'Add robots.txt to guide search engine crawlers and improve SEO.',
-                'priority': 'low',
-                'estimated_impact': 'Medium - Better search engine crawling',
-                'effort_required': 'Low - Simple file creation',
-                'timeline': '1 day',
-                'cost_estimate': 'Free',
-                'implementation_steps': [
-                    'Create robots.txt file',
-                    'Add crawling directives',
-                    'Include sitemap reference',
-                    'Upload to website root directory'
-                ]
-            })
+            recommendations.append(dict(_ROBOTS_TXT_REC))
 
         return recommendations
 
     def _generate_content_recommendations(self, website_data: Dict, seo_data: Dict, competitor_data: Dict) -> List[
         Dict]:
         """Generate content strategy recommendations"""
+        # Nothing to assess if the website crawl failed
+        if not website_data or 'error' in website_data:
+            return []
+
         recommendations = []
 
         # Content Volume
         word_count = website_data.get('word_count', 0)
         if word_count < 500:
             recommendations.append({
-                'category': 'content',
-                'title': 'Expand Content Volume',
+                **_CONTENT_VOLUME_REC_TEMPLATE,
                 'description': f'Current content is {word_count} words. Add more valuable, informative content to improve SEO and user engagement.',
-                'priority': 'high' if word_count < 200 else 'medium',
-                'estimated_impact': 'High - Better search rankings and user engagement',
-                'effort_required': 'Medium - Content creation required',
-                'timeline': '2-4 weeks',
-                'cost_estimate': '$1,000 - $5,000',
-                'implementation_steps': [
-                    'Conduct keyword research',
-                    'Create content calendar',
-                    'Write comprehensive page content',
-                    'Add blog or resources section',
-                    'Optimize content for target keywords'
-                ]
+                'priority': 'high' if word_count < 200 else 'medium'
             })
 
         # Image Alt Text
@@ -235,150 +1076,65 @@ class GrowthAnalyzer:
         images_without_alt = images.get('without_alt_text', 0)
         if images_without_alt > 0:
             recommendations.append({
-                'category': 'content',
-                'title': f'Add Alt Text to {images_without_alt} Images',
-                'description': 'Improve accessibility and SEO by adding descriptive alt text to all images.',
-                'priority': 'medium',
-                'estimated_impact': 'Medium - Improved accessibility and SEO',
-                'effort_required': 'Low - Content editing',
-                'timeline': '1-2 days',
-                'cost_estimate': '$200 - $500',
-                'implementation_steps': [
-                    'Audit all images on website',
-                    'Write descriptive alt text for each image',
-                    'Update image tags with alt attributes',
-                    'Implement alt text best practices for future images'
-                ]
+                **_ALT_TEXT_REC_TEMPLATE,
+                'title': f'Add Alt Text to {images_without_alt} Images'
             })
 
         # Blog/Content Marketing
-        headings = website_data.get('heading_structure', {})
-        if len(headings.get('h2', [])) < 3:
-            recommendations.append({
-                'category': 'content',
-                'title': 'Develop Content Marketing Strategy',
-                'description': 'Create a blog or resources section to attract organic traffic and establish expertise.',
-                'priority': 'medium',
-                'estimated_impact': 'High - Long-term organic traffic growth',
-                'effort_required': 'High - Ongoing content creation',
-                'timeline': '4-8 weeks to establish',
-                'cost_estimate': '$2,000 - $10,000',
-                'implementation_steps': [
-                    'Research target audience and topics',
-                    'Create editorial calendar',
-                    'Set up blog/resources section',
-                    'Write initial content pieces',
-                    'Promote content on social media'
-                ]
-            })
+        heading_counts = website_data.get('heading_counts')
+        if heading_counts is not None:
+            h2_count = heading_counts.get('h2', 0)
+        else:
+            h2_count = len(website_data.get('heading_structure', {}).get('h2', []))  # Older crawls
+        if h2_count < 3:
+            recommendations.append(dict(_CONTENT_MARKETING_REC))
 
         # Video Content
-        if 'video' not in str(website_data).lower():
-            recommendations.append({
-                'category': 'content',
-                'title': 'Add Video Content',
-                'description': 'Incorporate video content to improve engagement and time on site.',
-                'priority': 'low',
-                'estimated_impact': 'Medium - Higher engagement and conversions',
-                'effort_required': 'Medium - Video production',
-                'timeline': '2-3 weeks',
-                'cost_estimate': '$1,000 - $5,000',
-                'implementation_steps': [
-                    'Plan video content strategy',
-                    'Create product demos or explainer videos',
-                    'Set up video hosting and embedding',
-                    'Optimize videos for SEO',
-                    'Add video transcripts for accessibility'
-                ]
-            })
+        if not self._has_video_content(website_data):
+            recommendations.append(dict(_VIDEO_CONTENT_REC))
 
         return recommendations
 
+    def _has_video_content(self, website_data: Dict) -> bool:
+        """Check for video content using the crawler flag or the page's text fields"""
+        if 'has_video' in website_data:
+            return website_data['has_video']
+
+        text_fields = [
+            website_data.get('title') or '',
+            website_data.get('description') or '',
+            website_data.get('keywords') or ''
+        ]
+        for heading_texts in website_data.get('heading_structure', {}).values():
+            text_fields.extend(heading_texts)
+
+        return bool(_VIDEO_PATTERN.search(' '.join(text_fields)))
+
     def _generate_seo_recommendations(self, website_data: Dict, seo_data: Dict, competitor_data: Dict) -> List[Dict]:
         """Generate SEO improvement recommendations"""
+        # Nothing to assess if the website crawl failed
+        if not website_data or 'error' in website_data:
+            return []
+
         recommendations = []
 
         # Meta Description
         if not website_data.get('description'):
-            recommendations.append({
-                'category': 'seo',
-                'title': 'Add Meta Description',
-                'description': 'Write compelling meta descriptions to improve click-through rates from search results.',
-                'priority': 'medium',
-                'estimated_impact': 'Medium - Higher CTR from search results',
-                'effort_required': 'Low - Content writing',
-                'timeline': '1-2 days',
-                'cost_estimate': '$100 - $500',
-                'implementation_steps': [
-                    'Research target keywords for each page',
-                    'Write unique meta descriptions (150-160 characters)',
-                    'Include primary keywords naturally',
-                    'Add compelling calls-to-action',
-                    'Test and optimize based on performance'
-                ]
-            })
+            recommendations.append(dict(_META_DESCRIPTION_REC))
 
         # Title Tag Optimization
         title = website_data.get('title', '')
         if not title or len(title) < 30 or len(title) > 60:
-            recommendations.append({
-                'category': 'seo',
-                'title': 'Optimize Title Tags',
-                'description': 'Improve title tags for better search engine rankings and click-through rates.',
-                'priority': 'high',
-                'estimated_impact': 'High - Direct impact on search rankings',
-                'effort_required': 'Low - Content optimization',
-                'timeline': '1-2 days',
-                'cost_estimate': '$200 - $500',
-                'implementation_steps': [
-                    'Research primary keywords for each page',
-                    'Write compelling titles (50-60 characters)',
-                    'Include target keywords at the beginning',
-                    'Make titles unique for each page',
-                    'A/B test title variations'
-                ]
-            })
+            recommendations.append(dict(_TITLE_TAGS_REC))
 
         # Structured Data
         if not website_data.get('structured_data'):
-            recommendations.append({
-                'category': 'seo',
-                'title': 'Implement Structured Data Markup',
-                'description': 'Add schema markup to help search engines understand your content better and enhance search results.',
-                'priority': 'medium',
-                'estimated_impact': 'Medium - Enhanced search result appearance',
-                'effort_required': 'Medium - Technical implementation',
-                'timeline': '1 week',
-                'cost_estimate': '$500 - $1,500',
-                'implementation_steps': [
-                    'Identify relevant schema types for your business',
-                    'Implement JSON-LD structured data',
-                    'Add organization and local business markup',
-                    'Include product/service markup if applicable',
-                    'Test with Google\'s Rich Results Tool'
-                ]
-            })
+            recommendations.append(dict(_STRUCTURED_DATA_REC))
 
         # Local SEO (if applicable)
         contact_info = website_data.get('contact_info', {})
         if contact_info.get('has_address'):
-            recommendations.append({
-                'category': 'seo',
-                'title': 'Optimize for Local SEO',
-                'description': 'Improve local search visibility with Google My Business and local citations.',
-                'priority': 'high',
-                'estimated_impact': 'High - Local customer acquisition',
-                'effort_required': 'Medium - Local optimization work',
-                'timeline': '2-3 weeks',
-                'cost_estimate': '$500 - $2,000',
-                'implementation_steps': [
-                    'Claim and optimize Google My Business listing',
-                    'Ensure NAP consistency across directories',
-                    'Build local citations and directories',
-                    'Collect and manage customer reviews',
-                    'Create location-specific content'
-                ]
-            })
+            recommendations.append(dict(_LOCAL_SEO_REC))
 
         return recommendations
 
@@ -387,142 +1143,57 @@ class GrowthAnalyzer:
         recommendations = []
 
         if not social_data or 'error' in social_data:
-            recommendations.append({
-                'category': 'social_media',
-                'title': 'Establish Social Media Presence',
-                'description': 'Create business profiles on major social media platforms to increase brand awareness.',
-                'priority': 'medium',
-                'estimated_impact': 'Medium - Brand awareness and traffic',
-                'effort_required': 'Medium - Ongoing content management',
-                'timeline': '2-3 weeks to establish',
-                'cost_estimate': '$1,000 - $3,000',
-                'implementation_steps': [
-                    'Create business profiles on Facebook, Instagram, LinkedIn',
-                    'Optimize profiles with complete business information',
-                    'Develop content strategy and posting schedule',
-                    'Create initial content and start posting regularly',
-                    'Engage with followers and build community'
-                ]
-            })
+            recommendations.append(dict(_SOCIAL_PRESENCE_REC))
             return recommendations
 
         # Check platform presence
         platform_data = social_data.get('platform_data', {})
-        missing_platforms = []
-
-        for platform in ['facebook', 'instagram', 'linkedin']:
-            data = platform_data.get(platform, {})
-            if not (data.get('account_found') or data.get('page_found') or data.get('channel_found')):
-                missing_platforms.append(platform.title())
+        missing_platforms = [
+            label for platform, label in _SOCIAL_PLATFORMS
+            if not any(platform_data.get(platform, {}).get(key) for key in _PLATFORM_FOUND_KEYS)
+        ]
 
         if missing_platforms:
+            platforms = ", ".join(missing_platforms[:2])
             recommendations.append({
-                'category': 'social_media',
-                'title': f'Expand to {", ".join(missing_platforms[:2])}',
-                'description': f'Create business presence on {", ".join(missing_platforms[:2])} to reach wider audiences.',
-                'priority': 'medium',
-                'estimated_impact': 'Medium - Increased brand awareness and reach',
-                'effort_required': 'Medium - Profile setup and content creation',
-                'timeline': '2-4 weeks',
-                'cost_estimate': '$500 - $2,000',
-                'implementation_steps': [
-                    f'Create optimized business profiles on {", ".join(missing_platforms[:2])}',
-                    'Develop platform-specific content strategy',
-                    'Create initial content and posting schedule',
-                    'Cross-promote existing social accounts',
-                    'Monitor engagement and adjust strategy'
-                ]
+                **_SOCIAL_EXPANSION_REC_TEMPLATE,
+                'title': f'Expand to {platforms}',
+                'description': f'Create business presence on {platforms} to reach wider audiences.',
+                'implementation_steps': (f'Create optimized business profiles on {platforms}',) + _SOCIAL_EXPANSION_STEPS
             })
 
         # Engagement improvement
         summary = social_data.get('summary', {})
         if summary.get('social_presence_score', 0) < 50:
-            recommendations.append({
-                'category': 'social_media',
-                'title': 'Improve Social Media Engagement',
-                'description': 'Enhance content quality and posting consistency to boost follower engagement.',
-                'priority': 'medium',
-                'estimated_impact': 'Medium - Higher engagement and reach',
-                'effort_required': 'Medium - Content strategy development',
-                'timeline': '4-6 weeks',
-                'cost_estimate': '$1,000 - $5,000',
-                'implementation_steps': [
-                    'Analyze current content performance',
-                    'Develop engaging content themes and formats',
-                    'Create consistent posting schedule',
-                    'Use interactive content (polls, Q&A, live videos)',
-                    'Respond promptly to comments and messages'
-                ]
-            })
+            recommendations.append(dict(_SOCIAL_ENGAGEMENT_REC))
 
         return recommendations
 
     def _generate_ux_recommendations(self, website_data: Dict, seo_data: Dict) -> List[Dict]:
         """Generate user experience recommendations"""
+        # Nothing to assess if the website crawl failed
+        if not website_data or 'error' in website_data:
+            return []
+
         recommendations = []
 
         # Navigation and Internal Linking
         links = website_data.get('links', {})
         internal_links = links.get('internal_links', 0)
         if internal_links < 5:
-            recommendations.append({
-                'category': 'user_experience',
-                'title': 'Improve Site Navigation and Internal Linking',
-                'description': 'Add more internal links and improve navigation to help users find content easily.',
-                'priority': 'medium',
-                'estimated_impact': 'Medium - Better user experience and SEO',
-                'effort_required': 'Medium - Design and content work',
-                'timeline': '1-2 weeks',
-                'cost_estimate': '$500 - $2,000',
-                'implementation_steps': [
-                    'Audit current site structure and navigation',
-                    'Design intuitive navigation menu',
-                    'Add relevant internal links within content',
-                    'Create breadcrumb navigation',
-                    'Add related content suggestions'
-                ]
-            })
+            recommendations.append(dict(_NAVIGATION_REC))
 
         # Contact Information Accessibility
         contact_info = website_data.get('contact_info', {})
         if not contact_info.get('has_phone') or not contact_info.get('has_email'):
-            recommendations.append({
-                'category': 'user_experience',
-                'title': 'Improve Contact Information Accessibility',
-                'description': 'Make it easier for customers to reach you by prominently displaying contact information.',
-                'priority': 'high',
-                'estimated_impact': 'High - Better customer communication and trust',
-                'effort_required': 'Low - Content addition',
-                'timeline': '1 day',
-                'cost_estimate': '$100 - $300',
-                'implementation_steps': [
-                    'Add clear contact information to header/footer',
-                    'Create dedicated contact page',
-                    'Include multiple contact methods (phone, email, form)',
-                    'Add business hours and location if applicable',
-                    'Test contact forms for functionality'
-                ]
-            })
+            recommendations.append(dict(_CONTACT_ACCESSIBILITY_REC))
 
         # Loading Speed (User Experience aspect)
         response_time = website_data.get('response_time', 5.0)
         if response_time > 3.0:
             recommendations.append({
-                'category': 'user_experience',
-                'title': 'Optimize Website Loading Speed',
-                'description': f'Current loading time is {response_time:.1f} seconds. Improve speed for better user experience.',
-                'priority': 'high',
-                'estimated_impact': 'High - Reduced bounce rate, better conversions',
-                'effort_required': 'Medium - Technical optimization',
-                'timeline': '1-2 weeks',
-                'cost_estimate': '$500 - $2,000',
-                'implementation_steps': [
-                    'Optimize image sizes and formats',
-                    'Minimize HTTP requests',
-                    'Enable compression and caching',
-                    'Optimize database queries',
-                    'Use performance monitoring tools'
-                ]
+                **_LOADING_SPEED_REC_TEMPLATE,
+                'description': f'Current loading time is {response_time:.1f} seconds. Improve speed for better user experience.'
             })
 
         return recommendations
@@ -532,23 +1203,7 @@ class GrowthAnalyzer:
         recommendations = []
 
         if not reputation_data or 'error' in reputation_data:
-            recommendations.append({
-                'category': 'reputation',
-                'title': 'Implement Online Reputation Management',
-                'description': 'Establish presence on review platforms and actively manage your online reputation.',
-                'priority': 'medium',
-                'estimated_impact': 'High - Customer trust and credibility',
-                'effort_required': 'Medium - Ongoing management',
-                'timeline': '2-4 weeks to establish',
-                'cost_estimate': '$500 - $2,000',
-                'implementation_steps': [
-                    'Create Google My Business listing',
-                    'Set up monitoring for online mentions',
-                    'Develop review generation strategy',
-                    'Create response templates for reviews',
-                    'Implement customer feedback system'
-                ]
-            })
+            recommendations.append(dict(_REPUTATION_MANAGEMENT_REC))
             return recommendations
 
         # Review Generation
@@ -556,167 +1211,253 @@ class GrowthAnalyzer:
         total_reviews = summary.get('total_reviews', 0)
         if total_reviews < 10:
             recommendations.append({
-                'category': 'reputation',
-                'title': 'Implement Review Generation Strategy',
-                'description': f'Currently have {total_reviews} reviews. Develop systematic approach to collect customer reviews.',
-                'priority': 'high',
-                'estimated_impact': 'High - Increased customer trust and conversions',
-                'effort_required': 'Medium - Process development and implementation',
-                'timeline': '3-4 weeks',
-                'cost_estimate': '$1,000 - $3,000',
-                'implementation_steps': [
-                    'Create customer review request process',
-                    'Send follow-up emails after purchases/services',
-                    'Add review request prompts on website',
-                    'Train staff to request reviews in person',
-                    'Monitor and respond to all reviews promptly'
-                ]
+                **_REVIEW_GENERATION_REC_TEMPLATE,
+                'description': f'Currently have {total_reviews} reviews. Develop systematic approach to collect customer reviews.'
             })
 
         # Rating Improvement
         overall_rating = summary.get('overall_rating', 0)
         if overall_rating < 4.0:
             recommendations.append({
-                'category': 'reputation',
-                'title': 'Improve Customer Satisfaction and Ratings',
-                'description': f'Current average rating is {overall_rating}/5. Focus on service improvements to increase ratings.',
-                'priority': 'high',
-                'estimated_impact': 'Very High - Better reputation drives more customers',
-                'effort_required': 'High - Operational improvements required',
-                'timeline': '2-3 months',
-                'cost_estimate': '$2,000 - $10,000',
-                'implementation_steps': [
-                    'Analyze negative feedback for common issues',
-                    'Implement customer service improvements',
-                    'Train staff on customer satisfaction best practices',
-                    'Create customer feedback loop and resolution process',
-                    'Monitor ratings improvement over time'
-                ]
+                **_RATING_IMPROVEMENT_REC_TEMPLATE,
+                'description': f'Current average rating is {overall_rating}/5. Focus on service improvements to increase ratings.'
             })
 
         return recommendations
 
-    def _enhance_with_ai(self, recommendations: List[Dict], data: Dict) -> List[Dict]:
-        """Use AI to enhance and personalize recommendations"""
+    def _enhance_with_ai(self, recommendations: List[Dict], data: Dict) -> Optional[List[Dict]]:
+        """Use AI to suggest additional personalized recommendations (None if the request failed)"""
+        try:
+            request_kwargs = self._build_enhancement_request(recommendations, data)
+
+            # Serve repeat requests from cache to skip the OpenAI round-trip
+            cache_key = _enhancement_cache_key(**self._cache_params(request_kwargs))
+            ai_recommendations = _AI_RECOMMENDATION_CACHE.get(cache_key)
+            if ai_recommendations is not None:
+                return ai_recommendations
+
+            content = _RESPONSE_CACHE.get(cache_key)
+            cache_hit = content is not None
+
+            if not cache_hit:
+                response = self.client.chat.completions.create(**request_kwargs)
+                content = response.choices[0].message.content
+
+            ai_recommendations = self._parse_ai_recommendations(content)
+            _AI_RECOMMENDATION_CACHE.set(cache_key, ai_recommendations)
+
+            # Only cache responses that parsed successfully
+            if not cache_hit:
+                _RESPONSE_CACHE.set(cache_key, content, _ENHANCEMENT_CACHE_TTL)
+
+            logger.info("Successfully enhanced recommendations with AI")
+            return ai_recommendations
+
+        except Exception as e:
+            logger.error("Error enhancing recommendations with AI: %s", e)
+            return None  # Caller keeps only the rule-based recommendations
+
+    def _enhance_with_ai_bulk(self, recommendation_sets: List[List[Dict]], datasets: List[Dict]) -> List[List[Dict]]:
+        """Get AI recommendations for several sites with one AI request, in the same order"""
         try:
-            # Prepare context for AI
-            website_data = data.get('website_data', {})
-            trust_score = data.get('trust_score', {})
-
-            company_name = website_data.get('company_name', 'this business')
-            domain = website_data.get('domain', 'the website')
-            overall_trust = trust_score.get('overall', 5.0)
-
-            # Create prompt for AI enhancement
-            prompt = f"""
-            As a digital marketing expert, review and enhance these growth recommendations for {company_name} (domain: {domain}).
-            Current trust score: {overall_trust}/10
-
-            Existing recommendations:
-            {json.dumps([{
-                'title': rec['title'],
-                'category': rec['category'],
-                'priority': rec['priority']
-            } for rec in recommendations[:8]], indent=2)}
-
-            Please:
-            1. Suggest 2-3 additional high-impact recommendations not in the list
-            2. Ensure recommendations are specific to this business
-            3. Focus on quick wins and high ROI activities
-            4. Consider the current trust score level
-
-            Format as JSON array with same structure: title, description, category, priority, estimated_impact, effort_required, timeline.
-            """
+            businesses = []
+            for index, (recommendations, data) in enumerate(zip(recommendation_sets, datasets)):
+                website_data = data.get('website_data', {})
+                trust_score = data.get('trust_score', {})
+                existing = self._format_existing_recommendations(recommendations)
+                businesses.append(
+                    f"{index}. {website_data.get('company_name', 'this business')} "
+                    f"(domain: {website_data.get('domain', 'the website')}), "
+                    f"trust score: {trust_score.get('overall', 5.0)}/10, "
+                    f"existing recommendations:\n{existing}"
+                )
+
+            business_list = "\n".join(businesses)
 
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1000,
-                temperature=0.7
+                model=_ENHANCEMENT_MODEL,
+                messages=[
+                    {"role": "system", "content": _BULK_ENHANCEMENT_SYSTEM_PROMPT},
+                    {"role": "user", "content": business_list}
+                ],
+                max_tokens=_ENHANCEMENT_MAX_TOKENS * len(businesses),
+                temperature=_ENHANCEMENT_TEMPERATURE,
+                seed=_ENHANCEMENT_SEED,
+                response_format=_ENHANCEMENT_RESPONSE_FORMAT
             )
 
-            ai_recommendations = json.loads(response.choices[0].message.content)
+            ai_by_business = orjson.loads(response.choices[0].message.content)
+
+            logger.info("Successfully enhanced recommendations for %d sites with AI", len(businesses))
+
+            # Dispatch AI recommendations back to each site
+            return [
+                self._bulk_site_recommendations(ai_by_business.get(str(index)))
+                for index in range(len(recommendation_sets))
+            ]
 
-            # Add AI recommendations to existing ones
-            for ai_rec in ai_recommendations:
-                ai_rec['ai_enhanced'] = True
-                recommendations.append(ai_rec)
+        except Exception as e:
+            # Sites keep their rule-based recommendations if AI fails
+            logger.error("Error enhancing bulk recommendations with AI: %s", e)
+            return [[] for _ in recommendation_sets]
+
+    def _bulk_site_recommendations(self, value) -> List[Dict]:
+        """Keep the recommendation dicts from one site's entry in a bulk AI response"""
+        # Anything but an array of objects (e.g. a {"recommendations": [...]} wrapper) is dropped
+        if not isinstance(value, list):
+            return []
+        return [rec for rec in value if isinstance(rec, dict)]
+
+    async def _enhance_with_ai_async(self, client: openai.AsyncOpenAI, recommendations: List[Dict],
+                                     data: Dict, rate_limiter: _RateLimiter = None) -> Optional[List[Dict]]:
+        """Async variant of _enhance_with_ai using an AsyncOpenAI client (None if the request failed)"""
+        try:
+            request_kwargs = self._build_enhancement_request(recommendations, data)
+
+            cache_key = _enhancement_cache_key(**self._cache_params(request_kwargs))
+            ai_recommendations = _AI_RECOMMENDATION_CACHE.get(cache_key)
+            if ai_recommendations is not None:
+                return ai_recommendations
+
+            content = await _RESPONSE_CACHE.aget(cache_key)
+            cache_hit = content is not None
+
+            if not cache_hit:
+                if rate_limiter is not None:
+                    # Rough token estimate: ~4 characters per prompt token plus the completion budget
+                    prompt_tokens = sum(len(message['content']) for message in request_kwargs['messages']) // 4
+                    await rate_limiter.acquire(prompt_tokens + request_kwargs['max_tokens'])
+                response = await client.chat.completions.create(**request_kwargs)
+                content = response.choices[0].message.content
+
+            ai_recommendations = self._parse_ai_recommendations(content)
+            _AI_RECOMMENDATION_CACHE.set(cache_key, ai_recommendations)
+
+            if not cache_hit:
+                await _RESPONSE_CACHE.aset(cache_key, content, _ENHANCEMENT_CACHE_TTL)
 
             logger.info("Successfully enhanced recommendations with AI")
-            return recommendations
+            return ai_recommendations
 
         except Exception as e:
-            logger.error(f"Error enhancing recommendations with AI: {e}")
-            return recommendations  # Return original recommendations if AI fails
-
-    def _prioritize_recommendations(self, recommendations: List[Dict]) -> List[Dict]:
-        """Prioritize and rank recommendations by impact and urgency"""
-
-        # Define priority weights
-        priority_weights = {'high': 3, 'medium': 2, 'low': 1}
-
-        # Define category importance weights
-        category_weights = {
-            'technical': 1.0,
-            'seo': 0.9,
-            'user_experience': 0.8,
-            'content': 0.7,
-            'reputation': 0.6,
-            'social_media': 0.5
+            logger.error("Error enhancing recommendations with AI: %s", e)
+            return None
+
+    def _build_enhancement_request(self, recommendations: List[Dict], data: Dict) -> Dict:
+        """Build the chat completion arguments for AI enhancement"""
+        # Prepare context for AI
+        website_data = data.get('website_data', {})
+        trust_score = data.get('trust_score', {})
+
+        company_name = website_data.get('company_name', 'this business')
+        domain = website_data.get('domain', 'the website')
+        overall_trust = trust_score.get('overall', 5.0)
+
+        existing = self._format_existing_recommendations(recommendations)
+
+        # Only the per-site details vary between requests
+        prompt = (
+            f"Business: {company_name} (domain: {domain})\n"
+            f"Current trust score: {overall_trust}/10\n\n"
+            f"Existing recommendations:\n{existing}"
+        )
+
+        return {
+            'model': _ENHANCEMENT_MODEL,
+            'messages': [
+                {"role": "system", "content": _ENHANCEMENT_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'max_tokens': _ENHANCEMENT_MAX_TOKENS,
+            'temperature': _ENHANCEMENT_TEMPERATURE,
+            'seed': _ENHANCEMENT_SEED,
+            'response_format': _ENHANCEMENT_RESPONSE_FORMAT
         }
 
-        # Calculate composite score for each recommendation
-        for rec in recommendations:
-            priority_score = priority_weights.get(rec.get('priority', 'low'), 1)
-            category_score = category_weights.get(rec.get('category', 'other'), 0.5)
+    def _format_existing_recommendations(self, recommendations: List[Dict]) -> str:
+        """Summarize the top recommendations for a prompt as "- title (category, priority)" lines"""
+        return "\n".join(
+            f"- {rec['title']} ({rec['category']}, {rec['priority']})" for rec in recommendations[:8]
+        )
+
+    def _cache_params(self, request_kwargs: Dict) -> Dict:
+        """Extract the fields of an enhancement request that determine its response"""
+        return {
+            'model': request_kwargs['model'],
+            'prompt': "\n".join(message['content'] for message in request_kwargs['messages']),
+            'max_tokens': request_kwargs['max_tokens'],
+            'temperature': request_kwargs['temperature']
+        }
 
-            # Add effort bonus (lower effort = higher score)
-            effort = rec.get('effort_required', 'medium').lower()
-            effort_bonus = 0.3 if 'low' in effort else 0.1 if 'medium' in effort else 0
+    def _parse_ai_recommendations(self, content: str) -> List[Dict]:
+        """Parse the AI recommendations from an enhancement response"""
+        return orjson.loads(content).get('recommendations', [])
 
-            composite_score = (priority_score * category_score) + effort_bonus
-            rec['composite_score'] = round(composite_score, 2)
+    def _rank_recommendations(self, recommendations: List[Dict], ai_recommendations: List[Dict],
+                              top_k: int = 12) -> List[Dict]:
+        """
+        Rank rule-based and AI recommendations together and build the output
+
+        AI recommendations are kept in their own list until this point; the
+        ai_enhanced flag is set on the output records only.
+        """
+        ai_ids = {id(rec) for rec in ai_recommendations}
+        ranked = self._prioritize_recommendations(recommendations + ai_recommendations, top_k=top_k)
+        return [{**rec, 'ai_enhanced': id(rec) in ai_ids} for rec in ranked]
+
+    def _prioritize_recommendations(self, recommendations: List[Dict], top_k: Optional[int] = None) -> List[Dict]:
+        """
+        Prioritize and rank recommendations by impact and urgency
+
+        Args:
+            recommendations: Recommendations to score and rank
+            top_k: If given, return only the top_k highest ranked (selected
+                without sorting the full list)
+        """
+        self._score_recommendations(recommendations)
+
+        # Typical per-site lists are small: sort plain (score, index) tuples
+        # without a key function; the index keeps ties in their original order
+        if len(recommendations) <= _SMALL_SORT_SIZE:
+            ranked = [(-rec['composite_score'], index, rec) for index, rec in enumerate(recommendations)]
+            ranked.sort()
+            return [rec for _, _, rec in ranked[:top_k]]
+
+        if top_k is not None and top_k < len(recommendations):
+            return heapq.nlargest(top_k, recommendations, key=operator.itemgetter('composite_score'))
 
         # Sort by composite score (highest first)
         sorted_recommendations = sorted(
             recommendations,
-            key=lambda x: x.get('composite_score', 0),
+            key=operator.itemgetter('composite_score'),
             reverse=True
         )
 
         return sorted_recommendations
 
+    def _score_recommendations(self, recommendations: List[Dict]) -> None:
+        """Set a composite score on each recommendation from its priority, category and effort"""
+        priority_weights = _PRIORITY_WEIGHTS
+        category_weights = _CATEGORY_WEIGHTS
+
+        # Calculate composite score for each recommendation
+        for rec in recommendations:
+            priority_score = priority_weights.get(rec.get('priority', 'low'), 1)
+            category_score = category_weights.get(rec.get('category', 'other'), _DEFAULT_CATEGORY_WEIGHT)
+            effort_bonus = self._effort_bonus(rec)
+
+            composite_score = (priority_score * category_score) + effort_bonus
+            rec['composite_score'] = composite_score / 10
+
+    def _effort_bonus(self, recommendation: Dict) -> int:
+        """Scoring bonus in tenths for low-effort recommendations (lower effort = higher score)"""
+        effort = recommendation.get('effort_required', 'medium').lower()
+        effort_bonus = _EFFORT_BONUS.get(effort.split(' ', 1)[0])
+        if effort_bonus is None:
+            # Free-form effort text (e.g. from AI) without a leading level
+            effort_bonus = 3 if 'low' in effort else 1 if 'medium' in effort else 0
+        return effort_bonus
+
     def _get_fallback_recommendations(self) -> List[Dict]:
         """Fallback recommendations when analysis fails"""
-        return [
-            {
-                'category': 'technical',
-                'title': 'Improve Website Security',
-                'description': 'Ensure your website has SSL certificate and basic security measures.',
-                'priority': 'high',
-                'estimated_impact': 'High - User trust and SEO',
-                'effort_required': 'Low',
-                'timeline': '1-2 days',
-                'cost_estimate': 'Free - $100'
-            },
-            {
-                'category': 'seo',
-                'title': 'Optimize Page Titles and Descriptions',
-                'description': 'Review and improve title tags and meta descriptions for better search visibility.',
-                'priority': 'high',
-                'estimated_impact': 'High - Search rankings',
-                'effort_required': 'Low',
-                'timeline': '1 week',
-                'cost_estimate': '$200 - $500'
-            },
-            {
-                'category': 'content',
-                'title': 'Create Quality Content',
-                'description': 'Develop valuable content that addresses your audience\'s needs and questions.',
-                'priority': 'medium',
-                'estimated_impact': 'High - Long-term growth',
-                'effort_required': 'Medium',
-                'timeline': '2-4 weeks',
-                'cost_estimate': '$1,000 - $5,000'
-            }
-        ]
\ No newline at end of file
+        return [dict(rec) for rec in _FALLBACK_RECOMMENDATIONS]
\ No newline at end of file
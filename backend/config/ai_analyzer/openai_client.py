@@ -0,0 +1,207 @@
+# ai_analyzer/openai_client.py
+import httpx
+import openai
+import orjson
+from django.conf import settings
+from contextlib import contextmanager
+from pathlib import Path
+import fcntl
+import os
+import threading
+import logging
+import uuid
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits for OpenAI requests; keep-alive connections let
+# requests reuse TLS sessions to api.openai.com instead of re-handshaking
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+# Fail fast on connect, but give streamed completions time between chunks
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# OpenAI Batch API: pending requests are appended to a JSONL file per analyzer
+# and submitted together at half the real-time token price (24h turnaround).
+# The pending files live on local disk in OPENAI_BATCH_DIR, so jobs must be
+# queued on the host that runs the submit tasks.
+BATCH_ENDPOINT = '/v1/chat/completions'
+_BATCH_COMPLETION_WINDOW = '24h'
+_BATCH_FAILED_STATUSES = ('failed', 'expired', 'cancelled')
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_openai_client() -> openai.OpenAI:
+    """
+    Return the process-wide OpenAI client, creating it on first use
+
+    The client is thread-safe and shared by all analyzers in the process, so
+    its connection pool is reused across requests and Celery tasks.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = openai.OpenAI(
+                    api_key=settings.OPENAI_API_KEY,
+                    timeout=_HTTP_TIMEOUT,
+                    http_client=openai.DefaultHttpxClient(limits=_HTTP_LIMITS)
+                )
+                logger.info("Shared OpenAI client initialized")
+
+    return _client
+
+
+def create_async_openai_client() -> openai.AsyncOpenAI:
+    """
+    Create an AsyncOpenAI client with the shared pool limits
+
+    Async connection pools are bound to the event loop that uses them, so a
+    new client is created per async entry point and closed with ``async with``.
+    """
+    return openai.AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        timeout=_HTTP_TIMEOUT,
+        http_client=openai.DefaultAsyncHttpxClient(limits=_HTTP_LIMITS)
+    )
+
+
+@contextmanager
+def _pending_file_lock(pending_path: Path):
+    """
+    Hold an exclusive lock for a pending batch file
+
+    Appends and the submit-time rename both take it, so a request can't be
+    written into a file that has already been moved aside for submission.
+    The lock is an flock on a sibling .lock file and only covers processes on
+    this host.
+    """
+    with open(pending_path.with_suffix('.lock'), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def append_batch_request(pending_filename: str, custom_id: str, body: Dict):
+    """
+    Append a chat completion request to a pending batch file in OPENAI_BATCH_DIR
+
+    The file is on this host's disk; only submit_batch calls on the same host
+    will pick the request up.
+    """
+    request_line = {
+        'custom_id': custom_id,
+        'method': 'POST',
+        'url': BATCH_ENDPOINT,
+        'body': body
+    }
+
+    batch_dir = Path(settings.OPENAI_BATCH_DIR)
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    pending_path = batch_dir / pending_filename
+    with _pending_file_lock(pending_path), open(pending_path, 'a', encoding='utf-8') as pending_file:
+        pending_file.write(orjson.dumps(request_line).decode() + '\n')
+
+
+def submit_batch(client: openai.OpenAI, pending_filename: str) -> Optional[str]:
+    """
+    Submit all requests queued in a pending batch file as one OpenAI batch
+
+    Only requests queued on this host are submitted (see append_batch_request).
+
+    Returns:
+        The OpenAI batch ID, or None if nothing was queued
+    """
+    batch_dir = Path(settings.OPENAI_BATCH_DIR)
+    pending_path = batch_dir / pending_filename
+    if not pending_path.exists():
+        return None
+
+    # Move the pending file aside so new jobs start a fresh batch
+    submit_path = batch_dir / f"{pending_path.stem}_{uuid.uuid4().hex}.jsonl"
+    with _pending_file_lock(pending_path):
+        if not pending_path.exists():
+            return None  # Submitted concurrently
+        os.replace(pending_path, submit_path)
+
+    try:
+        _deduplicate_batch_file(submit_path)
+
+        with open(submit_path, 'rb') as batch_file:
+            uploaded = client.files.create(file=batch_file, purpose='batch')
+
+        batch = client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=_BATCH_COMPLETION_WINDOW
+        )
+    except Exception:
+        # Put the requests back so the next submit retries them
+        with _pending_file_lock(pending_path), \
+                open(submit_path, 'r', encoding='utf-8') as submit_file, \
+                open(pending_path, 'a', encoding='utf-8') as pending_file:
+            pending_file.write(submit_file.read())
+        raise
+    finally:
+        submit_path.unlink(missing_ok=True)
+
+    return batch.id
+
+
+def _deduplicate_batch_file(batch_path: Path):
+    """
+    Keep only the last queued request per custom_id in a batch file
+
+    OpenAI rejects a whole batch with duplicate custom_ids, which happens when
+    a job is queued again (e.g. a task retry) before the batch is submitted.
+    """
+    request_lines = {}
+    with open(batch_path, 'rb') as batch_file:
+        for line in batch_file:
+            if not line.strip():
+                continue
+            custom_id = orjson.loads(line)['custom_id']
+            # Re-insert so the surviving request keeps its latest position
+            request_lines.pop(custom_id, None)
+            request_lines[custom_id] = line.rstrip(b'\n') + b'\n'
+
+    with open(batch_path, 'wb') as batch_file:
+        batch_file.writelines(request_lines.values())
+
+
+def retrieve_batch_contents(client: openai.OpenAI, batch_id: str) -> Optional[Dict[str, str]]:
+    """
+    Fetch the completion text of each request in a finished OpenAI batch
+
+    Returns:
+        Mapping of custom_id to message content, or None while the batch is still running
+
+    Raises:
+        RuntimeError: If the batch failed, expired or was cancelled
+    """
+    batch = client.batches.retrieve(batch_id)
+
+    if batch.status in _BATCH_FAILED_STATUSES:
+        raise RuntimeError(f"OpenAI batch {batch_id} ended with status {batch.status}")
+    if batch.status != 'completed':
+        return None
+
+    contents = {}
+    if not batch.output_file_id:
+        return contents
+
+    output = client.files.content(batch.output_file_id).text
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        result = orjson.loads(line)
+        try:
+            contents[result['custom_id']] = result['response']['body']['choices'][0]['message']['content']
+        except (KeyError, IndexError, TypeError) as e:
+            logger.error("Missing completion in batch %s for request %s: %s", batch_id, result.get('custom_id'), e)
+
+    return contents
@@ -1,14 +1,453 @@
 # ai_analyzer/summary_generator.py
 import openai
+import orjson
+from asgiref.sync import async_to_sync
 from django.conf import settings
+from django.core.cache import cache
+from .openai_client import (
+    append_batch_request, create_async_openai_client, get_openai_client,
+    retrieve_batch_contents, submit_batch
+)
+from dataclasses import dataclass
+import asyncio
+import bisect
+import functools
+import hashlib
+import itertools
 import json
+import operator
+import re
 import time
+from types import MappingProxyType
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# AI summaries are cached by a hash of the prompt context, so re-running a
+# report for an unchanged site skips the OpenAI round-trip
+_SUMMARY_CACHE_PREFIX = "sumgen:"
+_SUMMARY_CACHE_TTL = 3600  # 1 hour
+
+_SUMMARY_SYSTEM_PROMPT = "Senior marketing analyst. Output only the summary."
+_MAX_SUMMARY_LENGTH = 250
+
+# Industry benchmarks for comparison
+_BENCHMARKS = {
+    'excellent_trust_score': 8.5,
+    'good_trust_score': 7.0,
+    'average_trust_score': 5.5,
+    'min_word_count': 300,
+    'good_word_count': 800,
+    'excellent_word_count': 1500,
+    'min_page_speed': 60,
+    'good_page_speed': 80,
+    'excellent_page_speed': 90,
+    'min_social_platforms': 2,
+    'good_social_platforms': 4,
+    'excellent_social_platforms': 6
+}
+
+# Performance highlight areas: (metric, display name, benchmark, unit)
+_PERFORMANCE_AREAS = (
+    ('page_speed_score', 'Page Performance', 'excellent_page_speed', '/100'),
+    ('trust_score', 'Trust Score', 'excellent_trust_score', '/10'),
+    ('mobile_score', 'Mobile Optimization', 'good_page_speed', '%'),
+    ('security_score', 'Security Implementation', 'good_page_speed', '/100'),
+    ('social_presence_score', 'Social Media Presence', 'good_page_speed', '/100'),
+    ('content_volume_score', 'Content Quality', 'good_page_speed', '/100'),
+    ('technical_seo_score', 'Technical SEO', 'good_page_speed', '/100'),
+    ('accessibility_score', 'Accessibility', 'good_page_speed', '/100')
+)
+# Same areas with the excellent and strong (80% of excellent) thresholds resolved
+_PERFORMANCE_AREA_THRESHOLDS = tuple(
+    (metric_key, display_name, _BENCHMARKS[benchmark_key], _BENCHMARKS[benchmark_key] * 0.8, unit)
+    for metric_key, display_name, benchmark_key, unit in _PERFORMANCE_AREAS
+)
+
+# Improvement area messages, in priority order
+_IMPROVEMENT_SSL = "🔒 Implement SSL certificate (High Impact, Low Effort) - Critical for security and SEO"
+_IMPROVEMENT_PAGE_SPEED = "⚡ Optimize page loading speed (High Impact, Medium Effort) - Improve user experience and rankings"
+_IMPROVEMENT_MOBILE = "📱 Implement mobile-responsive design (High Impact, High Effort) - Essential for 60%+ mobile users"
+_IMPROVEMENT_CONTENT = "📝 Expand content volume (Medium Impact, Medium Effort) - Enhance SEO and user value"
+_IMPROVEMENT_ALT_TEXT = "🖼️ Add alt text to {} images (Medium Impact, Low Effort) - Improve accessibility and SEO"
+_IMPROVEMENT_SOCIAL = "📲 Expand social media presence (Medium Impact, Medium Effort) - Increase brand awareness"
+_IMPROVEMENT_STRUCTURED_DATA = "🏷️ Implement structured data markup (Medium Impact, Medium Effort) - Enhance search appearance"
+_IMPROVEMENT_INTERNAL_LINKS = "🔗 Improve internal linking structure (Low Impact, Low Effort) - Better site navigation and SEO"
+_IMPROVEMENT_ACCESSIBILITY = "♿ Enhance accessibility features (Medium Impact, Medium Effort) - Expand audience reach"
+
+# Growth gaps that need a larger investment to close
+_HIGH_EFFORT_GAPS = frozenset(('Mobile optimization', 'Performance optimization'))
+
+# Risk factor messages, in priority order
+_MAX_RISK_FACTORS = 4
+_RISK_SSL = "🔒 Security Risk: Missing SSL certificate may deter users and impact search rankings"
+_RISK_PERFORMANCE = "⚡ Performance Risk: Slow loading times significantly impact user experience and conversions"
+_RISK_MOBILE = "📱 Mobile Risk: Non-responsive design alienates 60%+ of mobile users"
+_RISK_CONTENT = "📝 Content Risk: Insufficient content limits SEO potential and user engagement"
+_RISK_REPUTATION = "⭐ Reputation Risk: Low trust score may significantly impact customer acquisition"
+_RISK_TECHNICAL = "🔧 Technical Risk: Missing fundamental SEO infrastructure"
+
+# Market opportunity messages, in priority order
+_MAX_MARKET_OPPORTUNITIES = 4
+_OPPORTUNITY_CONTENT = "📝 Content Marketing: Develop comprehensive content strategy to capture long-tail keywords"
+_OPPORTUNITY_SOCIAL = "📲 Social Expansion: Establish presence on untapped platforms for audience growth"
+_OPPORTUNITY_RICH_SNIPPETS = "🏷️ Rich Snippets: Implement structured data for enhanced search appearance"
+_OPPORTUNITY_PERFORMANCE = "⚡ Performance Edge: Optimize for superior loading speeds to outperform competitors"
+_OPPORTUNITY_LOCAL_SEO = "📍 Local SEO: Leverage location-based optimization for regional dominance"
+
+# Input sections counted towards the data sources / confidence score
+_DATA_SOURCE_KEYS = ('website_data', 'seo_data', 'social_data', 'reputation_data', 'competitor_data')
+# Frameworks that count as a modern technology stack
+_MODERN_TECHNOLOGIES = frozenset(('React', 'Vue', 'Angular', 'Next.js'))
+
+# Trust score bands (average, good and excellent benchmarks); the level index
+# from bisect_right selects the matching entry in the per-level tables below
+_TRUST_THRESHOLDS = (5.5, 7.0, 8.5)
+_TRUST_LEVEL_DESCRIPTIONS = ("emerging", "competitive", "above-average", "industry-leading")
+_TRUST_INSIGHTS = (
+    "Trust score of {trust}/10 indicates significant credibility challenges that may impact conversion rates and customer acquisition",
+    "Moderate trust score of {trust}/10 suggests mixed signals to potential customers, requiring strategic reputation management",
+    "Strong trust score of {trust}/10 indicates solid customer confidence with opportunities to reach industry-leading levels",
+    "Exceptional trust score of {trust}/10 positions the brand as highly credible, providing strong competitive advantage for customer acquisition"
+)
+# (position, description, strategy, market share potential) per trust level
+_COMPETITIVE_POSITIONS = (
+    ("challenger",
+     "Below industry standards, requiring comprehensive digital transformation",
+     "Prioritize fundamental improvements in trust, performance, and user experience",
+     "Limited - Focus on foundational improvements first"),
+    ("average_performer",
+     "Competitive parity with industry average, requiring strategic improvements",
+     "Implement comprehensive digital strategy focusing on high-impact improvements",
+     "Moderate - Need strategic improvements for growth"),
+    ("strong_competitor",
+     "Strong competitive position with opportunities for market leadership",
+     "Focus on differentiating strengths while addressing key gaps to achieve market leadership",
+     "Good - Ready for aggressive growth strategies"),
+    ("market_leader",
+     "Industry-leading digital presence with comprehensive competitive advantages",
+     "Maintain leadership through continuous innovation and emerging technology adoption",
+     "High - Well-positioned for market expansion")
+)
+
+
+def _weight_table(*weights: float) -> tuple:
+    """Pair score weights with their total, summed once at import"""
+    return weights, sum(weights)
+
+
+# Compound score weights, in the order the scores are passed to _weighted_average
+_TECHNICAL_HEALTH_WEIGHTS = _weight_table(0.3, 0.25, 0.25, 0.2)  # page speed, mobile, security, technical SEO
+_CONTENT_QUALITY_WEIGHTS = _weight_table(0.3, 0.3, 0.25, 0.15)  # volume, structure, on-page SEO, images
+_USER_EXPERIENCE_WEIGHTS = _weight_table(0.3, 0.25, 0.25, 0.2)  # loading speed, mobile, accessibility, UX
+
+# Overall performance score inputs: (metric, default, scale to 0-100, weight)
+_OVERALL_PERFORMANCE_SPEC = (
+    ('trust_score', 5.0, 10.0, 0.25),
+    ('page_speed_score', 0, 1.0, 0.20),
+    ('overall_user_experience', 0, 1.0, 0.15),
+    ('social_presence_score', 0, 1.0, 0.10),
+    ('security_score', 0, 1.0, 0.15),
+    ('content_volume_score', 0, 1.0, 0.10),
+    ('technical_seo_score', 0, 1.0, 0.05)
+)
+_OVERALL_PERFORMANCE_WEIGHT_TOTAL = sum(weight for _, _, _, weight in _OVERALL_PERFORMANCE_SPEC)
+
+# Template summaries used without OpenAI, per trust level
+_TEMPLATE_SUMMARIES = (
+    "{company} is building its digital presence with a {trust}/10 trust score and shows promise in {strength}. Current {social_count}-platform social presence provides growth opportunities. Implementing {improvement} is critical for competitive positioning and user engagement.",
+    "{company} maintains a {description} digital foundation with a {trust}/10 trust score and demonstrates {strength}. With presence across {social_count} social platforms, the brand shows growth potential. Prioritizing {improvement} will drive significant performance improvements.",
+    "{company} shows {description} digital presence with a {trust}/10 trust score, particularly excelling in {strength}. Current performance indicates solid market positioning with {social_count} active social channels. Implementing {improvement} represents the highest-impact improvement opportunity.",
+    "{company} demonstrates {description} digital performance with a trust score of {trust}/10, highlighted by {strength}. The website maintains strong technical fundamentals across {social_count} social platforms. Strategic focus on {improvement} will further enhance market leadership position."
+)
+
+# Social platform count bands (minimum and good benchmarks)
+_SOCIAL_THRESHOLDS = (2, 4)
+_SOCIAL_LEVEL_LIMITED = 0
+_SOCIAL_LEVEL_STRONG = 2
+
+# Social presence bands (one platform, then the minimum, good and excellent
+# benchmarks); bisect_right indexes straight into the scores
+_SOCIAL_PRESENCE_THRESHOLDS = (
+    1, _BENCHMARKS['min_social_platforms'], _BENCHMARKS['good_social_platforms'],
+    _BENCHMARKS['excellent_social_platforms']
+)
+_SOCIAL_PRESENCE_SCORES = (0.0, 40.0, 60.0, 80.0, 100.0)
+
+# Score metrics reported by _benchmark_against_industry, in metrics order;
+# new *_score metrics must be added here to be benchmarked
+_BENCHMARKED_SCORES = (
+    'page_speed_score', 'seo_score', 'accessibility_score', 'best_practices_score', 'mobile_score',
+    'content_volume_score', 'content_structure_score', 'image_optimization_score',
+    'technical_seo_score', 'on_page_seo_score', 'social_presence_score', 'trust_score',
+    'security_score', 'user_experience_score', 'loading_speed_score', 'competitive_advantage_score'
+)
+# Industry benchmark bands for 0-100 scores; bisect_right indexes the labels
+_INDUSTRY_BENCHMARK_THRESHOLDS = (40, 60, 80, 90)
+_INDUSTRY_BENCHMARK_LABELS = (
+    'Poor - Immediate Action Required',
+    'Below Average - Improvement Needed',
+    'Average - Industry Standard',
+    'Good - Top 25%',
+    'Excellent - Top 10%'
+)
+
+# Content structure points per heading level, indexed by the heading count
+# capped at the last entry; one H1 is ideal, multiple H1s are not
+_H1_STRUCTURE_SCORES = (0.0, 30.0, 10.0)
+_H2_STRUCTURE_SCORES = (0.0, 15.0, 15.0, 25.0)
+_H3_STRUCTURE_SCORES = (0.0, 10.0, 20.0)
+
+# On-page SEO points for the title and meta description, indexed by
+# present + within the recommended length range
+_TITLE_SCORES = (0.0, 15.0, 25.0)
+_DESCRIPTION_SCORES = (0.0, 15.0, 25.0)
+
+# User experience points for response time (seconds, exclusive upper bounds)
+# and for internal links as a navigation signal, see _bucket
+_RESPONSE_TIME_UX_THRESHOLDS = (1.0, 2.0, 3.0, 5.0)
+_RESPONSE_TIME_UX_SCORES = (25.0, 20.0, 15.0, 10.0, 0.0)
+_NAVIGATION_LINK_THRESHOLDS = (2, 5, 10)
+_NAVIGATION_LINK_SCORES = (0.0, 10.0, 15.0, 20.0)
+
+# On-page SEO points for internal linking
+_INTERNAL_LINK_SEO_THRESHOLDS = (1, 5, 10)
+_INTERNAL_LINK_SEO_SCORES = (0.0, 10.0, 15.0, 20.0)
+
+# Content volume bands (minimum, good and excellent word counts) and their scores
+_WORD_COUNT_THRESHOLDS = (
+    _BENCHMARKS['min_word_count'], _BENCHMARKS['good_word_count'], _BENCHMARKS['excellent_word_count']
+)
+_CONTENT_VOLUME_SCORES = (60.0, 80.0, 100.0)
+
+# Page loading time bands (seconds, inclusive) and their scores; slower pages
+# lose 5 points per extra second down to a floor of 10
+_LOADING_TIME_THRESHOLDS = (1.0, 2.0, 3.0, 4.0, 5.0)
+_LOADING_TIME_SCORES = (100.0, 85.0, 70.0, 55.0, 40.0)
+
+# End of a sentence in generated text, ignoring common abbreviations
+_SENTENCE_END = re.compile(r'(?<!\bInc)(?<!\bLtd)(?<!\bCo)(?<!\bvs)(?<!\betc)(?<!\be\.g)(?<!\bi\.e)\.\s')
+
+# Pending OpenAI Batch API summary requests (see openai_client.submit_batch)
+_BATCH_PENDING_FILENAME = 'summary_pending.jsonl'
+
+
+def _summary_cache_key(model: str, context: Dict) -> str:
+    """Build a deterministic cache key for an AI summary request"""
+    payload = orjson.dumps(context, default=str, option=orjson.OPT_SORT_KEYS)
+    return f"{_SUMMARY_CACHE_PREFIX}{model}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+
+def _bucket(value, thresholds: tuple, values: tuple):
+    """
+    Map a value onto score bands
+
+    thresholds are the ascending lower bounds of each band after the first;
+    values holds one more entry than thresholds, one per band.
+    """
+    return values[bisect.bisect_right(thresholds, value)]
+
+
+def _weighted_average(scores: tuple, weight_table: tuple) -> float:
+    """Weighted average of scores using a _weight_table, rounded to one decimal"""
+    weights, total_weights = weight_table
+    if not total_weights:
+        return 0.0
+
+    return round(sum(map(operator.mul, scores, weights)) / total_weights, 1)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _strategic_insights(trust_level: int, trust: float, page_speed: float, mobile_friendly: bool,
+                        word_count: int, rich_content: bool, has_ssl: bool,
+                        social_level: int, social_count: int) -> tuple:
+    """Build the strategic insights for a combination of bucketed metrics, in priority order"""
+    insights = []
+
+    # Trust score insights with specific recommendations
+    insights.append(_TRUST_INSIGHTS[trust_level].format(trust=trust))
+
+    # Technical performance insights
+    if page_speed >= 90:
+        insights.append(
+            f"Outstanding page speed performance ({page_speed}/100) enhances user experience and supports strong SEO rankings")
+    elif page_speed >= 70:
+        insights.append(
+            f"Good page speed ({page_speed}/100) provides competitive advantage, with optimization potential for mobile performance")
+    elif page_speed < 50:
+        insights.append(
+            f"Page speed score ({page_speed}/100) significantly below industry standards, likely impacting user engagement and search rankings")
+
+    # Mobile optimization insights
+    if mobile_friendly:
+        insights.append(
+            "Mobile-responsive design aligns with mobile-first indexing requirements and growing mobile traffic trends")
+    else:
+        insights.append(
+            "Missing mobile optimization represents critical risk given 60%+ mobile traffic share across most industries")
+
+    # Content strategy insights
+    if rich_content:
+        insights.append(
+            f"Rich content volume ({word_count} words) supports comprehensive SEO strategy and user education")
+    elif word_count < 300:
+        insights.append(
+            f"Limited content volume ({word_count} words) constrains SEO potential and user engagement opportunities")
+
+    # Security insights
+    if has_ssl:
+        insights.append(
+            "SSL security implementation meets modern standards and supports user trust and search engine requirements")
+    else:
+        insights.append(
+            "Missing SSL certificate creates security warnings that directly impact user trust and search engine rankings")
+
+    # Social presence strategic insights
+    if social_level == _SOCIAL_LEVEL_STRONG:
+        insights.append(
+            f"Strong social media presence across {social_count} platforms creates multiple customer touchpoints for brand building")
+    elif social_level == _SOCIAL_LEVEL_LIMITED:
+        insights.append(
+            f"Limited social presence ({social_count} platforms) misses significant opportunities for audience engagement and brand awareness")
+
+    return tuple(insights)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _template_summary(company_name: str, trust_level: int, trust: float, social_count: int,
+                      top_strength: str, top_improvement: str) -> str:
+    """Fill the template summary for a trust level"""
+    return _TEMPLATE_SUMMARIES[trust_level].format(
+        company=company_name,
+        description=_TRUST_LEVEL_DESCRIPTIONS[trust_level],
+        trust=trust,
+        social_count=social_count,
+        strength=top_strength,
+        improvement=top_improvement
+    )
+
+
+@dataclass(slots=True)
+class ReportContext:
+    """
+    Flattened view of the raw analysis data used by the summary sections
+
+    Built once per summary so the section helpers read plain attributes
+    instead of repeating nested dict lookups on the input data.
+    """
+    company_name: str
+    domain: str
+    trust_overall: float
+    trust_level: int
+    avg_rating: float
+    data_sources_count: int
+    website_error: bool
+
+    # Website content
+    word_count: int
+    title_length: int
+    description_length: int
+    h1_count: int
+    h2_count: int
+    h3_count: int
+    structured_data_count: int
+    image_count: int
+    images_with_alt: int
+    images_without_alt: int
+    internal_links: int
+    external_links: int
+    social_platforms: int
+    social_level: int
+    has_modern_tech: bool
+
+    # Technical and accessibility
+    has_ssl: bool
+    has_canonical_url: bool
+    response_time: Optional[float]
+    has_lang_attribute: bool
+    accessible_images: int
+    has_email: bool
+    has_phone: bool
+    has_address: bool
+    # SEO infrastructure flags as reported by the website crawl
+    has_robots_txt: bool
+    has_sitemap: bool
+
+    # SEO collector results
+    page_speed_score: float
+    seo_score: float
+    accessibility_score: float
+    best_practices_score: float
+    mobile_friendly: bool
+    seo_robots_txt: bool
+    seo_sitemap_xml: bool
+
+    @classmethod
+    def from_raw(cls, data: Dict) -> 'ReportContext':
+        """Build the context from the analysis data passed to generate_summary"""
+        website_data = data.get('website_data') or {}
+        seo_data = data.get('seo_data') or {}
+        reputation_data = data.get('reputation_data') or {}
+        trust_score = data.get('trust_score') or {}
+
+        headings = website_data.get('heading_structure') or {}
+        images = website_data.get('images') or {}
+        links = website_data.get('links') or {}
+        contact_info = website_data.get('contact_info') or {}
+        accessibility = website_data.get('accessibility_features') or {}
+        page_speed = seo_data.get('page_speed') or {}
+        mobile = seo_data.get('mobile_friendly') or {}
+        technologies = website_data.get('technologies') or []
+        trust_overall = trust_score.get('overall', 5.0)
+        social_platforms = len(website_data.get('social_links') or {})
+
+        return cls(
+            company_name=website_data.get('company_name') or website_data.get('domain', 'This website'),
+            domain=website_data.get('domain', 'the analyzed website'),
+            trust_overall=trust_overall,
+            trust_level=bisect.bisect_right(_TRUST_THRESHOLDS, trust_overall),
+            avg_rating=reputation_data.get('overall_rating', 0),
+            data_sources_count=sum(map(bool, map(data.get, _DATA_SOURCE_KEYS))),
+            website_error=bool(website_data.get('error')),
+
+            word_count=website_data.get('word_count', 0),
+            title_length=len(website_data.get('title') or ''),
+            description_length=len(website_data.get('description') or ''),
+            h1_count=len(headings.get('h1') or []),
+            h2_count=len(headings.get('h2') or []),
+            h3_count=len(headings.get('h3') or []),
+            structured_data_count=len(website_data.get('structured_data') or []),
+            image_count=images.get('total_count', 0),
+            images_with_alt=images.get('with_alt_text', 0),
+            images_without_alt=images.get('without_alt_text', 0),
+            internal_links=links.get('internal_links', 0),
+            external_links=links.get('external_links', 0),
+            social_platforms=social_platforms,
+            social_level=bisect.bisect_right(_SOCIAL_THRESHOLDS, social_platforms),
+            has_modern_tech=not _MODERN_TECHNOLOGIES.isdisjoint(technologies),
+
+            has_ssl=bool(website_data.get('has_ssl')),
+            has_canonical_url=bool(website_data.get('canonical_url')),
+            response_time=website_data.get('response_time'),
+            has_lang_attribute=bool(accessibility.get('has_lang_attribute')),
+            accessible_images=accessibility.get('images_with_alt', 0),
+            has_email=bool(contact_info.get('has_email')),
+            has_phone=bool(contact_info.get('has_phone')),
+            has_address=bool(contact_info.get('has_address')),
+            has_robots_txt=bool(website_data.get('has_robots_txt')),
+            has_sitemap=bool(website_data.get('has_sitemap')),
+
+            page_speed_score=page_speed.get('performance_score', 0),
+            seo_score=page_speed.get('seo_score', 0),
+            accessibility_score=page_speed.get('accessibility_score', 0),
+            best_practices_score=page_speed.get('best_practices_score', 0),
+            mobile_friendly=bool(mobile.get('mobile_friendly')),
+            seo_robots_txt=bool(seo_data.get('robots_txt')),
+            seo_sitemap_xml=bool(seo_data.get('sitemap_xml'))
+        )
+
 
 class SummaryGenerator:
     """
@@ -21,6 +460,23 @@ class SummaryGenerator:
     4. Performance benchmarking
     """
 
+    __slots__ = ('client', 'openai_available')
+
+    # Configuration for summary generation (shared, read-only)
+    CONFIG = MappingProxyType({
+        'max_summary_length': _MAX_SUMMARY_LENGTH,
+        'max_insights': 6,
+        'max_highlights': 5,
+        'max_improvements': 5,
+        'openai_model': 'gpt-3.5-turbo',
+        'temperature': 0.7,
+        # ~4 characters per token, so this still covers a full-length summary
+        'max_tokens': _MAX_SUMMARY_LENGTH // 3
+    })
+
+    # Industry benchmarks for comparison
+    BENCHMARKS = MappingProxyType(_BENCHMARKS)
+
     def __init__(self):
         """Initialize the summary generator with OpenAI client and configuration"""
         self.client = None
@@ -29,7 +485,8 @@ class SummaryGenerator:
         # Initialize OpenAI client if API key is available
         if settings.OPENAI_API_KEY:
             try:
-                self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+                # Shared client: one connection pool for every generator in the process
+                self.client = get_openai_client()
                 self.openai_available = True
                 logger.info("OpenAI client initialized successfully")
             except Exception as e:
@@ -38,33 +495,6 @@ class SummaryGenerator:
         else:
             logger.warning("OpenAI API key not provided, using fallback summary generation")
 
-        # Configuration for summary generation
-        self.config = {
-            'max_summary_length': 250,
-            'max_insights': 6,
-            'max_highlights': 5,
-            'max_improvements': 5,
-            'openai_model': 'gpt-3.5-turbo',
-            'temperature': 0.7,
-            'max_tokens': 300
-        }
-
-        # Industry benchmarks for comparison
-        self.benchmarks = {
-            'excellent_trust_score': 8.5,
-            'good_trust_score': 7.0,
-            'average_trust_score': 5.5,
-            'min_word_count': 300,
-            'good_word_count': 800,
-            'excellent_word_count': 1500,
-            'min_page_speed': 60,
-            'good_page_speed': 80,
-            'excellent_page_speed': 90,
-            'min_social_platforms': 2,
-            'good_social_platforms': 4,
-            'excellent_social_platforms': 6
-        }
-
     def generate_summary(self, data: Dict) -> Dict:
         """
         Generate a comprehensive executive summary from website analysis data
@@ -82,36 +512,58 @@ class SummaryGenerator:
         Returns:
             Dictionary containing complete executive summary with metrics and insights
         """
+        return async_to_sync(self.generate_summary_async)(data)
+
+    async def generate_summary_async(self, data: Dict) -> Dict:
+        """
+        Async variant of generate_summary
+
+        The OpenAI summary request is started first and the local analysis
+        sections are computed while it is in flight.
+        """
+        if not self.openai_available:
+            return await self._generate_summary_async(data)
+
         try:
-            start_time = time.time()
+            async with create_async_openai_client() as client:
+                return await self._generate_summary_async(data, client)
+        except Exception as e:
+            logger.error(f"Error generating executive summary: {e}")
+            return self._generate_emergency_fallback_summary(data)
+
+    async def _generate_summary_async(self, data: Dict, client: openai.AsyncOpenAI = None) -> Dict:
+        """Generate the executive summary, requesting the AI summary text when a client is given"""
+        summary_task = None
+        try:
+            # Monotonic clock: wall-clock (NTP) adjustments can't skew the duration
+            start_ns = time.monotonic_ns()
             logger.info("Starting executive summary generation")
 
-            # Extract and validate input data
-            website_data = data.get('website_data', {})
-            seo_data = data.get('seo_data', {})
-            social_data = data.get('social_data', {})
-            reputation_data = data.get('reputation_data', {})
-            competitor_data = data.get('competitor_data', {})
-            trust_score = data.get('trust_score', {})
-            growth_opportunities = data.get('growth_opportunities', [])
+            # Flatten the input data once for all sections
+            ctx = ReportContext.from_raw(data)
 
             # Calculate key performance metrics
-            key_metrics = self._calculate_comprehensive_metrics(data)
+            key_metrics = self._calculate_comprehensive_metrics(ctx)
 
-            # Generate AI-powered summary text
-            summary_text = self._generate_intelligent_summary_text(data, key_metrics)
+            # Start the AI-powered summary request so it overlaps the local analysis below
+            if client is not None:
+                summary_task = asyncio.create_task(
+                    self._generate_ai_powered_summary_async(client, ctx, key_metrics)
+                )
+                # Let the task send its request before the CPU-bound sections run
+                await asyncio.sleep(0)
 
             # Extract actionable insights
-            key_insights = self._extract_strategic_insights(data, key_metrics)
+            key_insights = self._extract_strategic_insights(ctx, key_metrics)
 
             # Identify performance highlights
-            performance_highlights = self._identify_performance_highlights(data, key_metrics)
+            performance_highlights = self._identify_performance_highlights(ctx, key_metrics)
 
             # Determine improvement priorities
-            improvement_areas = self._prioritize_improvement_areas(data, key_metrics)
+            improvement_areas = self._prioritize_improvement_areas(ctx, key_metrics)
 
             # Assess competitive positioning
-            competitive_position = self._analyze_competitive_position(data, key_metrics)
+            competitive_position = self._analyze_competitive_position(ctx, key_metrics)
 
             # Calculate overall performance score
             overall_performance = self._calculate_overall_performance_score(key_metrics)
@@ -119,11 +571,22 @@ class SummaryGenerator:
             # Generate month-over-month comparison (simulated for now)
             month_over_month = self._generate_month_over_month_analysis(key_metrics)
 
+            # Strategic analysis and benchmarking
+            growth_potential = self._assess_growth_potential(ctx, key_metrics)
+            risk_factors = self._identify_risk_factors(ctx, key_metrics)
+            market_opportunities = self._identify_market_opportunities(ctx, key_metrics)
+            benchmarking = self._benchmark_against_industry(key_metrics)
+
+            if summary_task is not None:
+                summary_text = await summary_task
+            else:
+                summary_text = self._generate_template_based_summary(ctx, key_metrics)
+
             # Create comprehensive summary object
             summary = {
                 # Key headline metrics
                 'organic_traffic_change': key_metrics.get('traffic_change', '+0%'),
-                'ai_visibility': trust_score.get('overall', 5.0),
+                'ai_visibility': ctx.trust_overall,
                 'avg_rating': key_metrics.get('avg_rating', 0.0),
                 'overall_performance_score': overall_performance,
 
@@ -135,21 +598,21 @@ class SummaryGenerator:
 
                 # Strategic analysis
                 'competitive_position': competitive_position,
-                'growth_potential': self._assess_growth_potential(data, key_metrics),
-                'risk_factors': self._identify_risk_factors(data, key_metrics),
-                'market_opportunities': self._identify_market_opportunities(data, key_metrics),
+                'growth_potential': growth_potential,
+                'risk_factors': risk_factors,
+                'market_opportunities': market_opportunities,
 
                 # Detailed metrics
                 'detailed_metrics': key_metrics,
                 'month_over_month': month_over_month,
-                'benchmarking': self._benchmark_against_industry(key_metrics),
+                'benchmarking': benchmarking,
 
                 # Metadata
                 'generated_at': time.time(),
-                'generation_time_seconds': round(time.time() - start_time, 2),
+                'generation_time_seconds': round((time.monotonic_ns() - start_ns) / 1e9, 2),
                 'ai_enhanced': self.openai_available,
-                'data_sources_count': self._count_data_sources(data),
-                'confidence_score': self._calculate_confidence_score(data)
+                'data_sources_count': ctx.data_sources_count,
+                'confidence_score': self._calculate_confidence_score(ctx)
             }
 
             logger.info(f"Executive summary generated successfully in {summary['generation_time_seconds']}s")
@@ -157,77 +620,180 @@ class SummaryGenerator:
 
         except Exception as e:
             logger.error(f"Error generating executive summary: {e}")
+            if summary_task is not None:
+                summary_task.cancel()
             return self._generate_emergency_fallback_summary(data)
 
-    def _calculate_comprehensive_metrics(self, data: Dict) -> Dict:
+    def generate_summary_stream(self, data: Dict) -> Iterator[str]:
         """
-        Calculate comprehensive performance metrics from all data sources
+        Stream the executive summary text as it is generated
+
+        Yields partial summary_text chunks so a view can start rendering with
+        StreamingHttpResponse before the completion has finished. Falls back
+        to the template-based summary when OpenAI is unavailable or fails
+        before producing any text.
+        """
+        try:
+            ctx = ReportContext.from_raw(data)
+            metrics = self._calculate_comprehensive_metrics(ctx)
+        except Exception as e:
+            logger.error(f"Error calculating summary metrics: {e}")
+            yield self._generate_emergency_fallback_summary(data)['summary_text']
+            return
+
+        if not self.openai_available:
+            yield self._generate_template_based_summary(ctx, metrics)
+            return
+
+        streamed_any = False
+        try:
+            context = self._build_summary_context(ctx, metrics)
+            cache_key = _summary_cache_key(self.CONFIG['openai_model'], context)
+            cached_text = cache.get(cache_key)
+            if cached_text is not None:
+                yield cached_text
+                return
+
+            parts = []
+            for delta in self._stream_ai_summary(context):
+                streamed_any = True
+                parts.append(delta)
+                yield delta
+
+            summary_text = self._finalize_summary_text(''.join(parts))
+            if summary_text:
+                cache.set(cache_key, summary_text, _SUMMARY_CACHE_TTL)
+
+        except Exception as e:
+            logger.error(f"Error streaming AI summary: {e}")
+            if not streamed_any:
+                yield self._generate_template_based_summary(ctx, metrics)
+
+    def generate_summaries_batch(self, datasets: List[Dict], job_ids: List[str]) -> List[Dict]:
+        """
+        Generate executive summaries for many reports via the OpenAI Batch API
+
+        Intended for scheduled pipelines where the AI summary text can arrive
+        within 24h. Each summary is returned straight away with template-based
+        text, and its AI summary request is appended to the pending batch file;
+        call flush_batch() to submit everything queued so far.
+
+        Args:
+            datasets: List of analysis data dictionaries (see generate_summary)
+            job_ids: Identifiers used to match batch results back (e.g. report IDs)
 
         Returns:
-            Dictionary with detailed performance metrics
+            List of summaries, in the same order as datasets
         """
-        website_data = data.get('website_data', {})
-        seo_data = data.get('seo_data', {})
-        social_data = data.get('social_data', {})
-        reputation_data = data.get('reputation_data', {})
-        trust_score = data.get('trust_score', {})
+        # Local analysis for the whole batch runs in a single event loop
+        summaries = async_to_sync(self._generate_local_summaries_async)(datasets)
 
-        # Technical performance metrics
-        page_speed_data = seo_data.get('page_speed', {})
-        mobile_data = seo_data.get('mobile_friendly', {})
+        for data, job_id, summary in zip(datasets, job_ids, summaries):
+            summary['ai_enhanced'] = False
 
-        # Content metrics
-        word_count = website_data.get('word_count', 0)
-        images_data = website_data.get('images', {})
-        links_data = website_data.get('links', {})
+            if not self.openai_available or 'detailed_metrics' not in summary:
+                continue
 
-        # Social presence metrics
-        social_links = website_data.get('social_links', {})
-        social_platforms_count = len(social_links)
+            context = self._build_summary_context(ReportContext.from_raw(data), summary['detailed_metrics'])
+            cached_text = cache.get(_summary_cache_key(self.CONFIG['openai_model'], context))
+            if cached_text is not None:
+                summary['summary_text'] = cached_text
+                summary['ai_enhanced'] = True
+                continue
 
-        # Trust and security metrics
-        trust_overall = trust_score.get('overall', 5.0)
-        has_ssl = website_data.get('has_ssl', False)
+            append_batch_request(_BATCH_PENDING_FILENAME, str(job_id), self._build_summary_request(context))
+            logger.info(f"Queued AI summary for batch job {job_id}")
+
+        return summaries
+
+    async def _generate_local_summaries_async(self, datasets: List[Dict]) -> List[Dict]:
+        """Generate template-based summaries for each dataset, without OpenAI requests"""
+        return [await self._generate_summary_async(data) for data in datasets]
+
+    def flush_batch(self) -> Optional[str]:
+        """
+        Submit all queued AI summary requests as one OpenAI batch
+
+        Returns:
+            The OpenAI batch ID, or None if nothing was queued
+        """
+        if not self.openai_available:
+            logger.warning("OpenAI not available, cannot submit summary batch")
+            return None
+
+        batch_id = submit_batch(self.client, _BATCH_PENDING_FILENAME)
+        if batch_id:
+            logger.info(f"Submitted summary batch {batch_id}")
+        return batch_id
+
+    def collect_batch_results(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """
+        Fetch AI summary texts from a finished OpenAI batch
+
+        Returns:
+            Mapping of job ID to summary text, or None while the batch is still running
+        """
+        contents = retrieve_batch_contents(self.client, batch_id)
+        if contents is None:
+            return None
+
+        results = {}
+        for job_id, content in contents.items():
+            summary_text = self._finalize_summary_text(content or '')
+            if summary_text:
+                results[job_id] = summary_text
+
+        logger.info(f"Collected {len(results)} results from summary batch {batch_id}")
+        return results
+
+    def _calculate_comprehensive_metrics(self, ctx: ReportContext) -> Dict:
+        """
+        Calculate comprehensive performance metrics from all data sources
+
+        Returns:
+            Dictionary with detailed performance metrics
+        """
+        response_time = ctx.response_time if ctx.response_time is not None else 5.0
 
         metrics = {
             # Performance scores (0-100)
-            'page_speed_score': page_speed_data.get('performance_score', 0),
-            'seo_score': page_speed_data.get('seo_score', 0),
-            'accessibility_score': page_speed_data.get('accessibility_score', 0),
-            'best_practices_score': page_speed_data.get('best_practices_score', 0),
+            'page_speed_score': ctx.page_speed_score,
+            'seo_score': ctx.seo_score,
+            'accessibility_score': ctx.accessibility_score,
+            'best_practices_score': ctx.best_practices_score,
 
             # Mobile optimization
-            'mobile_friendly': mobile_data.get('mobile_friendly', False),
-            'mobile_score': 100 if mobile_data.get('mobile_friendly') else 0,
+            'mobile_friendly': ctx.mobile_friendly,
+            'mobile_score': 100 if ctx.mobile_friendly else 0,
 
             # Content quality indicators
-            'content_volume_score': self._calculate_content_volume_score(word_count),
-            'content_structure_score': self._calculate_content_structure_score(website_data),
-            'image_optimization_score': self._calculate_image_optimization_score(images_data),
+            'content_volume_score': self._calculate_content_volume_score(ctx.word_count),
+            'content_structure_score': self._calculate_content_structure_score(ctx),
+            'image_optimization_score': self._calculate_image_optimization_score(ctx),
 
             # SEO fundamentals
-            'technical_seo_score': self._calculate_technical_seo_score(website_data, seo_data),
-            'on_page_seo_score': self._calculate_on_page_seo_score(website_data),
+            'technical_seo_score': self._calculate_technical_seo_score(ctx),
+            'on_page_seo_score': self._calculate_on_page_seo_score(ctx),
 
             # Social presence
-            'social_presence_score': self._calculate_social_presence_score(social_platforms_count),
-            'social_platforms_count': social_platforms_count,
+            'social_presence_score': self._calculate_social_presence_score(ctx.social_platforms),
+            'social_platforms_count': ctx.social_platforms,
 
             # Trust and security
-            'trust_score': trust_overall,
-            'security_score': self._calculate_security_score(website_data),
+            'trust_score': ctx.trust_overall,
+            'security_score': self._calculate_security_score(ctx),
 
             # User experience
-            'user_experience_score': self._calculate_user_experience_score(website_data, seo_data),
-            'loading_speed_score': self._convert_loading_time_to_score(website_data.get('response_time', 5.0)),
+            'user_experience_score': self._calculate_user_experience_score(ctx),
+            'loading_speed_score': self._convert_loading_time_to_score(response_time),
 
             # Raw metrics for reference
-            'word_count': word_count,
-            'response_time_seconds': website_data.get('response_time', 0),
-            'internal_links_count': links_data.get('internal_links', 0),
-            'external_links_count': links_data.get('external_links', 0),
-            'images_with_alt': images_data.get('with_alt_text', 0),
-            'images_without_alt': images_data.get('without_alt_text', 0),
+            'word_count': ctx.word_count,
+            'response_time_seconds': ctx.response_time if ctx.response_time is not None else 0,
+            'internal_links_count': ctx.internal_links,
+            'external_links_count': ctx.external_links,
+            'images_with_alt': ctx.images_with_alt,
+            'images_without_alt': ctx.images_without_alt,
 
             # Calculated compound metrics
             'overall_technical_health': 0,  # Will be calculated below
@@ -236,167 +802,199 @@ class SummaryGenerator:
 
             # Placeholder for historical data (would come from database in production)
             'traffic_change': '+0%',  # Would need historical data
-            'avg_rating': reputation_data.get('overall_rating', 0) if reputation_data else 0,
+            'avg_rating': ctx.avg_rating,
             'social_engagement_rate': 0,  # Would need social API data
 
             # Competitive metrics (placeholders)
-            'market_position_percentile': min(trust_overall * 10, 100),
-            'competitive_advantage_score': self._calculate_competitive_advantage(data)
+            'market_position_percentile': min(ctx.trust_overall * 10, 100),
+            'competitive_advantage_score': self._calculate_competitive_advantage(ctx)
         }
 
         # Calculate compound scores
-        metrics['overall_technical_health'] = self._calculate_weighted_average([
-            (metrics['page_speed_score'], 0.3),
-            (metrics['mobile_score'], 0.25),
-            (metrics['security_score'], 0.25),
-            (metrics['technical_seo_score'], 0.2)
-        ])
-
-        metrics['overall_content_quality'] = self._calculate_weighted_average([
-            (metrics['content_volume_score'], 0.3),
-            (metrics['content_structure_score'], 0.3),
-            (metrics['on_page_seo_score'], 0.25),
-            (metrics['image_optimization_score'], 0.15)
-        ])
-
-        metrics['overall_user_experience'] = self._calculate_weighted_average([
-            (metrics['loading_speed_score'], 0.3),
-            (metrics['mobile_score'], 0.25),
-            (metrics['accessibility_score'], 0.25),
-            (metrics['user_experience_score'], 0.2)
-        ])
+        metrics['overall_technical_health'] = _weighted_average((
+            metrics['page_speed_score'],
+            metrics['mobile_score'],
+            metrics['security_score'],
+            metrics['technical_seo_score']
+        ), _TECHNICAL_HEALTH_WEIGHTS)
+
+        metrics['overall_content_quality'] = _weighted_average((
+            metrics['content_volume_score'],
+            metrics['content_structure_score'],
+            metrics['on_page_seo_score'],
+            metrics['image_optimization_score']
+        ), _CONTENT_QUALITY_WEIGHTS)
+
+        metrics['overall_user_experience'] = _weighted_average((
+            metrics['loading_speed_score'],
+            metrics['mobile_score'],
+            metrics['accessibility_score'],
+            metrics['user_experience_score']
+        ), _USER_EXPERIENCE_WEIGHTS)
 
         return metrics
 
-    def _generate_intelligent_summary_text(self, data: Dict, metrics: Dict) -> str:
-        """
-        Generate intelligent summary text using AI or advanced templating
-        """
-        if self.openai_available:
-            return self._generate_ai_powered_summary(data, metrics)
-        else:
-            return self._generate_template_based_summary(data, metrics)
-
-    def _generate_ai_powered_summary(self, data: Dict, metrics: Dict) -> str:
+    async def _generate_ai_powered_summary_async(self, client: openai.AsyncOpenAI, ctx: ReportContext,
+                                                 metrics: Dict) -> str:
         """
         Generate summary using OpenAI GPT with intelligent prompting
         """
         try:
-            website_data = data.get('website_data', {})
-            trust_score = data.get('trust_score', {})
-
-            company_name = website_data.get('company_name') or website_data.get('domain', 'This website')
-            domain = website_data.get('domain', 'the analyzed website')
-
-            # Create detailed context for AI
-            context = {
-                'company': company_name,
-                'domain': domain,
-                'trust_score': trust_score.get('overall', 5.0),
-                'page_speed': metrics.get('page_speed_score', 0),
-                'mobile_friendly': metrics.get('mobile_friendly', False),
-                'ssl_enabled': website_data.get('has_ssl', False),
-                'social_platforms': metrics.get('social_platforms_count', 0),
-                'content_quality': metrics.get('content_volume_score', 0),
-                'technical_health': metrics.get('overall_technical_health', 0),
-                'user_experience': metrics.get('overall_user_experience', 0),
-                'word_count': metrics.get('word_count', 0),
-                'seo_score': metrics.get('seo_score', 0)
-            }
-
-            # Create intelligent prompt
-            prompt = f"""
-            As a senior digital marketing analyst, write a professional executive summary for a comprehensive marketing report.
-
-            COMPANY: {context['company']}
-            DOMAIN: {context['domain']}
-
-            KEY METRICS:
-            • Trust Score: {context['trust_score']}/10
-            • Page Speed: {context['page_speed']}/100
-            • Mobile Friendly: {"Yes" if context['mobile_friendly'] else "No"}
-            • SSL Security: {"Enabled" if context['ssl_enabled'] else "Disabled"}
-            • Social Platforms: {context['social_platforms']} active
-            • Content Volume: {context['word_count']} words
-            • Technical Health: {context['technical_health']}/100
-            • User Experience: {context['user_experience']}/100
-            • SEO Score: {context['seo_score']}/100
-
-            REQUIREMENTS:
-            1. Write 2-3 sentences maximum (under 200 words)
-            2. Lead with the company's strongest performance area
-            3. Mention 1-2 specific metrics with numbers
-            4. Include 1 key improvement opportunity
-            5. Use confident, professional tone
-            6. Make it actionable and specific
-            7. Avoid generic marketing speak
-
-            Focus on business impact and growth opportunities. Be specific about the data.
-            """
-
-            response = self.client.chat.completions.create(
-                model=self.config['openai_model'],
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert digital marketing analyst known for creating clear, actionable executive summaries that drive business decisions."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.config['max_tokens'],
-                temperature=self.config['temperature']
-            )
-
-            summary_text = response.choices[0].message.content.strip()
-
-            # Validate and clean the response
-            if len(summary_text) > self.config['max_summary_length']:
-                # Truncate if too long
-                sentences = summary_text.split('. ')
-                summary_text = '. '.join(sentences[:2]) + '.'
+            context = self._build_summary_context(ctx, metrics)
+            cache_key = _summary_cache_key(self.CONFIG['openai_model'], context)
+            cached_text = await cache.aget(cache_key)
+            if cached_text is not None:
+                logger.info("Returning cached AI-powered summary")
+                return cached_text
+
+            max_length = self.CONFIG['max_summary_length']
+            parts = []
+            received = 0
+
+            stream = await client.chat.completions.create(**self._build_summary_request(context), stream=True)
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+
+                    parts.append(delta)
+                    received += len(delta)
+                    if received >= max_length:
+                        break
+            finally:
+                await stream.close()
+
+            summary_text = self._finalize_summary_text(''.join(parts))
+            if summary_text:
+                await cache.aset(cache_key, summary_text, _SUMMARY_CACHE_TTL)
 
             logger.info("AI-powered summary generated successfully")
             return summary_text
 
         except Exception as e:
             logger.error(f"Error generating AI summary: {e}")
-            return self._generate_template_based_summary(data, metrics)
+            return self._generate_template_based_summary(ctx, metrics)
+
+    def _finalize_summary_text(self, summary_text: str) -> str:
+        """Validate and clean a generated summary"""
+        summary_text = summary_text.strip()
+
+        max_length = self.CONFIG['max_summary_length']
+        if len(summary_text) <= max_length:
+            return summary_text
+
+        # Truncate if too long: keep the first two sentences
+        boundaries = _SENTENCE_END.finditer(summary_text)
+        first = next(boundaries, None)
+        second = next(boundaries, None) if first else None
+        if second:
+            return summary_text[:second.start() + 1]
+
+        # No second sentence boundary: cut at the last word that fits
+        return summary_text[:max_length].rsplit(' ', 1)[0]
 
-    def _generate_template_based_summary(self, data: Dict, metrics: Dict) -> str:
+    def _stream_ai_summary(self, context: Dict) -> Iterator[str]:
         """
-        Generate summary using intelligent templates when AI is not available
+        Yield summary text deltas from a streamed OpenAI completion
+
+        Stops reading once max_summary_length characters have arrived, since
+        anything beyond that would be truncated anyway.
         """
-        website_data = data.get('website_data', {})
-        trust_score = data.get('trust_score', {})
+        max_length = self.CONFIG['max_summary_length']
+        received = 0
 
-        company_name = website_data.get('company_name') or website_data.get('domain', 'This website')
-        trust_score_val = trust_score.get('overall', 5.0)
-        page_speed = metrics.get('page_speed_score', 0)
-        social_count = metrics.get('social_platforms_count', 0)
-
-        # Determine performance level
-        if trust_score_val >= self.benchmarks['excellent_trust_score']:
-            performance_level = "exceptional"
-            performance_desc = "industry-leading"
-        elif trust_score_val >= self.benchmarks['good_trust_score']:
-            performance_level = "strong"
-            performance_desc = "above-average"
-        elif trust_score_val >= self.benchmarks['average_trust_score']:
-            performance_level = "moderate"
-            performance_desc = "competitive"
-        else:
-            performance_level = "developing"
-            performance_desc = "emerging"
+        stream = self.client.chat.completions.create(**self._build_summary_request(context), stream=True)
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+
+                yield delta
+                received += len(delta)
+                if received >= max_length:
+                    break
+        finally:
+            # Closing early drops the connection instead of draining the rest
+            stream.close()
+
+    def _build_summary_context(self, ctx: ReportContext, metrics: Dict) -> Dict:
+        """
+        Collect the metrics the AI executive summary is based on
+
+        Fractional scores are rounded so trivially different inputs share a
+        cache entry.
+        """
+        # Create detailed context for AI
+        return {
+            'company': ctx.company_name,
+            'domain': ctx.domain,
+            'trust_score': round(ctx.trust_overall, 1),
+            'page_speed': metrics.get('page_speed_score', 0),
+            'mobile_friendly': metrics.get('mobile_friendly', False),
+            'ssl_enabled': ctx.has_ssl,
+            'social_platforms': metrics.get('social_platforms_count', 0),
+            'content_quality': round(metrics.get('content_volume_score', 0), 1),
+            'technical_health': metrics.get('overall_technical_health', 0),
+            'user_experience': metrics.get('overall_user_experience', 0),
+            'word_count': metrics.get('word_count', 0),
+            'seo_score': metrics.get('seo_score', 0)
+        }
+
+    def _build_summary_request(self, context: Dict) -> Dict:
+        """Build the chat completion arguments for the AI executive summary"""
+        return {
+            'model': self.CONFIG['openai_model'],
+            'messages': self._build_summary_messages(context),
+            'max_tokens': self.CONFIG['max_tokens'],
+            'temperature': self.CONFIG['temperature']
+        }
+
+    def _build_summary_messages(self, context: Dict) -> List[Dict]:
+        """
+        Build the chat messages for the AI executive summary
+        """
+        # Compact JSON keeps the prompt small; input tokens dominate time-to-first-token
+        prompt = (
+            f"Write a 2-3 sentence executive marketing summary (under {self.CONFIG['max_summary_length']} characters). "
+            "Lead with the strongest metric, cite 1-2 numbers and name one key improvement. "
+            f"Data: {json.dumps(context, separators=(',', ':'))}"
+        )
+
+        messages = [
+            {"role": "system", "content": _SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+
+        # Rough token estimate: ~4 characters per token
+        prompt_tokens = sum(len(message['content']) for message in messages) // 4
+        logger.debug(f"AI summary prompt is ~{prompt_tokens} tokens")
+
+        return messages
+
+    def _generate_template_based_summary(self, ctx: ReportContext, metrics: Dict) -> str:
+        """
+        Generate summary using intelligent templates when AI is not available
+        """
+        company_name = ctx.company_name
+        trust_score_val = ctx.trust_overall
+        page_speed = ctx.page_speed_score
+        social_count = ctx.social_platforms
 
         # Identify top strength
         strengths = []
-        if page_speed >= self.benchmarks['excellent_page_speed']:
+        if page_speed >= self.BENCHMARKS['excellent_page_speed']:
             strengths.append("exceptional loading performance")
-        elif website_data.get('has_ssl'):
+        elif ctx.has_ssl:
             strengths.append("strong security foundation")
-        elif social_count >= self.benchmarks['good_social_platforms']:
+        elif ctx.social_level == _SOCIAL_LEVEL_STRONG:
             strengths.append("comprehensive social media presence")
-        elif metrics.get('content_volume_score', 0) >= 80:
+        elif metrics['content_volume_score'] >= 80:
             strengths.append("rich content volume")
         else:
             strengths.append("solid technical foundation")
@@ -405,13 +1003,13 @@ class SummaryGenerator:
 
         # Identify top improvement opportunity
         improvements = []
-        if page_speed < self.benchmarks['min_page_speed']:
+        if page_speed < self.BENCHMARKS['min_page_speed']:
             improvements.append("page speed optimization")
-        elif not website_data.get('has_ssl'):
+        elif not ctx.has_ssl:
             improvements.append("SSL security implementation")
-        elif social_count < self.benchmarks['min_social_platforms']:
+        elif ctx.social_level == _SOCIAL_LEVEL_LIMITED:
             improvements.append("social media expansion")
-        elif metrics.get('word_count', 0) < self.benchmarks['min_word_count']:
+        elif ctx.word_count < self.BENCHMARKS['min_word_count']:
             improvements.append("content development")
         else:
             improvements.append("mobile optimization")
@@ -419,229 +1017,119 @@ class SummaryGenerator:
         top_improvement = improvements[0] if improvements else "continued optimization"
 
         # Generate summary based on performance level
-        summary_templates = {
-            "exceptional": f"{company_name} demonstrates {performance_desc} digital performance with a trust score of {trust_score_val}/10, highlighted by {top_strength}. The website maintains strong technical fundamentals across {social_count} social platforms. Strategic focus on {top_improvement} will further enhance market leadership position.",
-
-            "strong": f"{company_name} shows {performance_desc} digital presence with a {trust_score_val}/10 trust score, particularly excelling in {top_strength}. Current performance indicates solid market positioning with {social_count} active social channels. Implementing {top_improvement} represents the highest-impact improvement opportunity.",
+        return _template_summary(company_name, ctx.trust_level, trust_score_val, social_count,
+                                 top_strength, top_improvement)
 
-            "moderate": f"{company_name} maintains a {performance_desc} digital foundation with a {trust_score_val}/10 trust score and demonstrates {top_strength}. With presence across {social_count} social platforms, the brand shows growth potential. Prioritizing {top_improvement} will drive significant performance improvements.",
-
-            "developing": f"{company_name} is building its digital presence with a {trust_score_val}/10 trust score and shows promise in {top_strength}. Current {social_count}-platform social presence provides growth opportunities. Implementing {top_improvement} is critical for competitive positioning and user engagement."
-        }
-
-        return summary_templates.get(performance_level, summary_templates["moderate"])
-
-    def _extract_strategic_insights(self, data: Dict, metrics: Dict) -> List[str]:
+    def _extract_strategic_insights(self, ctx: ReportContext, metrics: Dict) -> List[str]:
         """
         Extract strategic insights based on comprehensive data analysis
         """
-        insights = []
-        website_data = data.get('website_data', {})
-        trust_score = data.get('trust_score', {})
-
-        # Trust score insights with specific recommendations
-        trust_val = trust_score.get('overall', 5.0)
-        if trust_val >= 8.5:
-            insights.append(
-                f"Exceptional trust score of {trust_val}/10 positions the brand as highly credible, providing strong competitive advantage for customer acquisition")
-        elif trust_val >= 7.0:
-            insights.append(
-                f"Strong trust score of {trust_val}/10 indicates solid customer confidence with opportunities to reach industry-leading levels")
-        elif trust_val >= 5.5:
-            insights.append(
-                f"Moderate trust score of {trust_val}/10 suggests mixed signals to potential customers, requiring strategic reputation management")
-        else:
-            insights.append(
-                f"Trust score of {trust_val}/10 indicates significant credibility challenges that may impact conversion rates and customer acquisition")
-
-        # Technical performance insights
-        page_speed = metrics.get('page_speed_score', 0)
-        if page_speed >= 90:
-            insights.append(
-                f"Outstanding page speed performance ({page_speed}/100) enhances user experience and supports strong SEO rankings")
-        elif page_speed >= 70:
-            insights.append(
-                f"Good page speed ({page_speed}/100) provides competitive advantage, with optimization potential for mobile performance")
-        elif page_speed < 50:
-            insights.append(
-                f"Page speed score ({page_speed}/100) significantly below industry standards, likely impacting user engagement and search rankings")
-
-        # Mobile optimization insights
-        if metrics.get('mobile_friendly'):
-            insights.append(
-                "Mobile-responsive design aligns with mobile-first indexing requirements and growing mobile traffic trends")
-        else:
-            insights.append(
-                "Missing mobile optimization represents critical risk given 60%+ mobile traffic share across most industries")
-
-        # Content strategy insights
-        word_count = metrics.get('word_count', 0)
-        content_score = metrics.get('content_volume_score', 0)
-        if content_score >= 80:
-            insights.append(
-                f"Rich content volume ({word_count} words) supports comprehensive SEO strategy and user education")
-        elif word_count < 300:
-            insights.append(
-                f"Limited content volume ({word_count} words) constrains SEO potential and user engagement opportunities")
-
-        # Security insights
-        if website_data.get('has_ssl'):
-            insights.append(
-                "SSL security implementation meets modern standards and supports user trust and search engine requirements")
-        else:
-            insights.append(
-                "Missing SSL certificate creates security warnings that directly impact user trust and search engine rankings")
-
-        # Social presence strategic insights
-        social_count = metrics.get('social_platforms_count', 0)
-        if social_count >= 4:
-            insights.append(
-                f"Strong social media presence across {social_count} platforms creates multiple customer touchpoints for brand building")
-        elif social_count <= 1:
-            insights.append(
-                f"Limited social presence ({social_count} platforms) misses significant opportunities for audience engagement and brand awareness")
+        insights = _strategic_insights(
+            ctx.trust_level, ctx.trust_overall,
+            ctx.page_speed_score, ctx.mobile_friendly,
+            ctx.word_count, metrics['content_volume_score'] >= 80,
+            ctx.has_ssl, ctx.social_level, ctx.social_platforms
+        )
 
         # Return top insights based on priority
-        return insights[:self.config['max_insights']]
+        return list(insights[:self.CONFIG['max_insights']])
 
-    def _identify_performance_highlights(self, data: Dict, metrics: Dict) -> List[str]:
+    def _identify_performance_highlights(self, ctx: ReportContext, metrics: Dict) -> List[str]:
         """
         Identify and highlight top-performing areas
         """
-        highlights = []
+        return list(itertools.islice(self._iter_performance_highlights(ctx, metrics), self.CONFIG['max_highlights']))
 
+    def _iter_performance_highlights(self, ctx: ReportContext, metrics: Dict) -> Iterator[str]:
+        """Yield performance highlights in priority order"""
         # Check each performance area against benchmarks
-        performance_areas = [
-            ('page_speed_score', 'Page Performance', 'excellent_page_speed', '/100'),
-            ('trust_score', 'Trust Score', 'excellent_trust_score', '/10'),
-            ('mobile_score', 'Mobile Optimization', 'good_page_speed', '%'),
-            ('security_score', 'Security Implementation', 'good_page_speed', '/100'),
-            ('social_presence_score', 'Social Media Presence', 'good_page_speed', '/100'),
-            ('content_volume_score', 'Content Quality', 'good_page_speed', '/100'),
-            ('technical_seo_score', 'Technical SEO', 'good_page_speed', '/100'),
-            ('accessibility_score', 'Accessibility', 'good_page_speed', '/100')
-        ]
+        for metric_key, display_name, excellent, strong, unit in _PERFORMANCE_AREA_THRESHOLDS:
+            score = metrics[metric_key]
 
-        for metric_key, display_name, benchmark_key, unit in performance_areas:
-            score = metrics.get(metric_key, 0)
-            benchmark = self.benchmarks.get(benchmark_key, 80)
-
-            if score >= benchmark:
-                highlights.append(f"Excellent {display_name} ({score}{unit})")
-            elif score >= benchmark * 0.8:  # Good performance (80% of excellent)
-                highlights.append(f"Strong {display_name} ({score}{unit})")
+            if score >= excellent:
+                yield f"Excellent {display_name} ({score}{unit})"
+            elif score >= strong:  # Good performance (80% of excellent)
+                yield f"Strong {display_name} ({score}{unit})"
 
         # Special highlights for specific achievements
-        website_data = data.get('website_data', {})
-
-        if website_data.get('structured_data'):
-            highlights.append(
-                f"Advanced SEO with {len(website_data['structured_data'])} structured data implementations")
+        if ctx.structured_data_count:
+            yield f"Advanced SEO with {ctx.structured_data_count} structured data implementations"
 
-        if metrics.get('internal_links_count', 0) > 10:
-            highlights.append(f"Well-structured internal linking ({metrics['internal_links_count']} internal links)")
+        if ctx.internal_links > 10:
+            yield f"Well-structured internal linking ({ctx.internal_links} internal links)"
 
-        if metrics.get('images_with_alt', 0) > metrics.get('images_without_alt', 0):
-            highlights.append("Good accessibility with comprehensive image alt text implementation")
+        if ctx.images_with_alt > ctx.images_without_alt:
+            yield "Good accessibility with comprehensive image alt text implementation"
 
-        return highlights[:self.config['max_highlights']]
-
-    def _prioritize_improvement_areas(self, data: Dict, metrics: Dict) -> List[str]:
+    def _prioritize_improvement_areas(self, ctx: ReportContext, metrics: Dict) -> List[str]:
         """
         Prioritize improvement areas based on impact and effort analysis
         """
-        improvements = []
-        website_data = data.get('website_data', {})
+        # Checks stop as soon as enough improvements have been found
+        return list(itertools.islice(self._iter_improvement_areas(ctx, metrics), self.CONFIG['max_improvements']))
 
+    def _iter_improvement_areas(self, ctx: ReportContext, metrics: Dict) -> Iterator[str]:
+        """Yield applicable improvement areas in priority order"""
         # High-impact, low-effort improvements (Priority 1)
-        if not website_data.get('has_ssl'):
-            improvements.append("🔒 Implement SSL certificate (High Impact, Low Effort) - Critical for security and SEO")
+        if not ctx.has_ssl:
+            yield _IMPROVEMENT_SSL
 
-        if metrics.get('page_speed_score', 0) < 60:
-            improvements.append(
-                "⚡ Optimize page loading speed (High Impact, Medium Effort) - Improve user experience and rankings")
+        if ctx.page_speed_score < 60:
+            yield _IMPROVEMENT_PAGE_SPEED
 
-        if not metrics.get('mobile_friendly'):
-            improvements.append(
-                "📱 Implement mobile-responsive design (High Impact, High Effort) - Essential for 60%+ mobile users")
+        if not ctx.mobile_friendly:
+            yield _IMPROVEMENT_MOBILE
 
         # Medium-impact improvements (Priority 2)
-        if metrics.get('word_count', 0) < 500:
-            improvements.append("📝 Expand content volume (Medium Impact, Medium Effort) - Enhance SEO and user value")
+        if ctx.word_count < 500:
+            yield _IMPROVEMENT_CONTENT
 
-        if metrics.get('images_without_alt', 0) > 0:
-            improvements.append(
-                f"🖼️ Add alt text to {metrics['images_without_alt']} images (Medium Impact, Low Effort) - Improve accessibility and SEO")
+        if ctx.images_without_alt > 0:
+            yield _IMPROVEMENT_ALT_TEXT.format(ctx.images_without_alt)
 
-        if metrics.get('social_platforms_count', 0) < 3:
-            improvements.append(
-                "📲 Expand social media presence (Medium Impact, Medium Effort) - Increase brand awareness")
+        if ctx.social_platforms < 3:
+            yield _IMPROVEMENT_SOCIAL
 
         # Technical improvements (Priority 3)
-        if not website_data.get('structured_data'):
-            improvements.append(
-                "🏷️ Implement structured data markup (Medium Impact, Medium Effort) - Enhance search appearance")
+        if not ctx.structured_data_count:
+            yield _IMPROVEMENT_STRUCTURED_DATA
 
-        if metrics.get('internal_links_count', 0) < 5:
-            improvements.append(
-                "🔗 Improve internal linking structure (Low Impact, Low Effort) - Better site navigation and SEO")
+        if ctx.internal_links < 5:
+            yield _IMPROVEMENT_INTERNAL_LINKS
 
         # Advanced improvements (Priority 4)
-        if metrics.get('accessibility_score', 0) < 80:
-            improvements.append(
-                "♿ Enhance accessibility features (Medium Impact, Medium Effort) - Expand audience reach")
-
-        return improvements[:self.config['max_improvements']]
+        if ctx.accessibility_score < 80:
+            yield _IMPROVEMENT_ACCESSIBILITY
 
-    def _analyze_competitive_position(self, data: Dict, metrics: Dict) -> Dict:
+    def _analyze_competitive_position(self, ctx: ReportContext, metrics: Dict) -> Dict:
         """
         Analyze competitive positioning with strategic recommendations
         """
-        trust_score = data.get('trust_score', {})
-        overall_score = trust_score.get('overall', 5.0)
+        overall_score = ctx.trust_overall
 
         # Calculate percentile based on trust score
         percentile = min(overall_score * 10, 100)
 
         # Determine competitive position
-        if overall_score >= 8.5:
-            position = "market_leader"
-            description = "Industry-leading digital presence with comprehensive competitive advantages"
-            strategy = "Maintain leadership through continuous innovation and emerging technology adoption"
-            market_share_potential = "High - Well-positioned for market expansion"
-        elif overall_score >= 7.0:
-            position = "strong_competitor"
-            description = "Strong competitive position with opportunities for market leadership"
-            strategy = "Focus on differentiating strengths while addressing key gaps to achieve market leadership"
-            market_share_potential = "Good - Ready for aggressive growth strategies"
-        elif overall_score >= 5.5:
-            position = "average_performer"
-            description = "Competitive parity with industry average, requiring strategic improvements"
-            strategy = "Implement comprehensive digital strategy focusing on high-impact improvements"
-            market_share_potential = "Moderate - Need strategic improvements for growth"
-        else:
-            position = "challenger"
-            description = "Below industry standards, requiring comprehensive digital transformation"
-            strategy = "Prioritize fundamental improvements in trust, performance, and user experience"
-            market_share_potential = "Limited - Focus on foundational improvements first"
+        position, description, strategy, market_share_potential = _COMPETITIVE_POSITIONS[ctx.trust_level]
 
         # Calculate competitive advantages and disadvantages
         strengths = []
         weaknesses = []
 
-        if metrics.get('page_speed_score', 0) >= 80:
+        if ctx.page_speed_score >= 80:
             strengths.append("Superior website performance")
-        elif metrics.get('page_speed_score', 0) < 60:
+        elif ctx.page_speed_score < 60:
             weaknesses.append("Below-average website performance")
 
-        if metrics.get('trust_score', 0) >= 8:
+        if ctx.trust_overall >= 8:
             strengths.append("Exceptional brand credibility")
-        elif metrics.get('trust_score', 0) < 6:
+        elif ctx.trust_overall < 6:
             weaknesses.append("Limited brand credibility")
 
-        if metrics.get('social_platforms_count', 0) >= 4:
+        if ctx.social_level == _SOCIAL_LEVEL_STRONG:
             strengths.append("Comprehensive social media presence")
-        elif metrics.get('social_platforms_count', 0) <= 1:
+        elif ctx.social_level == _SOCIAL_LEVEL_LIMITED:
             weaknesses.append("Insufficient social media engagement")
 
         return {
@@ -663,179 +1151,108 @@ class SummaryGenerator:
     # Helper methods for score calculations
     def _calculate_content_volume_score(self, word_count: int) -> float:
         """Calculate content volume score based on word count"""
-        if word_count >= self.benchmarks['excellent_word_count']:
-            return 100.0
-        elif word_count >= self.benchmarks['good_word_count']:
-            return 80.0
-        elif word_count >= self.benchmarks['min_word_count']:
-            return 60.0
-        else:
-            return max(20.0, (word_count / self.benchmarks['min_word_count']) * 60)
+        band = bisect.bisect_right(_WORD_COUNT_THRESHOLDS, word_count)
+        if band:
+            return _CONTENT_VOLUME_SCORES[band - 1]
+        return max(20.0, (word_count / _WORD_COUNT_THRESHOLDS[0]) * 60)
 
-    def _calculate_content_structure_score(self, website_data: Dict) -> float:
+    def _calculate_content_structure_score(self, ctx: ReportContext) -> float:
         """Calculate content structure quality score"""
-        score = 0.0
-        headings = website_data.get('heading_structure', {})
-
-        # H1 presence and uniqueness
-        h1_count = len(headings.get('h1', []))
-        if h1_count == 1:
-            score += 30.0  # Perfect H1 structure
-        elif h1_count == 0:
-            score += 0.0  # Missing H1
-        else:
-            score += 10.0  # Multiple H1s (not ideal)
-
-        # H2 structure
-        h2_count = len(headings.get('h2', []))
-        if h2_count >= 3:
-            score += 25.0
-        elif h2_count >= 1:
-            score += 15.0
-
-        # H3 and deeper structure
-        h3_count = len(headings.get('h3', []))
-        if h3_count >= 2:
-            score += 20.0
-        elif h3_count >= 1:
-            score += 10.0
+        # H1 presence and uniqueness, H2 structure, H3 and deeper structure
+        score = (_H1_STRUCTURE_SCORES[min(ctx.h1_count, 2)]
+                 + _H2_STRUCTURE_SCORES[min(ctx.h2_count, 3)]
+                 + _H3_STRUCTURE_SCORES[min(ctx.h3_count, 2)])
 
         # Title and description presence
-        if website_data.get('title'):
+        if ctx.title_length:
             score += 15.0
-        if website_data.get('description'):
+        if ctx.description_length:
             score += 10.0
 
         return min(score, 100.0)
 
-    def _calculate_image_optimization_score(self, images_data: Dict) -> float:
+    def _calculate_image_optimization_score(self, ctx: ReportContext) -> float:
         """Calculate image optimization score"""
-        if not images_data:
+        total_images = ctx.image_count
+        if not total_images:
             return 50.0  # No images to optimize
 
-        total_images = images_data.get('total_count', 0)
-        if total_images == 0:
-            return 50.0
-
-        with_alt = images_data.get('with_alt_text', 0)
-        alt_percentage = (with_alt / total_images) * 100
+        images_with_alt = ctx.images_with_alt
+        if images_with_alt >= total_images:
+            return 100.0  # Every image has alt text
 
-        return min(alt_percentage, 100.0)
+        return (images_with_alt / total_images) * 100
 
-    def _calculate_technical_seo_score(self, website_data: Dict, seo_data: Dict) -> float:
+    def _calculate_technical_seo_score(self, ctx: ReportContext) -> float:
         """Calculate technical SEO score"""
         score = 0.0
 
         # SSL certificate (20 points)
-        if website_data.get('has_ssl'):
+        if ctx.has_ssl:
             score += 20.0
 
         # Robots.txt (15 points)
-        if seo_data.get('robots_txt'):
+        if ctx.seo_robots_txt:
             score += 15.0
 
         # Sitemap (15 points)
-        if seo_data.get('sitemap_xml'):
+        if ctx.seo_sitemap_xml:
             score += 15.0
 
         # Canonical URL (10 points)
-        if website_data.get('canonical_url'):
+        if ctx.has_canonical_url:
             score += 10.0
 
         # Structured data (20 points)
-        structured_data = website_data.get('structured_data', [])
-        if structured_data:
-            score += min(len(structured_data) * 5, 20.0)
+        if ctx.structured_data_count:
+            score += min(ctx.structured_data_count * 5, 20.0)
 
         # Meta tags (20 points)
-        if website_data.get('title'):
+        if ctx.title_length:
             score += 10.0
-        if website_data.get('description'):
+        if ctx.description_length:
             score += 10.0
 
         return min(score, 100.0)
 
-    def _calculate_on_page_seo_score(self, website_data: Dict) -> float:
+    def _calculate_on_page_seo_score(self, ctx: ReportContext) -> float:
         """Calculate on-page SEO score"""
         score = 0.0
 
         # Title optimization (25 points)
-        title = website_data.get('title', '')
-        if title:
-            title_length = len(title)
-            if 30 <= title_length <= 60:
-                score += 25.0
-            elif title_length > 0:
-                score += 15.0
+        title_length = ctx.title_length
+        score += _TITLE_SCORES[(title_length > 0) + (30 <= title_length <= 60)]
 
         # Meta description (25 points)
-        description = website_data.get('description', '')
-        if description:
-            desc_length = len(description)
-            if 120 <= desc_length <= 160:
-                score += 25.0
-            elif desc_length > 0:
-                score += 15.0
+        desc_length = ctx.description_length
+        score += _DESCRIPTION_SCORES[(desc_length > 0) + (120 <= desc_length <= 160)]
 
         # Heading structure (30 points)
-        headings = website_data.get('heading_structure', {})
-        if headings.get('h1'):
+        if ctx.h1_count:
             score += 15.0
-        if headings.get('h2'):
+        if ctx.h2_count:
             score += 10.0
-        if headings.get('h3'):
+        if ctx.h3_count:
             score += 5.0
 
         # Internal linking (20 points)
-        links = website_data.get('links', {})
-        internal_links = links.get('internal_links', 0)
-        if internal_links >= 10:
-            score += 20.0
-        elif internal_links >= 5:
-            score += 15.0
-        elif internal_links >= 1:
-            score += 10.0
+        score += _bucket(ctx.internal_links, _INTERNAL_LINK_SEO_THRESHOLDS, _INTERNAL_LINK_SEO_SCORES)
 
         return min(score, 100.0)
 
     def _calculate_social_presence_score(self, social_count: int) -> float:
         """Calculate social media presence score"""
-        if social_count >= self.benchmarks['excellent_social_platforms']:
-            return 100.0
-        elif social_count >= self.benchmarks['good_social_platforms']:
-            return 80.0
-        elif social_count >= self.benchmarks['min_social_platforms']:
-            return 60.0
-        elif social_count >= 1:
-            return 40.0
-        else:
-            return 0.0
+        return _bucket(social_count, _SOCIAL_PRESENCE_THRESHOLDS, _SOCIAL_PRESENCE_SCORES)
 
-    def _calculate_security_score(self, website_data: Dict) -> float:
+    def _calculate_security_score(self, ctx: ReportContext) -> float:
         """Calculate security score"""
-        score = 0.0
-
-        # SSL certificate (50 points)
-        if website_data.get('has_ssl'):
-            score += 50.0
-
-        # Secure headers and best practices (would need more detailed analysis)
-        # For now, base on available data
-
-        # No mixed content (10 points) - assume good if SSL is present
-        if website_data.get('has_ssl'):
-            score += 10.0
-
-        # Modern protocols (10 points) - assume good for HTTPS sites
-        if website_data.get('has_ssl'):
-            score += 10.0
+        # SSL certificate (50 points), plus no mixed content (10 points) and
+        # modern protocols (10 points), both assumed good for HTTPS sites.
+        # Secure headers would need more detailed analysis
+        score = 70.0 * ctx.has_ssl
 
         # Contact information availability (security through transparency) (20 points)
-        contact_info = website_data.get('contact_info', {})
-        if contact_info.get('has_email'):
-            score += 10.0
-        if contact_info.get('has_phone'):
-            score += 10.0
+        score += 10.0 * ctx.has_email + 10.0 * ctx.has_phone
 
         # Privacy policy indicators (10 points)
         # This would need content analysis - placeholder
@@ -843,134 +1260,82 @@ class SummaryGenerator:
 
         return min(score, 100.0)
 
-    def _calculate_user_experience_score(self, website_data: Dict, seo_data: Dict) -> float:
+    def _calculate_user_experience_score(self, ctx: ReportContext) -> float:
         """Calculate user experience score"""
         score = 0.0
 
         # Mobile friendliness (30 points)
-        mobile_data = seo_data.get('mobile_friendly', {})
-        if mobile_data.get('mobile_friendly'):
+        if ctx.mobile_friendly:
             score += 30.0
 
         # Loading speed (25 points)
-        response_time = website_data.get('response_time', 5.0)
-        if response_time < 1.0:
-            score += 25.0
-        elif response_time < 2.0:
-            score += 20.0
-        elif response_time < 3.0:
-            score += 15.0
-        elif response_time < 5.0:
-            score += 10.0
+        response_time = ctx.response_time if ctx.response_time is not None else 5.0
+        score += _bucket(response_time, _RESPONSE_TIME_UX_THRESHOLDS, _RESPONSE_TIME_UX_SCORES)
 
         # Navigation structure (20 points)
-        links = website_data.get('links', {})
-        internal_links = links.get('internal_links', 0)
-        if internal_links >= 10:
-            score += 20.0
-        elif internal_links >= 5:
-            score += 15.0
-        elif internal_links >= 2:
-            score += 10.0
+        score += _bucket(ctx.internal_links, _NAVIGATION_LINK_THRESHOLDS, _NAVIGATION_LINK_SCORES)
 
         # Content accessibility (15 points)
-        accessibility = website_data.get('accessibility_features', {})
-        if accessibility.get('has_lang_attribute'):
+        if ctx.has_lang_attribute:
             score += 5.0
-        if accessibility.get('images_with_alt', 0) > 0:
+        if ctx.accessible_images > 0:
             score += 10.0
 
         # Contact accessibility (10 points)
-        contact_info = website_data.get('contact_info', {})
-        if contact_info.get('has_email') or contact_info.get('has_phone'):
-            score += 10.0
+        score += 10.0 * (ctx.has_email or ctx.has_phone)
 
         return min(score, 100.0)
 
     def _convert_loading_time_to_score(self, response_time: float) -> float:
         """Convert loading time to a 0-100 score"""
-        if response_time <= 1.0:
-            return 100.0
-        elif response_time <= 2.0:
-            return 85.0
-        elif response_time <= 3.0:
-            return 70.0
-        elif response_time <= 4.0:
-            return 55.0
-        elif response_time <= 5.0:
-            return 40.0
-        else:
-            return max(10.0, 40.0 - (response_time - 5.0) * 5)
+        band = bisect.bisect_left(_LOADING_TIME_THRESHOLDS, response_time)
+        if band < len(_LOADING_TIME_SCORES):
+            return _LOADING_TIME_SCORES[band]
+        return max(10.0, 40.0 - (response_time - 5.0) * 5)
 
-    def _calculate_competitive_advantage(self, data: Dict) -> float:
+    def _calculate_competitive_advantage(self, ctx: ReportContext) -> float:
         """Calculate competitive advantage score"""
-        trust_score = data.get('trust_score', {})
-        website_data = data.get('website_data', {})
-
         # Base score from trust score
-        base_score = trust_score.get('overall', 5.0) * 10
-
-        # Bonus points for differentiating factors
-        bonus = 0.0
-
-        # Advanced technology implementation
-        technologies = website_data.get('technologies', [])
-        modern_tech = ['React', 'Vue', 'Angular', 'Next.js']
-        if any(tech in technologies for tech in modern_tech):
-            bonus += 10.0
+        base_score = ctx.trust_overall * 10
 
-        # Comprehensive social presence
-        social_count = len(website_data.get('social_links', {}))
-        if social_count >= 5:
-            bonus += 10.0
-
-        # Advanced SEO implementation
-        if website_data.get('structured_data'):
-            bonus += 10.0
+        # Bonus points for differentiating factors: advanced technology
+        # implementation, comprehensive social presence and advanced SEO
+        bonus = (10.0 * ctx.has_modern_tech
+                 + 10.0 * (ctx.social_platforms >= 5)
+                 + 10.0 * bool(ctx.structured_data_count))
 
         return min(base_score + bonus, 100.0)
 
-    def _calculate_weighted_average(self, weighted_scores: List[tuple]) -> float:
-        """Calculate weighted average from list of (score, weight) tuples"""
-        if not weighted_scores:
-            return 0.0
-
-        total_weighted = sum(score * weight for score, weight in weighted_scores)
-        total_weights = sum(weight for _, weight in weighted_scores)
-
-        if total_weights == 0:
-            return 0.0
-
-        return round(total_weighted / total_weights, 1)
-
-    def _assess_growth_potential(self, data: Dict, metrics: Dict) -> Dict:
+    def _assess_growth_potential(self, ctx: ReportContext, metrics: Dict) -> Dict:
         """Assess growth potential based on current performance and gaps"""
-        trust_score = metrics.get('trust_score', 5.0)
+        current_score = ctx.trust_overall
         gaps = []
         potential_impact = 0.0
 
         # Identify high-impact growth opportunities
-        if metrics.get('page_speed_score', 0) < 80:
+        if ctx.page_speed_score < 80:
             gaps.append("Performance optimization")
             potential_impact += 1.5
 
-        if not metrics.get('mobile_friendly'):
+        if not ctx.mobile_friendly:
             gaps.append("Mobile optimization")
             potential_impact += 2.0
 
-        if metrics.get('social_platforms_count', 0) < 3:
+        if ctx.social_platforms < 3:
             gaps.append("Social media expansion")
             potential_impact += 1.0
 
-        if metrics.get('content_volume_score', 0) < 70:
+        if metrics['content_volume_score'] < 70:
             gaps.append("Content development")
             potential_impact += 1.2
 
         # Calculate growth potential score
         max_potential = 10.0
-        current_score = trust_score
         growth_ceiling = min(max_potential, current_score + potential_impact)
-        growth_percentage = ((growth_ceiling - current_score) / current_score) * 100
+        if current_score:
+            growth_percentage = ((growth_ceiling - current_score) / current_score) * 100
+        else:
+            growth_percentage = 0.0
 
         return {
             'current_score': current_score,
@@ -981,87 +1346,75 @@ class SummaryGenerator:
             'investment_level': self._estimate_investment_level(gaps)
         }
 
-    def _identify_risk_factors(self, data: Dict, metrics: Dict) -> List[str]:
+    def _identify_risk_factors(self, ctx: ReportContext, metrics: Dict) -> List[str]:
         """Identify potential risk factors that could impact performance"""
-        risks = []
-        website_data = data.get('website_data', {})
+        # Return top 4 risks
+        return list(itertools.islice(self._iter_risk_factors(ctx), _MAX_RISK_FACTORS))
 
+    def _iter_risk_factors(self, ctx: ReportContext) -> Iterator[str]:
+        """Yield applicable risk factors in priority order"""
         # Security risks
-        if not website_data.get('has_ssl'):
-            risks.append("🔒 Security Risk: Missing SSL certificate may deter users and impact search rankings")
+        if not ctx.has_ssl:
+            yield _RISK_SSL
 
         # Performance risks
-        if metrics.get('page_speed_score', 0) < 50:
-            risks.append("⚡ Performance Risk: Slow loading times significantly impact user experience and conversions")
+        if ctx.page_speed_score < 50:
+            yield _RISK_PERFORMANCE
 
         # Mobile risks
-        if not metrics.get('mobile_friendly'):
-            risks.append("📱 Mobile Risk: Non-responsive design alienates 60%+ of mobile users")
+        if not ctx.mobile_friendly:
+            yield _RISK_MOBILE
 
         # Content risks
-        if metrics.get('word_count', 0) < 200:
-            risks.append("📝 Content Risk: Insufficient content limits SEO potential and user engagement")
+        if ctx.word_count < 200:
+            yield _RISK_CONTENT
 
         # Reputation risks
-        if metrics.get('trust_score', 5.0) < 4.0:
-            risks.append("⭐ Reputation Risk: Low trust score may significantly impact customer acquisition")
+        if ctx.trust_overall < 4.0:
+            yield _RISK_REPUTATION
 
         # Technical risks
-        if not website_data.get('has_robots_txt') and not website_data.get('has_sitemap'):
-            risks.append("🔧 Technical Risk: Missing fundamental SEO infrastructure")
-
-        return risks[:4]  # Return top 4 risks
+        if not ctx.has_robots_txt and not ctx.has_sitemap:
+            yield _RISK_TECHNICAL
 
-    def _identify_market_opportunities(self, data: Dict, metrics: Dict) -> List[str]:
+    def _identify_market_opportunities(self, ctx: ReportContext, metrics: Dict) -> List[str]:
         """Identify market opportunities based on analysis"""
-        opportunities = []
-        website_data = data.get('website_data', {})
+        return list(itertools.islice(self._iter_market_opportunities(ctx, metrics), _MAX_MARKET_OPPORTUNITIES))
 
+    def _iter_market_opportunities(self, ctx: ReportContext, metrics: Dict) -> Iterator[str]:
+        """Yield applicable market opportunities in priority order"""
         # Content opportunities
-        if metrics.get('content_volume_score', 0) < 80:
-            opportunities.append(
-                "📝 Content Marketing: Develop comprehensive content strategy to capture long-tail keywords")
+        if metrics['content_volume_score'] < 80:
+            yield _OPPORTUNITY_CONTENT
 
         # Social opportunities
-        if metrics.get('social_platforms_count', 0) < 4:
-            opportunities.append("📲 Social Expansion: Establish presence on untapped platforms for audience growth")
+        if ctx.social_platforms < 4:
+            yield _OPPORTUNITY_SOCIAL
 
         # Technical opportunities
-        if not website_data.get('structured_data'):
-            opportunities.append("🏷️ Rich Snippets: Implement structured data for enhanced search appearance")
+        if not ctx.structured_data_count:
+            yield _OPPORTUNITY_RICH_SNIPPETS
 
         # Performance opportunities
-        if metrics.get('page_speed_score', 0) < 90:
-            opportunities.append("⚡ Performance Edge: Optimize for superior loading speeds to outperform competitors")
+        if ctx.page_speed_score < 90:
+            yield _OPPORTUNITY_PERFORMANCE
 
         # Local opportunities (if applicable)
-        contact_info = website_data.get('contact_info', {})
-        if contact_info.get('has_address'):
-            opportunities.append("📍 Local SEO: Leverage location-based optimization for regional dominance")
-
-        return opportunities[:4]
+        if ctx.has_address:
+            yield _OPPORTUNITY_LOCAL_SEO
 
     def _calculate_overall_performance_score(self, metrics: Dict) -> float:
         """Calculate overall performance score from all metrics"""
         # Weight the most important factors
-        weighted_scores = [
-            (metrics.get('trust_score', 5.0) * 10, 0.25),  # Trust score (convert to 0-100)
-            (metrics.get('page_speed_score', 0), 0.20),
-            (metrics.get('overall_user_experience', 0), 0.15),
-            (metrics.get('social_presence_score', 0), 0.10),
-            (metrics.get('security_score', 0), 0.15),
-            (metrics.get('content_volume_score', 0), 0.10),
-            (metrics.get('technical_seo_score', 0), 0.05)
-        ]
+        weighted_total = 0.0
+        for metric, default, scale, weight in _OVERALL_PERFORMANCE_SPEC:
+            weighted_total += metrics.get(metric, default) * scale * weight
 
-        return self._calculate_weighted_average(weighted_scores)
+        return round(weighted_total / _OVERALL_PERFORMANCE_WEIGHT_TOTAL, 1)
 
     def _generate_month_over_month_analysis(self, metrics: Dict) -> Dict:
         """Generate month-over-month analysis (simulated for now)"""
         # In production, this would compare with historical data
-        # For now, generate realistic simulated changes
-        import random
-
         return {
             'traffic_change': '+0%',  # Would need historical data
             'trust_score_change': '+0.0',
@@ -1078,52 +1431,25 @@ class SummaryGenerator:
         benchmarks = {}
 
         # Performance benchmarking
-        for metric, value in metrics.items():
-            if metric.endswith('_score'):
-                if value >= 90:
-                    benchmark = 'Excellent - Top 10%'
-                elif value >= 80:
-                    benchmark = 'Good - Top 25%'
-                elif value >= 60:
-                    benchmark = 'Average - Industry Standard'
-                elif value >= 40:
-                    benchmark = 'Below Average - Improvement Needed'
-                else:
-                    benchmark = 'Poor - Immediate Action Required'
-
-                benchmarks[metric] = {
-                    'score': value,
-                    'benchmark': benchmark,
-                    'percentile': min(value, 100)
-                }
+        for metric in _BENCHMARKED_SCORES:
+            value = metrics.get(metric)
+            if value is None:
+                continue
+
+            benchmarks[metric] = {
+                'score': value,
+                'benchmark': _bucket(value, _INDUSTRY_BENCHMARK_THRESHOLDS, _INDUSTRY_BENCHMARK_LABELS),
+                'percentile': min(value, 100)
+            }
 
         return benchmarks
 
-    def _count_data_sources(self, data: Dict) -> int:
-        """Count the number of data sources used in analysis"""
-        sources = 0
-        if data.get('website_data'):
-            sources += 1
-        if data.get('seo_data'):
-            sources += 1
-        if data.get('social_data'):
-            sources += 1
-        if data.get('reputation_data'):
-            sources += 1
-        if data.get('competitor_data'):
-            sources += 1
-        return sources
-
-    def _calculate_confidence_score(self, data: Dict) -> float:
+    def _calculate_confidence_score(self, ctx: ReportContext) -> float:
         """Calculate confidence score based on data completeness"""
-        total_sources = 5  # website, seo, social, reputation, competitor
-        available_sources = self._count_data_sources(data)
-
-        base_confidence = (available_sources / total_sources) * 100
+        base_confidence = (ctx.data_sources_count / len(_DATA_SOURCE_KEYS)) * 100
 
         # Adjust based on data quality
-        website_data = data.get('website_data', {})
-        if website_data.get('error'):
+        if ctx.website_error:
             base_confidence -= 20
 
         # Bonus for AI enhancement
@@ -1143,9 +1469,7 @@ class SummaryGenerator:
 
     def _estimate_investment_level(self, gaps: List[str]) -> str:
         """Estimate investment level required for improvements"""
-        high_effort_items = ['Mobile optimization', 'Performance optimization']
-
-        if any(item in gaps for item in high_effort_items):
+        if not _HIGH_EFFORT_GAPS.isdisjoint(gaps):
             return "Medium to High"
         elif len(gaps) > 3:
             return "Medium"
@@ -1,3 +1,540 @@
-from django.test import TestCase
+import json
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from .growth_analyzer import GrowthAnalyzer, _DUPLICATE_TOPICS, _JSONArrayStreamParser, _result_cache_key
+from .openai_client import _pending_file_lock, append_batch_request, submit_batch
+from .summary_generator import ReportContext, SummaryGenerator
+from .trust_score import TrustScoreCalculator
+
+
+# Reference implementations of the original if/elif logic, used to check
+# the table lookups that replaced it at and around every edge
+
+def _baseline_response_time_adjustment(response_time):
+    if response_time < 1.0:
+        return 2.5
+    elif response_time < 2.0:
+        return 2.0
+    elif response_time < 3.0:
+        return 1.0
+    elif response_time > 5.0:
+        return -2.0
+    return 0.0
+
+
+def _baseline_quality_word_count_points(word_count):
+    if word_count > 500:
+        return 1.5
+    elif word_count > 200:
+        return 1.0
+    return 0.0
+
+
+def _baseline_presence_points(word_count, external_links):
+    points = 0.0
+    if word_count > 1000:
+        points += 2.0
+    elif word_count > 500:
+        points += 1.0
+    if external_links > 5:
+        points += 1.0
+    elif external_links > 2:
+        points += 0.5
+    return points
+
+
+def _baseline_legitimacy_explanation(score):
+    if score >= 8:
+        return "Excellent - Strong indicators of business legitimacy"
+    elif score >= 6:
+        return "Good - Most legitimacy indicators present"
+    elif score >= 4:
+        return "Fair - Some legitimacy concerns"
+    return "Poor - Multiple legitimacy issues detected"
+
+
+def _baseline_finalize_summary_text(summary_text, max_length):
+    if len(summary_text) > max_length:
+        sentences = summary_text.split('. ')
+        summary_text = '. '.join(sentences[:2]) + '.'
+    return summary_text
+
+
+def _recommendation(title, category='technical', priority='medium'):
+    return {'title': title, 'category': category, 'priority': priority}
+
+
+def _recommendations_content(*titles):
+    """Enhancement response content listing recommendations with the given titles"""
+    return json.dumps({'recommendations': [{'title': title} for title in titles]})
+
+
+def _completion_line(custom_id, content):
+    return json.dumps({
+        'custom_id': custom_id,
+        'response': {'body': {'choices': [{'message': {'content': content}}]}}
+    })
+
+
+def _fake_batch_client(output_lines, status='completed'):
+    """OpenAI client stand-in serving one finished batch with the given output lines"""
+    return SimpleNamespace(
+        batches=SimpleNamespace(
+            retrieve=lambda batch_id: SimpleNamespace(status=status, output_file_id='file-out')
+        ),
+        files=SimpleNamespace(
+            content=lambda file_id: SimpleNamespace(text='\n'.join(output_lines))
+        )
+    )
+
+
+def _fake_chat_client(create):
+    """OpenAI client stand-in whose chat completions are served by create(**kwargs)"""
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+@override_settings(OPENAI_API_KEY='')
+class BatchRoutingTests(SimpleTestCase):
+    def setUp(self):
+        batch_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(batch_dir.cleanup)
+        settings_override = override_settings(OPENAI_BATCH_DIR=batch_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_growth_results_routed_by_custom_id(self):
+        analyzer = GrowthAnalyzer()
+        analyzer.client = _fake_batch_client([
+            _completion_line('report-1', _recommendations_content('One')),
+            _completion_line('report-2', _recommendations_content('Two', 'Three')),
+            _completion_line('report-3', 'not json')
+        ])
+
+        results = analyzer.collect_batch_results('batch-1')
+
+        self.assertEqual(
+            {job_id: [rec['title'] for rec in recommendations] for job_id, recommendations in results.items()},
+            {'report-1': ['One'], 'report-2': ['Two', 'Three']}
+        )
+
+    def test_summary_results_routed_by_custom_id(self):
+        generator = SummaryGenerator()
+        generator.client = _fake_batch_client([
+            _completion_line('report-1', ' First summary. '),
+            _completion_line('report-2', 'Second summary.'),
+            _completion_line('report-3', '')
+        ])
+
+        results = generator.collect_batch_results('batch-1')
+
+        self.assertEqual(results, {'report-1': 'First summary.', 'report-2': 'Second summary.'})
+
+    def test_running_batch_returns_none(self):
+        analyzer = GrowthAnalyzer()
+        analyzer.client = _fake_batch_client([], status='in_progress')
+
+        self.assertIsNone(analyzer.collect_batch_results('batch-1'))
+
+    def test_failed_batch_raises(self):
+        analyzer = GrowthAnalyzer()
+        analyzer.client = _fake_batch_client([], status='failed')
+
+        with self.assertRaises(RuntimeError):
+            analyzer.collect_batch_results('batch-1')
+
+    def test_submit_keeps_last_request_per_custom_id(self):
+        uploaded = []
+        client = SimpleNamespace(
+            files=SimpleNamespace(
+                create=lambda file, purpose: uploaded.append(file.read()) or SimpleNamespace(id='file-in')
+            ),
+            batches=SimpleNamespace(create=lambda **kwargs: SimpleNamespace(id='batch-1'))
+        )
+        append_batch_request('test_pending.jsonl', 'report-1', {'attempt': 1})
+        append_batch_request('test_pending.jsonl', 'report-2', {'attempt': 1})
+        append_batch_request('test_pending.jsonl', 'report-1', {'attempt': 2})
+
+        self.assertEqual(submit_batch(client, 'test_pending.jsonl'), 'batch-1')
+
+        requests = [json.loads(line) for line in uploaded[0].splitlines()]
+        self.assertEqual(
+            [(request['custom_id'], request['body']['attempt']) for request in requests],
+            [('report-2', 1), ('report-1', 2)]
+        )
+        self.assertIsNone(submit_batch(client, 'test_pending.jsonl'))
+
+    def test_append_waits_while_pending_file_is_locked(self):
+        pending_path = Path(settings.OPENAI_BATCH_DIR) / 'test_pending.jsonl'
+
+        with _pending_file_lock(pending_path):
+            append = threading.Thread(target=append_batch_request, args=('test_pending.jsonl', 'report-1', {}))
+            append.start()
+            append.join(0.2)
+            self.assertTrue(append.is_alive())
+            self.assertFalse(pending_path.exists())
+
+        append.join()
+        self.assertTrue(pending_path.exists())
+
+
+class JSONArrayStreamParserTests(SimpleTestCase):
+    RESPONSE = json.dumps({'recommendations': [
+        {'title': 'Fix "broken" links', 'description': 'Paths like C:\\site\\ and [brackets], {braces}'},
+        {'title': 'Add alt text \u2013 images', 'priority': 'high'},
+        {'title': 'Unicode \\u escapes', 'description': 'Line one\nline two'}
+    ]})
+
+    def _parse_in_chunks(self, chunk_size):
+        parser = _JSONArrayStreamParser()
+        items = []
+        for start in range(0, len(self.RESPONSE), chunk_size):
+            items.extend(parser.feed(self.RESPONSE[start:start + chunk_size]))
+        return items
+
+    def test_matches_full_parse_for_every_chunk_size(self):
+        expected = json.loads(self.RESPONSE)['recommendations']
+        for chunk_size in range(1, len(self.RESPONSE) + 1):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self._parse_in_chunks(chunk_size), expected)
+
+    def test_split_inside_escape_sequence(self):
+        text = '{"recommendations": [{"title": "Say \\"hi\\""}]}'
+        split_at = text.index('\\') + 1
+        parser = _JSONArrayStreamParser()
+
+        self.assertEqual(parser.feed(text[:split_at]), [])
+        self.assertEqual(parser.feed(text[split_at:]), [{'title': 'Say "hi"'}])
+
+    def test_elements_returned_before_array_closes(self):
+        parser = _JSONArrayStreamParser()
+
+        self.assertEqual(parser.feed('{"recommendations": [{"title": "a"}, {"ti'), [{'title': 'a'}])
+        self.assertEqual(parser.feed('tle": "b"}'), [{'title': 'b'}])
+        self.assertEqual(parser.feed(']}'), [])
+
+
+@override_settings(OPENAI_API_KEY='')
+class RecommendationResultCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.analyzer = GrowthAnalyzer()
+        self.analyzer.openai_available = True
+
+    def _data(self, domain):
+        return {'website_data': {'domain': domain, 'response_time': 6.0, 'word_count': 100}}
+
+    def test_rule_based_result_not_cached_when_ai_fails(self):
+        def create(**kwargs):
+            raise RuntimeError('OpenAI unavailable')
+
+        self.analyzer.client = _fake_chat_client(create)
+        data = self._data('ai-down.example')
+
+        recommendations = self.analyzer.generate_recommendations(data)
+
+        self.assertTrue(recommendations)
+        self.assertFalse(any(rec['ai_enhanced'] for rec in recommendations))
+        self.assertIsNone(cache.get(_result_cache_key(data, True)))
+
+    def test_result_cached_when_ai_succeeds(self):
+        content = json.dumps({'recommendations': [{'title': 'AI idea', 'category': 'seo', 'priority': 'high'}]})
+        self.analyzer.client = _fake_chat_client(
+            lambda **kwargs: SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+        )
+        data = self._data('ai-up.example')
+
+        recommendations = self.analyzer.generate_recommendations(data)
+
+        self.assertIn('AI idea', [rec['title'] for rec in recommendations])
+        self.assertEqual(cache.get(_result_cache_key(data, True)), recommendations)
+
+
+@override_settings(OPENAI_API_KEY='')
+class RecommendationStreamTests(SimpleTestCase):
+    def setUp(self):
+        self.analyzer = GrowthAnalyzer()
+        self.analyzer.openai_available = True
+
+    def test_rule_failure_streams_fallback_without_ai(self):
+        requests = []
+        self.analyzer.client = _fake_chat_client(lambda **kwargs: requests.append(kwargs))
+
+        with mock.patch.object(self.analyzer, '_generate_rule_based_recommendations',
+                               side_effect=ValueError('bad input')):
+            recommendations = list(self.analyzer.generate_recommendations_stream({}))
+
+        self.assertEqual(recommendations, self.analyzer._get_fallback_recommendations())
+        self.assertEqual(requests, [])
+
+
+class DeduplicateRecommendationsTests(SimpleTestCase):
+    def setUp(self):
+        self.analyzer = GrowthAnalyzer()
+
+    def test_distinct_recommendations_unchanged(self):
+        recommendations = [
+            _recommendation('Optimize Page Loading Speed'),
+            _recommendation('Optimize Title Tags', category='seo'),
+            _recommendation('Optimize for Local SEO', category='seo')
+        ]
+
+        self.assertEqual(self.analyzer._deduplicate_recommendations(recommendations), recommendations)
+
+    def test_same_topic_keeps_higher_priority_in_first_position(self):
+        low = _recommendation('Improve Mobile Experience now', priority='low')
+        other = _recommendation('Add SSL Certificate', priority='high')
+        high = _recommendation('Improve mobile experience today', priority='high')
+
+        result = self.analyzer._deduplicate_recommendations([low, other, high])
+
+        self.assertEqual(result, [high, other])
+
+    def test_same_topic_equal_priority_keeps_first(self):
+        first = _recommendation('Improve Mobile Experience now')
+        second = _recommendation('Improve Mobile Experience today')
+
+        self.assertEqual(self.analyzer._deduplicate_recommendations([first, second]), [first])
+
+    def test_overlapping_topics_collapse(self):
+        for duplicate_key, topic_key in _DUPLICATE_TOPICS.items():
+            duplicate = _recommendation(' '.join(duplicate_key[1]).title() + ' Speed',
+                                        category=duplicate_key[0], priority='high')
+            original = _recommendation(' '.join(topic_key[1]).title() + ' Speed',
+                                       category=topic_key[0], priority='medium')
+
+            with self.subTest(topic=topic_key):
+                self.assertEqual(self.analyzer._deduplicate_recommendations([original, duplicate]), [duplicate])
+
+    def test_loading_speed_rules_deduplicated(self):
+        data = {
+            'website_data': {'response_time': 6.0, 'word_count': 100},
+            'seo_data': {'page_speed': {'performance_score': 20}}
+        }
+
+        titles = [rec['title'] for rec in self.analyzer._generate_rule_based_recommendations(data)]
+
+        self.assertEqual(len(titles), len(set(titles)))
+        self.assertEqual(
+            len({'Optimize Page Loading Speed', 'Optimize Website Loading Speed'} & set(titles)), 1
+        )
+
+
+class FinalizeSummaryTextTests(SimpleTestCase):
+    def setUp(self):
+        self.generator = SummaryGenerator()
+        self.max_length = self.generator.CONFIG['max_summary_length']
+
+    def test_short_text_only_stripped(self):
+        self.assertEqual(self.generator._finalize_summary_text('  Short summary. Done.  '), 'Short summary. Done.')
+
+    def test_text_at_limit_kept(self):
+        text = ('word ' * self.max_length)[:self.max_length - 1] + '.'
+
+        self.assertEqual(self.generator._finalize_summary_text(text), text)
+
+    def test_long_text_matches_baseline_truncation(self):
+        sentences = [
+            'The site has a strong trust score of 8.5 across all factors',
+            'Page speed lags behind competitors on mobile devices',
+            'Social presence covers four platforms with steady growth',
+            'Local SEO and structured data are the main opportunities'
+        ] * 2
+        text = '. '.join(sentences) + '.'
+        self.assertGreater(len(text), self.max_length)
+
+        self.assertEqual(
+            self.generator._finalize_summary_text(text),
+            _baseline_finalize_summary_text(text, self.max_length)
+        )
+
+    def test_abbreviations_not_treated_as_sentence_end(self):
+        text = ('Acme Inc. leads the market in trust and reviews. '
+                + 'Competitors lag behind on page speed. ' * 10).strip()
+
+        self.assertEqual(
+            self.generator._finalize_summary_text(text),
+            'Acme Inc. leads the market in trust and reviews. Competitors lag behind on page speed.'
+        )
+
+    def test_long_text_without_sentences_cut_at_word(self):
+        text = 'word ' * self.max_length
+        result = self.generator._finalize_summary_text(text)
+
+        self.assertLessEqual(len(result), self.max_length)
+        self.assertTrue(result.endswith('word'))
+
+
+class ReportContextTests(SimpleTestCase):
+    DATA = {
+        'website_data': {
+            'company_name': 'Acme',
+            'domain': 'acme.com',
+            'word_count': 850,
+            'title': 'Acme - Widgets',
+            'description': 'Quality widgets since 1990',
+            'heading_structure': {'h1': ['Acme'], 'h2': ['About', 'Shop'], 'h3': []},
+            'structured_data': [{'@type': 'Organization'}],
+            'images': {'total_count': 12, 'with_alt_text': 9, 'without_alt_text': 3},
+            'links': {'internal_links': 40, 'external_links': 6},
+            'social_links': {'facebook': 'f', 'instagram': 'i', 'linkedin': 'l', 'twitter': 't'},
+            'technologies': ['WordPress', 'React'],
+            'has_ssl': True,
+            'canonical_url': 'https://acme.com/',
+            'response_time': 1.4,
+            'accessibility_features': {'has_lang_attribute': True, 'images_with_alt': 9},
+            'contact_info': {'has_email': True, 'has_phone': False, 'has_address': True},
+            'has_robots_txt': True,
+            'has_sitemap': False
+        },
+        'seo_data': {
+            'page_speed': {'performance_score': 72, 'seo_score': 88, 'accessibility_score': 91,
+                           'best_practices_score': 80},
+            'mobile_friendly': {'mobile_friendly': True},
+            'robots_txt': True,
+            'sitemap_xml': False
+        },
+        'reputation_data': {'overall_rating': 4.6},
+        'social_data': {'facebook': {}},
+        'trust_score': {'overall': 7.0}
+    }
+
+    def test_fields_match_raw_lookups(self):
+        website_data = self.DATA['website_data']
+        page_speed = self.DATA['seo_data']['page_speed']
+        ctx = ReportContext.from_raw(self.DATA)
+
+        self.assertEqual(ctx.company_name, 'Acme')
+        self.assertEqual(ctx.domain, 'acme.com')
+        self.assertEqual(ctx.trust_overall, 7.0)
+        self.assertEqual(ctx.avg_rating, 4.6)
+        self.assertEqual(ctx.data_sources_count, 4)
+        self.assertFalse(ctx.website_error)
+        self.assertEqual(ctx.word_count, website_data['word_count'])
+        self.assertEqual(ctx.title_length, len(website_data['title']))
+        self.assertEqual(ctx.description_length, len(website_data['description']))
+        self.assertEqual((ctx.h1_count, ctx.h2_count, ctx.h3_count), (1, 2, 0))
+        self.assertEqual(ctx.structured_data_count, 1)
+        self.assertEqual((ctx.image_count, ctx.images_with_alt, ctx.images_without_alt), (12, 9, 3))
+        self.assertEqual((ctx.internal_links, ctx.external_links), (40, 6))
+        self.assertEqual(ctx.social_platforms, 4)
+        self.assertTrue(ctx.has_modern_tech)
+        self.assertTrue(ctx.has_ssl and ctx.has_canonical_url and ctx.has_lang_attribute)
+        self.assertEqual(ctx.response_time, 1.4)
+        self.assertEqual(ctx.accessible_images, 9)
+        self.assertEqual((ctx.has_email, ctx.has_phone, ctx.has_address), (True, False, True))
+        self.assertEqual((ctx.has_robots_txt, ctx.has_sitemap), (True, False))
+        self.assertEqual(ctx.page_speed_score, page_speed['performance_score'])
+        self.assertEqual(ctx.seo_score, page_speed['seo_score'])
+        self.assertEqual(ctx.accessibility_score, page_speed['accessibility_score'])
+        self.assertEqual(ctx.best_practices_score, page_speed['best_practices_score'])
+        self.assertTrue(ctx.mobile_friendly)
+        self.assertEqual((ctx.seo_robots_txt, ctx.seo_sitemap_xml), (True, False))
+
+    def test_trust_and_social_levels_at_band_edges(self):
+        for trust, level in ((5.49, 0), (5.5, 1), (6.99, 1), (7.0, 2), (8.49, 2), (8.5, 3), (10.0, 3)):
+            with self.subTest(trust=trust):
+                ctx = ReportContext.from_raw({'trust_score': {'overall': trust}})
+                self.assertEqual(ctx.trust_level, level)
+
+        for platforms, level in ((0, 0), (1, 0), (2, 1), (3, 1), (4, 2), (6, 2)):
+            with self.subTest(platforms=platforms):
+                social_links = {str(index): '' for index in range(platforms)}
+                ctx = ReportContext.from_raw({'website_data': {'social_links': social_links}})
+                self.assertEqual(ctx.social_level, level)
+
+    def test_missing_and_null_sections_use_defaults(self):
+        for data in ({}, {'website_data': None, 'seo_data': None, 'reputation_data': None, 'trust_score': None}):
+            with self.subTest(data=data):
+                ctx = ReportContext.from_raw(data)
+
+                self.assertEqual(ctx.company_name, 'This website')
+                self.assertEqual(ctx.domain, 'the analyzed website')
+                self.assertEqual(ctx.trust_overall, 5.0)
+                self.assertEqual(ctx.data_sources_count, 0)
+                self.assertEqual((ctx.word_count, ctx.title_length, ctx.social_platforms), (0, 0, 0))
+                self.assertIsNone(ctx.response_time)
+                self.assertFalse(ctx.has_modern_tech)
+
+    def test_company_name_falls_back_to_domain(self):
+        ctx = ReportContext.from_raw({'website_data': {'company_name': '', 'domain': 'acme.com'}})
+
+        self.assertEqual(ctx.company_name, 'acme.com')
+
+
+class TrustScoreBandTests(SimpleTestCase):
+    def setUp(self):
+        self.calculator = TrustScoreCalculator()
+
+    def _breakdown(self, **website_data):
+        return self.calculator.calculate_trust_score({'website_data': website_data})['breakdown']
+
+    def test_response_time_bands(self):
+        reference = self._breakdown(response_time=4.0)['responsiveness']
+        for response_time in (0.0, 0.99, 1.0, 1.99, 2.0, 2.99, 3.0, 4.99, 5.0, 5.0001, 12.0):
+            with self.subTest(response_time=response_time):
+                score = self._breakdown(response_time=response_time)['responsiveness']
+                self.assertAlmostEqual(score - reference, _baseline_response_time_adjustment(response_time))
+
+    def test_nan_response_time_scores_like_default(self):
+        self.assertEqual(self._breakdown(response_time=float('nan')), self._breakdown())
+
+    def test_percentage_beyond_float_range_takes_fallback(self):
+        result = self.calculator.calculate_trust_score({'seo_data': {'page_speed': {'performance_score': 10 ** 400}}})
+
+        self.assertEqual(result['overall'], 5.0)
+        self.assertIn('error', result)
+
+    def test_service_quality_word_count_bands(self):
+        reference = self._breakdown(word_count=0)['service_quality']
+        for word_count in (0, 199, 200, 201, 499, 500, 501, 5000):
+            with self.subTest(word_count=word_count):
+                score = self._breakdown(word_count=word_count)['service_quality']
+                self.assertAlmostEqual(score - reference, _baseline_quality_word_count_points(word_count))
+
+    def test_web_presence_word_count_and_link_bands(self):
+        reference = self._breakdown(word_count=0, links={'external_links': 0})['web_presence']
+        for word_count in (499, 500, 501, 999, 1000, 1001):
+            for external_links in (1, 2, 3, 4, 5, 6):
+                with self.subTest(word_count=word_count, external_links=external_links):
+                    score = self._breakdown(word_count=word_count, links={'external_links': external_links})
+                    self.assertAlmostEqual(
+                        score['web_presence'] - reference, _baseline_presence_points(word_count, external_links)
+                    )
+
+    def test_factor_explanation_bands(self):
+        for score in (0.0, 3.99, 4.0, 5.99, 6.0, 7.99, 8.0, 10.0):
+            with self.subTest(score=score):
+                explanations = self.calculator._get_factor_explanations({'legitimacy': score})
+                self.assertEqual(explanations['legitimacy'], _baseline_legitimacy_explanation(score))
+
+
+class ProfessionalEmailTests(SimpleTestCase):
+    def setUp(self):
+        self.calculator = TrustScoreCalculator()
+
+    def _legitimacy(self, *emails):
+        data = {'website_data': {'contact_info': {'emails_found': list(emails)}}}
+        return self.calculator.calculate_trust_score(data)['breakdown']['legitimacy']
+
+    def test_free_webmail_domains_not_professional(self):
+        for domain in ('gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'icloud.com'):
+            with self.subTest(domain=domain):
+                self.assertEqual(self._legitimacy(f'owner@{domain}'), 0.0)
+
+    def test_domains_compared_case_insensitively(self):
+        self.assertEqual(self._legitimacy('OWNER@GMAIL.COM'), 0.0)
+        self.assertEqual(self._legitimacy('Owner@Outlook.com'), 0.0)
+
+    def test_domain_suffix_alone_does_not_match(self):
+        self.assertEqual(self._legitimacy('info@notgmail.com'), 1.0)
+
+    def test_any_professional_address_counts(self):
+        self.assertEqual(self._legitimacy('owner@gmail.com', 'info@acme.com'), 1.0)
@@ -1,65 +1,359 @@
 # ai_analyzer/trust_score.py
+from dataclasses import dataclass
+import orjson
+from django.core.cache import cache
+import bisect
+import hashlib
 import logging
-from typing import Dict
+import math
+import operator
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Optional
 import json
 
 logger = logging.getLogger(__name__)
 
+# Trust scores are cached by a hash of the scored input sections, so
+# re-scoring an unchanged scrape (retries, dashboard refreshes) skips the work
+_TRUST_CACHE_PREFIX = "trust:"
+_TRUST_CACHE_TTL = 300  # 5 minutes
+_SCORED_SECTIONS = ('website_data', 'seo_data', 'social_data', 'reputation_data')
+
+# Heading keywords that indicate About/Company information
+_ABOUT_INDICATORS = ('about', 'company', 'team', 'who we are')
+
+# Free webmail domains; an address on any other domain counts as professional
+_FREE_EMAIL_DOMAINS = frozenset(('gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'icloud.com'))
+
+# Detected technologies that count towards responsiveness and innovation
+_RESPONSIVE_TECHNOLOGIES = frozenset(('React', 'Vue', 'Angular', 'Bootstrap'))
+_MODERN_FRAMEWORKS = frozenset(('React', 'Vue', 'Angular', 'Next.js', 'Gatsby'))
+_ANALYTICS_TECHNOLOGIES = frozenset(('Google Analytics', 'Google Tag Manager'))
+
+# Responsiveness adjustment per page load time band (seconds): under 1, 2 and
+# 3, up to and including 5, and over 5 (bisect_right over lower bounds)
+_RESPONSE_TIME_BOUNDS = (1.0, 2.0, 3.0, math.nextafter(5.0, math.inf))
+_RESPONSE_TIME_ADJUSTMENTS = (2.5, 2.0, 1.0, 0.0, -2.0)
+
+# Content points per word count band (bisect_left: counts above each bound)
+_QUALITY_WORD_COUNT_BOUNDS = (200, 500)
+_QUALITY_WORD_COUNT_POINTS = (0.0, 1.0, 1.5)
+_PRESENCE_WORD_COUNT_BOUNDS = (500, 1000)
+_PRESENCE_WORD_COUNT_POINTS = (0.0, 1.0, 2.0)
+
+# Web presence points for external links (bisect_left: counts above each bound)
+_EXTERNAL_LINK_BOUNDS = (2, 5)
+_EXTERNAL_LINK_POINTS = (0.0, 0.5, 1.0)
+
+# Factor explanation per score band: below 4, 4-6, 6-8 and 8+ (bisect_right)
+_EXPLANATION_THRESHOLDS = (4, 6, 8)
+_FACTOR_EXPLANATIONS = {
+    'legitimacy': (
+        "Poor - Multiple legitimacy issues detected",
+        "Fair - Some legitimacy concerns",
+        "Good - Most legitimacy indicators present",
+        "Excellent - Strong indicators of business legitimacy"
+    ),
+    'transparency': (
+        "Poor - Lacks transparency and contact information",
+        "Fair - Limited transparency, could improve contact info",
+        "Good - Adequate transparency and contact information",
+        "Excellent - Highly transparent with comprehensive contact info"
+    ),
+    'customer_feedback': (
+        "Poor - Negative or lacking customer feedback",
+        "Fair - Mixed customer feedback",
+        "Good - Positive customer feedback overall",
+        "Excellent - Outstanding customer reviews and feedback"
+    ),
+    'service_quality': (
+        "Poor - Multiple quality and user experience issues",
+        "Fair - Average quality with several improvement opportunities",
+        "Good - Quality website with minor improvement areas",
+        "Excellent - High-quality website and user experience"
+    ),
+    'responsiveness': (
+        "Poor - Slow loading and responsiveness problems",
+        "Fair - Moderate performance issues",
+        "Good - Acceptable performance and responsiveness",
+        "Excellent - Fast loading and highly responsive"
+    ),
+    'innovation': (
+        "Poor - Outdated technologies and limited innovation",
+        "Fair - Standard technology stack",
+        "Good - Some modern features and technologies",
+        "Excellent - Uses modern technologies and innovative features"
+    ),
+    'web_presence': (
+        "Poor - Weak online presence and visibility",
+        "Fair - Limited web presence",
+        "Good - Solid web presence with room for growth",
+        "Excellent - Strong online presence across multiple channels"
+    )
+}
+
+
+# Recommendations offered per weak category; legitimacy entries only apply
+# when the named TrustFeatures flag is missing
+_LEGITIMACY_RECOMMENDATIONS = (
+    ('has_ssl', "Install SSL certificate for HTTPS encryption"),
+    ('has_email', "Add clear contact email address"),
+    ('has_phone', "Provide phone number for customer contact")
+)
+_TRANSPARENCY_RECOMMENDATIONS = (
+    "Add comprehensive About Us page",
+    "Include team member information and photos",
+    "Provide detailed company address and location"
+)
+_INNOVATION_RECOMMENDATIONS = (
+    "Implement structured data markup for better SEO",
+    "Add social media meta tags (Open Graph, Twitter Cards)",
+    "Consider upgrading to modern web technologies"
+)
+_MAX_TRUST_RECOMMENDATIONS = 8
+
+
+def _trust_cache_key(data: Dict) -> Optional[str]:
+    """
+    Build a deterministic cache key from the input sections the trust score reads
+
+    Returns None when the data can't be serialised; that score is computed uncached.
+    """
+    try:
+        payload = orjson.dumps(
+            {section: data.get(section) for section in _SCORED_SECTIONS},
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+    except (AttributeError, orjson.JSONEncodeError):
+        return None
+    return _TRUST_CACHE_PREFIX + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _lowercase_text(value) -> str:
+    """Serialise scraped data to lowercase text for the trust keyword checks"""
+    try:
+        # orjson builds the text several times faster than str() on large pages
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode().lower()
+    except orjson.JSONEncodeError:
+        return str(value).lower()
+
+
+def _number(value):
+    """Return a numeric score input unchanged, raising TypeError for anything else"""
+    if not isinstance(value, (int, float)):
+        raise TypeError(f"expected a number, got {type(value).__name__}")
+    return value
+
+
+def _percentage(value):
+    """Return a 0-100 score input unchanged, raising if it can't be scaled to points"""
+    # Floats always scale (inf and nan included); ints beyond float range don't
+    if isinstance(_number(value), int) and abs(value) // 100 > sys.float_info.max:
+        raise OverflowError("integer score too large to scale to points")
+    return value
+
+
+@dataclass(slots=True)
+class TrustFeatures:
+    """
+    Flattened view of the scraped data read by the trust sub-scorers
+
+    Built once per calculation so every input field is looked up a single
+    time and the sub-scorers work on plain attributes.
+    """
+    # Technical and legal
+    has_ssl: bool
+    has_favicon: bool
+    has_canonical_url: bool
+    has_robots_txt: bool
+    has_sitemap_xml: bool
+    has_structured_data: bool
+    has_organization_schema: bool
+    has_local_business_schema: bool
+    has_privacy: bool
+    has_terms: bool
+
+    # Contact and company information
+    has_email: bool
+    has_phone: bool
+    has_address: bool
+    has_professional_email: bool
+    has_company_name: bool
+    has_about_heading: bool
+    social_count: int
+
+    # Content and structure
+    word_count: int
+    has_h1_and_h2: bool
+    h2_count: int
+    h3_count: int
+    external_links: int
+
+    # Performance, mobile and accessibility
+    performance_score: float
+    seo_score: float
+    response_time: float
+    seo_mobile_friendly: bool
+    has_viewport_meta: bool
+    has_responsive_images: bool
+    has_lang_attribute: bool
+    images_with_alt: int
+    images_without_alt: int
+    has_aria_labels: bool
+
+    # Modern features
+    technologies: frozenset
+    has_social_tags: bool
+    has_service_worker: bool
+
+    # Reputation
+    avg_rating: float
+
+    @classmethod
+    def from_raw(cls, data: Dict) -> 'TrustFeatures':
+        """
+        Read every field the trust score uses from the collected data
+
+        Raises AttributeError, TypeError or OverflowError when a section or
+        value has the wrong type, so scoring never sees malformed input.
+        """
+        website_data = data.get('website_data', {})
+        seo_data = data.get('seo_data', {})
+        reputation_data = data.get('reputation_data', {})
+
+        contact_info = website_data.get('contact_info', {})
+        headings = website_data.get('heading_structure', {})
+        mobile_features = website_data.get('mobile_optimized', {})
+        accessibility = website_data.get('accessibility_features', {})
+        social_tags = website_data.get('social_tags', {})
+        page_speed = seo_data.get('page_speed', {})
+
+        # Keyword checks share one lowercase serialisation of the scraped data
+        page_text = _lowercase_text(website_data)
+        heading_text = _lowercase_text(headings)
+
+        # Entries look like "JSON-LD: Organization"; lowercase them once, one per
+        # line so a schema name can only match within a single entry
+        structured_data = website_data.get('structured_data', [])
+        structured_text = '\n'.join(map(str, structured_data)).lower()
+
+        # An unmeasurable (NaN) load time scores like the 5s default instead of
+        # landing in the slowest bisect band
+        response_time = _number(website_data.get('response_time', 5.0))
+        if isinstance(response_time, float) and math.isnan(response_time):
+            response_time = 5.0
+
+        email_domains = {email.rpartition('@')[2].lower() for email in contact_info.get('emails_found', [])}
+
+        return cls(
+            has_ssl=bool(website_data.get('has_ssl')),
+            has_favicon=bool(website_data.get('has_favicon')),
+            has_canonical_url=bool(website_data.get('canonical_url')),
+            has_robots_txt=bool(seo_data.get('robots_txt')),
+            has_sitemap_xml=bool(seo_data.get('sitemap_xml')),
+            has_structured_data=bool(structured_data),
+            has_organization_schema='organization' in structured_text,
+            has_local_business_schema='localbusiness' in structured_text,
+            has_privacy='privacy' in page_text,
+            has_terms='terms' in page_text,
+
+            has_email=bool(contact_info.get('has_email')),
+            has_phone=bool(contact_info.get('has_phone')),
+            has_address=bool(contact_info.get('has_address')),
+            has_professional_email=bool(email_domains - _FREE_EMAIL_DOMAINS),
+            has_company_name=bool(website_data.get('company_name')),
+            has_about_heading=any(indicator in heading_text for indicator in _ABOUT_INDICATORS),
+            social_count=len(website_data.get('social_links', {})),
+
+            word_count=_number(website_data.get('word_count', 0)),
+            has_h1_and_h2=bool(headings.get('h1') and headings.get('h2')),
+            h2_count=len(headings.get('h2', [])),
+            h3_count=len(headings.get('h3', [])),
+            external_links=_number(website_data.get('links', {}).get('external_links', 0)),
+
+            performance_score=_percentage(page_speed.get('performance_score', 0)),
+            seo_score=_percentage(page_speed.get('seo_score', 0)),
+            response_time=response_time,
+            seo_mobile_friendly=bool(seo_data.get('mobile_friendly', {}).get('mobile_friendly')),
+            has_viewport_meta=bool(mobile_features.get('has_viewport_meta')),
+            has_responsive_images=bool(mobile_features.get('has_responsive_images')),
+            has_lang_attribute=bool(accessibility.get('has_lang_attribute')),
+            images_with_alt=_number(accessibility.get('images_with_alt', 0)),
+            images_without_alt=_number(accessibility.get('images_without_alt', 0)),
+            has_aria_labels=bool(accessibility.get('has_aria_labels')),
+
+            technologies=frozenset(website_data.get('technologies', [])),
+            has_social_tags=bool(social_tags.get('open_graph') or social_tags.get('twitter')),
+            has_service_worker='service worker' in page_text,
+
+            avg_rating=_number(reputation_data.get('average_rating', 0)) if reputation_data else 0
+        )
+
 
 class TrustScoreCalculator:
     """Calculate trust score based on various website factors"""
 
-    def __init__(self):
-        self.max_score = 10.0
-        self.weights = {
-            'legitimacy': 0.25,
-            'transparency': 0.15,
-            'customer_feedback': 0.20,
-            'service_quality': 0.15,
-            'responsiveness': 0.10,
-            'innovation': 0.05,
-            'web_presence': 0.10
-        }
+    __slots__ = ()
+
+    max_score = 10.0
+
+    # Category weights (shared, read-only); their order is the scoring order
+    WEIGHTS = MappingProxyType({
+        'legitimacy': 0.25,
+        'transparency': 0.15,
+        'customer_feedback': 0.20,
+        'service_quality': 0.15,
+        'responsiveness': 0.10,
+        'innovation': 0.05,
+        'web_presence': 0.10
+    })
+    _categories = tuple(WEIGHTS)
+    _weight_values = tuple(WEIGHTS.values())
 
     def calculate_trust_score(self, data: Dict) -> Dict:
         """Calculate comprehensive trust score"""
+        return self.calculate_trust_scores_batch([data])[0]
+
+    def calculate_trust_scores_batch(self, datasets: List[Dict]) -> List[Dict]:
+        """
+        Calculate trust scores for many sites
+
+        Scores already cached are read in one cache round trip and the newly
+        computed ones are stored in another, instead of a get/set per site.
+
+        Args:
+            datasets: List of collected data dictionaries (see calculate_trust_score)
+
+        Returns:
+            List of trust scores, in the same order as datasets
+        """
+        cache_keys = [_trust_cache_key(data) for data in datasets]
+        cached_results = cache.get_many([key for key in cache_keys if key is not None])
+
+        results = []
+        computed_results = {}
+        for data, cache_key in zip(datasets, cache_keys):
+            result = cached_results.get(cache_key)
+            if result is None:
+                result = self._score_trust(data)
+                # Fallback scores for malformed data are not cached
+                if cache_key is not None and 'error' not in result:
+                    computed_results[cache_key] = result
+            results.append(result)
+
+        if computed_results:
+            cache.set_many(computed_results, _TRUST_CACHE_TTL)
+        return results
+
+    def _score_trust(self, data: Dict) -> Dict:
+        """Score one site, falling back to a neutral score if its data can't be read"""
         try:
-            website_data = data.get('website_data', {})
-            seo_data = data.get('seo_data', {})
-            social_data = data.get('social_data', {})
-            reputation_data = data.get('reputation_data', {})
-
-            scores = {
-                'legitimacy': self._calculate_legitimacy(website_data, seo_data),
-                'transparency': self._calculate_transparency(website_data),
-                'customer_feedback': self._calculate_customer_feedback(reputation_data),
-                'service_quality': self._calculate_service_quality(website_data, seo_data),
-                'responsiveness': self._calculate_responsiveness(website_data, seo_data),
-                'innovation': self._calculate_innovation(website_data, seo_data),
-                'web_presence': self._calculate_web_presence(website_data, social_data, seo_data)
-            }
-
-            # Calculate weighted overall score
-            overall_score = sum(
-                scores[category] * self.weights[category]
-                for category in scores
-            )
-
-            # Generate recommendations
-            recommendations = self._generate_trust_recommendations(scores, data)
-
-            return {
-                'overall': round(min(overall_score, self.max_score), 1),
-                'breakdown': {k: round(v, 1) for k, v in scores.items()},
-                'factors': self._get_factor_explanations(scores),
-                'recommendations': recommendations,
-                'calculation_details': {
-                    'weights_used': self.weights,
-                    'max_possible_score': self.max_score
-                }
-            }
-
-        except Exception as e:
+            # Every input field is read and validated once up front; the
+            # sub-scorers are plain arithmetic on the extracted features
+            f = TrustFeatures.from_raw(data)
+        except (AttributeError, TypeError, OverflowError) as e:
             logger.error(f"Error calculating trust score: {e}")
             return {
                 'overall': 5.0,
@@ -67,376 +361,255 @@ class TrustScoreCalculator:
                 'error': str(e)
             }
 
-    def _calculate_legitimacy(self, website_data: Dict, seo_data: Dict) -> float:
+        # Raw sub-scores in self._categories order, capped once here at max_score
+        raw_scores = (
+            self._calculate_legitimacy(f),
+            self._calculate_transparency(f),
+            self._calculate_customer_feedback(f),
+            self._calculate_service_quality(f),
+            self._calculate_responsiveness(f),
+            self._calculate_innovation(f),
+            self._calculate_web_presence(f)
+        )
+        max_score = self.max_score
+        scores = {
+            category: min(score, max_score)
+            for category, score in zip(self._categories, raw_scores)
+        }
+
+        # Calculate weighted overall score (scores are in self._categories order)
+        overall_score = sum(map(operator.mul, scores.values(), self._weight_values))
+
+        # Generate recommendations
+        recommendations = self._generate_trust_recommendations(scores, f)
+
+        return {
+            'overall': round(min(overall_score, self.max_score), 1),
+            'breakdown': {k: round(v, 1) for k, v in scores.items()},
+            'factors': self._get_factor_explanations(scores),
+            'recommendations': recommendations,
+            'calculation_details': {
+                'weights_used': dict(self.WEIGHTS),
+                'max_possible_score': self.max_score
+            }
+        }
+
+    def _calculate_legitimacy(self, f: TrustFeatures) -> float:
         """Calculate legitimacy score based on technical and legal indicators"""
         score = 0.0
-        max_score = 10.0
 
         # SSL certificate (2 points)
-        if website_data.get('has_ssl'):
+        if f.has_ssl:
             score += 2.0
 
         # Contact information (2 points)
-        contact_info = website_data.get('contact_info', {})
-        if contact_info.get('has_email'):
+        if f.has_email:
             score += 1.0
-        if contact_info.get('has_phone'):
+        if f.has_phone:
             score += 1.0
 
         # Privacy policy and terms (1.5 points)
-        page_text = str(website_data).lower()
-        if 'privacy policy' in page_text or 'privacy' in page_text:
+        if f.has_privacy:
             score += 0.75
-        if 'terms of service' in page_text or 'terms' in page_text:
+        if f.has_terms:
             score += 0.75
 
         # Professional domain and age indicators (2 points)
-        if website_data.get('has_favicon'):
+        if f.has_favicon:
             score += 0.5
-        if website_data.get('canonical_url'):
+        if f.has_canonical_url:
             score += 0.5
-        if seo_data.get('robots_txt'):
+        if f.has_robots_txt:
             score += 0.5
-        if seo_data.get('sitemap_xml'):
+        if f.has_sitemap_xml:
             score += 0.5
 
         # Structured data (business registration info) (1.5 points)
-        structured_data = website_data.get('structured_data', [])
-        if any('organization' in str(data).lower() for data in structured_data):
+        if f.has_organization_schema:
             score += 1.0
-        if any('localbusiness' in str(data).lower() for data in structured_data):
+        if f.has_local_business_schema:
             score += 0.5
 
         # Professional email addresses (1 point)
-        emails = contact_info.get('emails_found', [])
-        if any(not email.endswith(('gmail.com', 'yahoo.com', 'hotmail.com')) for email in emails):
+        if f.has_professional_email:
             score += 1.0
 
-        return min(score, max_score)
+        return score
 
-    def _calculate_transparency(self, website_data: Dict) -> float:
+    def _calculate_transparency(self, f: TrustFeatures) -> float:
         """Calculate transparency score"""
         score = 0.0
-        max_score = 10.0
-
-        contact_info = website_data.get('contact_info', {})
 
         # Contact information availability (4 points)
-        if contact_info.get('has_email'):
+        if f.has_email:
             score += 1.5
-        if contact_info.get('has_phone'):
+        if f.has_phone:
             score += 1.5
-        if contact_info.get('has_address'):
+        if f.has_address:
             score += 1.0
 
         # About/Company information (3 points)
-        if website_data.get('company_name'):
+        if f.has_company_name:
             score += 1.5
 
-        headings = website_data.get('heading_structure', {})
-        about_indicators = ['about', 'company', 'team', 'who we are']
-        page_text = str(headings).lower()
-        if any(indicator in page_text for indicator in about_indicators):
+        if f.has_about_heading:
             score += 1.5
 
         # Social media presence (2 points)
-        social_links = website_data.get('social_links', {})
-        score += min(len(social_links) * 0.4, 2.0)
+        score += min(f.social_count * 0.4, 2.0)
 
         # Clear navigation and structure (1 point)
-        if headings.get('h1') and headings.get('h2'):
+        if f.has_h1_and_h2:
             score += 1.0
 
-        return min(score, max_score)
+        return score
 
-    def _calculate_customer_feedback(self, reputation_data: Dict) -> float:
+    def _calculate_customer_feedback(self, f: TrustFeatures) -> float:
         """Calculate customer feedback score"""
         score = 5.0  # Default neutral score
-        max_score = 10.0
 
         # This would be enhanced with actual review data
         # For now, return a placeholder calculation
 
-        if reputation_data:
-            # Placeholder logic for when reputation data is available
-            avg_rating = reputation_data.get('average_rating', 0)
-            if avg_rating > 0:
-                score = min(avg_rating * 2, max_score)  # Convert 5-star to 10-point scale
+        # Placeholder logic for when reputation data is available
+        if f.avg_rating > 0:
+            score = f.avg_rating * 2  # Convert 5-star to 10-point scale
 
-        return min(score, max_score)
+        return score
 
-    def _calculate_service_quality(self, website_data: Dict, seo_data: Dict) -> float:
+    def _calculate_service_quality(self, f: TrustFeatures) -> float:
         """Calculate service quality indicators"""
         score = 0.0
-        max_score = 10.0
 
         # Website performance (3 points)
-        page_speed = seo_data.get('page_speed', {})
-        performance_score = page_speed.get('performance_score', 0)
-        if performance_score > 0:
-            score += (performance_score / 100) * 3.0
+        if f.performance_score > 0:
+            score += (f.performance_score / 100) * 3.0
 
         # Content quality (3 points)
-        word_count = website_data.get('word_count', 0)
-        if word_count > 500:
-            score += 1.5
-        elif word_count > 200:
-            score += 1.0
+        score += _QUALITY_WORD_COUNT_POINTS[bisect.bisect_left(_QUALITY_WORD_COUNT_BOUNDS, f.word_count)]
 
-        headings = website_data.get('heading_structure', {})
-        if len(headings.get('h2', [])) >= 3:
+        if f.h2_count >= 3:
             score += 1.0
-        if len(headings.get('h3', [])) >= 2:
+        if f.h3_count >= 2:
             score += 0.5
 
         # Mobile optimization (2 points)
-        mobile_friendly = seo_data.get('mobile_friendly', {})
-        if mobile_friendly.get('mobile_friendly'):
+        if f.seo_mobile_friendly:
             score += 2.0
-        elif website_data.get('mobile_optimized', {}).get('has_viewport_meta'):
+        elif f.has_viewport_meta:
             score += 1.0
 
         # Accessibility (2 points)
-        accessibility = website_data.get('accessibility_features', {})
-        if accessibility.get('has_lang_attribute'):
+        if f.has_lang_attribute:
             score += 0.5
-        if accessibility.get('images_with_alt', 0) > accessibility.get('images_without_alt', 0):
+        if f.images_with_alt > f.images_without_alt:
             score += 1.0
-        if accessibility.get('has_aria_labels'):
+        if f.has_aria_labels:
             score += 0.5
 
-        return min(score, max_score)
+        return score
 
-    def _calculate_responsiveness(self, website_data: Dict, seo_data: Dict) -> float:
+    def _calculate_responsiveness(self, f: TrustFeatures) -> float:
         """Calculate responsiveness indicators"""
         score = 5.0  # Default score
-        max_score = 10.0
 
         # Page load time (5 points)
-        response_time = website_data.get('response_time', 5.0)
-        if response_time < 1.0:
-            score += 2.5
-        elif response_time < 2.0:
-            score += 2.0
-        elif response_time < 3.0:
-            score += 1.0
-        elif response_time > 5.0:
-            score -= 2.0
+        score += _RESPONSE_TIME_ADJUSTMENTS[bisect.bisect_right(_RESPONSE_TIME_BOUNDS, f.response_time)]
 
         # Mobile responsiveness (3 points)
-        mobile_features = website_data.get('mobile_optimized', {})
-        if mobile_features.get('has_viewport_meta'):
+        if f.has_viewport_meta:
             score += 1.5
-        if mobile_features.get('has_responsive_images'):
+        if f.has_responsive_images:
             score += 1.5
 
         # Modern technologies (2 points)
-        technologies = website_data.get('technologies', [])
-        modern_tech = ['React', 'Vue', 'Angular', 'Bootstrap']
-        if any(tech in technologies for tech in modern_tech):
+        if not _RESPONSIVE_TECHNOLOGIES.isdisjoint(f.technologies):
             score += 2.0
 
-        return min(score, max_score)
+        return score
 
-    def _calculate_innovation(self, website_data: Dict, seo_data: Dict) -> float:
+    def _calculate_innovation(self, f: TrustFeatures) -> float:
         """Calculate innovation indicators"""
         score = 5.0  # Default score
-        max_score = 10.0
 
         # Modern technologies (3 points)
-        technologies = website_data.get('technologies', [])
-        modern_frameworks = ['React', 'Vue', 'Angular', 'Next.js', 'Gatsby']
-        if any(framework in technologies for framework in modern_frameworks):
+        if not _MODERN_FRAMEWORKS.isdisjoint(f.technologies):
             score += 2.0
 
         # Advanced SEO features (3 points)
-        structured_data = website_data.get('structured_data', [])
-        if structured_data:
+        if f.has_structured_data:
             score += 1.5
 
-        social_tags = website_data.get('social_tags', {})
-        if social_tags.get('open_graph') or social_tags.get('twitter'):
+        if f.has_social_tags:
             score += 1.5
 
         # Progressive features (2 points)
-        if 'Service Worker' in str(website_data).lower():
+        if f.has_service_worker:
             score += 1.0
-        if website_data.get('has_ssl'):
+        if f.has_ssl:
             score += 1.0
 
-        # Analytics and tracking (2 points)
-        if 'Google Analytics' in technologies:
-            score += 1.0
-        if 'Google Tag Manager' in technologies:
-            score += 1.0
+        # Analytics and tracking (2 points, 1 per tool)
+        score += len(_ANALYTICS_TECHNOLOGIES & f.technologies)
 
-        return min(score, max_score)
+        return score
 
-    def _calculate_web_presence(self, website_data: Dict, social_data: Dict, seo_data: Dict) -> float:
+    def _calculate_web_presence(self, f: TrustFeatures) -> float:
         """Calculate web presence score"""
         score = 0.0
-        max_score = 10.0
 
         # Social media presence (4 points)
-        social_links = website_data.get('social_links', {})
-        score += min(len(social_links) * 0.8, 4.0)
+        score += min(f.social_count * 0.8, 4.0)
 
         # SEO optimization (3 points)
-        seo_score = seo_data.get('page_speed', {}).get('seo_score', 0)
-        if seo_score > 0:
-            score += (seo_score / 100) * 3.0
+        if f.seo_score > 0:
+            score += (f.seo_score / 100) * 3.0
 
         # Content richness (2 points)
-        word_count = website_data.get('word_count', 0)
-        if word_count > 1000:
-            score += 2.0
-        elif word_count > 500:
-            score += 1.0
+        score += _PRESENCE_WORD_COUNT_POINTS[bisect.bisect_left(_PRESENCE_WORD_COUNT_BOUNDS, f.word_count)]
 
         # External linking and references (1 point)
-        external_links = website_data.get('links', {}).get('external_links', 0)
-        if external_links > 5:
-            score += 1.0
-        elif external_links > 2:
-            score += 0.5
+        score += _EXTERNAL_LINK_POINTS[bisect.bisect_left(_EXTERNAL_LINK_BOUNDS, f.external_links)]
 
-        return min(score, max_score)
+        return score
 
     def _get_factor_explanations(self, scores: Dict) -> Dict:
         """Provide explanations for each trust factor"""
-        explanations = {
-            'legitimacy': self._explain_legitimacy_score(scores['legitimacy']),
-            'transparency': self._explain_transparency_score(scores['transparency']),
-            'customer_feedback': self._explain_feedback_score(scores['customer_feedback']),
-            'service_quality': self._explain_quality_score(scores['service_quality']),
-            'responsiveness': self._explain_responsiveness_score(scores['responsiveness']),
-            'innovation': self._explain_innovation_score(scores['innovation']),
-            'web_presence': self._explain_presence_score(scores['web_presence'])
+        return {
+            category: _FACTOR_EXPLANATIONS[category][bisect.bisect_right(_EXPLANATION_THRESHOLDS, score)]
+            for category, score in scores.items()
         }
-        return explanations
-
-    def _explain_legitimacy_score(self, score: float) -> str:
-        """Explain legitimacy score"""
-        if score >= 8:
-            return "Excellent - Strong indicators of business legitimacy"
-        elif score >= 6:
-            return "Good - Most legitimacy indicators present"
-        elif score >= 4:
-            return "Fair - Some legitimacy concerns"
-        else:
-            return "Poor - Multiple legitimacy issues detected"
-
-    def _explain_transparency_score(self, score: float) -> str:
-        """Explain transparency score"""
-        if score >= 8:
-            return "Excellent - Highly transparent with comprehensive contact info"
-        elif score >= 6:
-            return "Good - Adequate transparency and contact information"
-        elif score >= 4:
-            return "Fair - Limited transparency, could improve contact info"
-        else:
-            return "Poor - Lacks transparency and contact information"
-
-    def _explain_feedback_score(self, score: float) -> str:
-        """Explain customer feedback score"""
-        if score >= 8:
-            return "Excellent - Outstanding customer reviews and feedback"
-        elif score >= 6:
-            return "Good - Positive customer feedback overall"
-        elif score >= 4:
-            return "Fair - Mixed customer feedback"
-        else:
-            return "Poor - Negative or lacking customer feedback"
-
-    def _explain_quality_score(self, score: float) -> str:
-        """Explain service quality score"""
-        if score >= 8:
-            return "Excellent - High-quality website and user experience"
-        elif score >= 6:
-            return "Good - Quality website with minor improvement areas"
-        elif score >= 4:
-            return "Fair - Average quality with several improvement opportunities"
-        else:
-            return "Poor - Multiple quality and user experience issues"
-
-    def _explain_responsiveness_score(self, score: float) -> str:
-        """Explain responsiveness score"""
-        if score >= 8:
-            return "Excellent - Fast loading and highly responsive"
-        elif score >= 6:
-            return "Good - Acceptable performance and responsiveness"
-        elif score >= 4:
-            return "Fair - Moderate performance issues"
-        else:
-            return "Poor - Slow loading and responsiveness problems"
-
-    def _explain_innovation_score(self, score: float) -> str:
-        """Explain innovation score"""
-        if score >= 8:
-            return "Excellent - Uses modern technologies and innovative features"
-        elif score >= 6:
-            return "Good - Some modern features and technologies"
-        elif score >= 4:
-            return "Fair - Standard technology stack"
-        else:
-            return "Poor - Outdated technologies and limited innovation"
-
-    def _explain_presence_score(self, score: float) -> str:
-        """Explain web presence score"""
-        if score >= 8:
-            return "Excellent - Strong online presence across multiple channels"
-        elif score >= 6:
-            return "Good - Solid web presence with room for growth"
-        elif score >= 4:
-            return "Fair - Limited web presence"
-        else:
-            return "Poor - Weak online presence and visibility"
-
-    def _generate_trust_recommendations(self, scores: Dict, data: Dict) -> list[str]:
+
+    def _generate_trust_recommendations(self, scores: Dict, f: TrustFeatures) -> list[str]:
         """Generate recommendations to improve trust score"""
         recommendations = []
 
         # Legitimacy recommendations
         if scores['legitimacy'] < 7:
-            website_data = data.get('website_data', {})
-            if not website_data.get('has_ssl'):
-                recommendations.append("Install SSL certificate for HTTPS encryption")
-
-            contact_info = website_data.get('contact_info', {})
-            if not contact_info.get('has_email'):
-                recommendations.append("Add clear contact email address")
-            if not contact_info.get('has_phone'):
-                recommendations.append("Provide phone number for customer contact")
+            recommendations.extend(
+                message for flag, message in _LEGITIMACY_RECOMMENDATIONS if not getattr(f, flag)
+            )
 
         # Transparency recommendations
         if scores['transparency'] < 7:
-            recommendations.append("Add comprehensive About Us page")
-            recommendations.append("Include team member information and photos")
-            recommendations.append("Provide detailed company address and location")
+            recommendations.extend(_TRANSPARENCY_RECOMMENDATIONS)
 
         # Service quality recommendations
         if scores['service_quality'] < 7:
-            seo_data = data.get('seo_data', {})
-            page_speed = seo_data.get('page_speed', {})
-            if page_speed.get('performance_score', 0) < 70:
+            if f.performance_score < 70:
                 recommendations.append("Improve website loading speed and performance")
-
-            mobile_friendly = seo_data.get('mobile_friendly', {})
-            if not mobile_friendly.get('mobile_friendly'):
+            if not f.seo_mobile_friendly:
                 recommendations.append("Optimize website for mobile devices")
 
         # Innovation recommendations
         if scores['innovation'] < 6:
-            recommendations.append("Implement structured data markup for better SEO")
-            recommendations.append("Add social media meta tags (Open Graph, Twitter Cards)")
-            recommendations.append("Consider upgrading to modern web technologies")
+            recommendations.extend(_INNOVATION_RECOMMENDATIONS)
 
         # Web presence recommendations
         if scores['web_presence'] < 7:
-            website_data = data.get('website_data', {})
-            social_links = website_data.get('social_links', {})
-            if len(social_links) < 3:
+            if f.social_count < 3:
                 recommendations.append("Establish presence on major social media platforms")
             recommendations.append("Create more comprehensive, valuable content")
 
-        return recommendations[:8]  # Return top 8 recommendations
\ No newline at end of file
+        del recommendations[_MAX_TRUST_RECOMMENDATIONS:]  # Keep the top recommendations
+        return recommendations
@@ -2,6 +2,7 @@
 import os
 from pathlib import Path
 from decouple import config
+from celery.schedules import crontab
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -188,6 +189,19 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
 
+# Queued OpenAI Batch API requests are submitted once a day; the submit tasks
+# schedule their own polling until the results are applied to the reports
+CELERY_BEAT_SCHEDULE = {
+    'submit-summary-batch': {
+        'task': 'reports.tasks.submit_summary_batch',
+        'schedule': crontab(hour=0, minute=15),  # Daily at 12:15 AM
+    },
+    'submit-growth-recommendation-batch': {
+        'task': 'reports.tasks.submit_growth_recommendation_batch',
+        'schedule': crontab(hour=0, minute=30),  # Daily at 12:30 AM
+    },
+}
+
 # Channels Configuration (for WebSockets)
 CHANNEL_LAYERS = {
     'default': {
@@ -204,6 +218,11 @@ GOOGLE_API_KEY = config('GOOGLE_API_KEY', default='')
 SEMRUSH_API_KEY = config('SEMRUSH_API_KEY', default='')
 SERPAPI_KEY = config('SERPAPI_KEY', default='')
 
+# OpenAI Batch API (offline growth recommendation and summary jobs). Queued
+# requests are kept in files on local disk, so the workers that queue them and
+# the beat-scheduled submit tasks must run on the same host.
+OPENAI_BATCH_DIR = config('OPENAI_BATCH_DIR', default=str(BASE_DIR / 'openai_batches'))
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
@@ -1,12 +1,78 @@
 # data_collectors/competitor_collector.py
+import bisect
+import hashlib
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import logging
 from typing import Dict, List
 from django.conf import settings
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+# Competitor reports are cached per (domain, keywords); competitive landscapes
+# change over days, so repeat reports within the hour reuse the analysis
+_COMPETITOR_CACHE_PREFIX = "competitors:"
+_COMPETITOR_CACHE_TTL = 3600  # 1 hour
+
+# Connection pool sizes for competitive intelligence APIs; keep-alive
+# connections reuse TLS sessions per host instead of re-handshaking
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 32
+# Retry rate limits and transient server errors with exponential backoff;
+# the final response is still returned to the caller once retries run out
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False
+)
+
+# Relevance points for monthly traffic above 5k, 10k, 20k and 50k (bisect_left:
+# counts above each bound), and the bonus for each discovery method
+_TRAFFIC_RELEVANCE_BOUNDS = (5000, 10000, 20000, 50000)
+_TRAFFIC_RELEVANCE_POINTS = (0.0, 10.0, 20.0, 30.0, 40.0)
+_DISCOVERY_METHOD_BONUS = {
+    'keyword_analysis': 10,
+    'industry_analysis': 8,
+    'similar_domains': 6
+}
+
+# Industry detection terms in priority order; the first industry with any
+# term in the text wins
+_KEYWORD_INDUSTRY_TERMS = (
+    ('tech', ('tech', 'software', 'app', 'digital')),
+    ('health', ('health', 'medical', 'care')),
+    ('food', ('food', 'restaurant', 'dining')),
+    ('finance', ('finance', 'money', 'loan', 'bank'))
+)
+_DOMAIN_INDUSTRY_TERMS = (
+    ('Technology', ('tech', 'software', 'app', 'digital', 'web')),
+    ('Healthcare', ('health', 'medical', 'care', 'wellness')),
+    ('Finance', ('finance', 'money', 'loan', 'bank', 'invest')),
+    ('Retail', ('shop', 'store', 'retail', 'buy')),
+    ('Food', ('food', 'restaurant', 'cafe', 'dining')),
+    ('RealEstate', ('real', 'property', 'home', 'house'))
+)
+
+
+def _match_industry(text: str, industry_terms, default: str) -> str:
+    """Return the first industry with a term found in text, or default"""
+    for industry, terms in industry_terms:
+        for term in terms:
+            if term in text:
+                return industry
+    return default
+
+
+def _competitor_cache_key(domain: str, keywords: List[str]) -> str:
+    """Build a cache key from the domain and keywords, in order (results depend on it)"""
+    payload = orjson.dumps([domain, keywords], default=str)
+    return _COMPETITOR_CACHE_PREFIX + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
 
 class CompetitorCollector:
     """
@@ -27,6 +93,10 @@ class CompetitorCollector:
             'User-Agent': 'Mozilla/5.0 (compatible; MarketingBot/1.0)'
         })
 
+        adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE, max_retries=_RETRY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def collect_competitor_data(self, domain: str, keywords: List[str]) -> Dict:
         """
         Main method to collect competitor analysis data
@@ -39,20 +109,27 @@ class CompetitorCollector:
             Dictionary with competitor analysis data
         """
         try:
+            cache_key = _competitor_cache_key(domain, keywords)
+            cached_result = cache.get(cache_key)
+            if cached_result is not None:
+                logger.info(f"Using cached competitor data for {domain}")
+                return cached_result
+
             logger.info(f"Collecting competitor data for {domain}")
 
             # Discover competitors using multiple methods
             competitors = self._discover_competitors(domain, keywords)
+            stats = self._aggregate_competitor_stats(competitors)
 
             # Analyze market position
-            market_analysis = self._analyze_market_position(domain, competitors)
+            market_analysis = self._analyze_market_position(domain, competitors, stats)
 
             # Identify competitive gaps and opportunities
-            competitive_gaps = self._identify_competitive_gaps(domain, competitors)
+            competitive_gaps = self._identify_competitive_gaps(domain, competitors, stats)
             opportunities = self._identify_opportunities(domain, competitors)
 
             # Compare SEO metrics
-            seo_comparison = self._compare_seo_metrics(domain, competitors)
+            seo_comparison = self._compare_seo_metrics(domain, competitors, stats)
 
             # Analyze content strategies
             content_analysis = self._analyze_content_strategies(domain, competitors)
@@ -69,10 +146,11 @@ class CompetitorCollector:
                 'seo_comparison': seo_comparison,
                 'content_analysis': content_analysis,
                 'competitive_strategy': self._generate_competitive_strategy(domain, competitors),
-                'recommendations': self._generate_recommendations(domain, competitors, competitive_gaps),
+                'recommendations': self._generate_recommendations(domain, competitors, stats, competitive_gaps),
                 'note': 'This is placeholder data - integrate real APIs for production'
             }
 
+            cache.set(cache_key, result, _COMPETITOR_CACHE_TTL)
             logger.info(f"Competitor data collection completed for {domain}")
             return result
 
@@ -94,32 +172,27 @@ class CompetitorCollector:
         3. Analyze search results for target keywords
         4. Find industry-specific competitors
         """
-        competitors = []
+        # Competitors keyed by domain, so a domain found by several methods is kept once
+        found = {}
 
         # Method 1: Keyword-based competitors
-        keyword_competitors = self._find_keyword_competitors(domain, keywords)
-        competitors.extend(keyword_competitors)
+        self._find_keyword_competitors(domain, keywords, found)
 
         # Method 2: Industry-based competitors
-        industry_competitors = self._find_industry_competitors(domain)
-        competitors.extend(industry_competitors)
+        self._find_industry_competitors(domain, found)
 
         # Method 3: Similar domain competitors
-        similar_competitors = self._find_similar_domain_competitors(domain)
-        competitors.extend(similar_competitors)
+        self._find_similar_domain_competitors(domain, found)
 
-        # Remove duplicates and rank by relevance
-        unique_competitors = self._deduplicate_competitors(competitors)
-        ranked_competitors = self._rank_competitors(unique_competitors, domain)
+        # Rank by relevance
+        ranked_competitors = self._rank_competitors(list(found.values()), domain)
 
         return ranked_competitors[:8]  # Return top 8 competitors
 
-    def _find_keyword_competitors(self, domain: str, keywords: List[str]) -> List[Dict]:
+    def _find_keyword_competitors(self, domain: str, keywords: List[str], found: Dict[str, Dict]):
         """Find competitors ranking for the same keywords"""
-        competitors = []
-
         if not keywords:
-            return competitors
+            return
 
         # Generate realistic competitor domains based on keywords
         industry_hint = self._extract_industry_from_keywords(keywords)
@@ -137,25 +210,22 @@ class CompetitorCollector:
 
             # Generate realistic metrics
             common_keywords = min(len(keywords), 2 + i)
-            estimated_traffic = 5000 + (hash(competitor_domain) % 45000)
+            domain_hash = hash(competitor_domain)
+            estimated_traffic = 5000 + (domain_hash % 45000)
 
             competitor = {
                 'domain': competitor_domain,
                 'discovery_method': 'keyword_analysis',
                 'common_keywords': common_keywords,
-                'keyword_overlap_score': 30 + (hash(competitor_domain) % 50),
+                'keyword_overlap_score': 30 + (domain_hash % 50),
                 'estimated_monthly_traffic': estimated_traffic,
-                'competition_level': ['high', 'medium', 'low'][hash(competitor_domain) % 3],
+                'competition_level': ['high', 'medium', 'low'][domain_hash % 3],
                 'ranking_keywords': keywords[:common_keywords] if keywords else []
             }
-            competitors.append(competitor)
+            self._add_competitor(found, competitor)
 
-        return competitors
-
-    def _find_industry_competitors(self, domain: str) -> List[Dict]:
+    def _find_industry_competitors(self, domain: str, found: Dict[str, Dict]):
         """Find competitors in the same industry"""
-        competitors = []
-
         # Guess industry from domain
         industry = self._guess_industry_from_domain(domain)
 
@@ -168,24 +238,21 @@ class CompetitorCollector:
 
         for pattern in industry_patterns[:2]:
             competitor_domain = pattern
-            estimated_traffic = 15000 + (hash(competitor_domain) % 85000)
+            domain_hash = hash(competitor_domain)
+            estimated_traffic = 15000 + (domain_hash % 85000)
 
             competitor = {
                 'domain': competitor_domain,
                 'discovery_method': 'industry_analysis',
                 'industry': industry,
                 'estimated_monthly_traffic': estimated_traffic,
-                'market_position': ['leader', 'challenger', 'follower'][hash(competitor_domain) % 3],
-                'brand_strength': ['strong', 'medium', 'weak'][hash(competitor_domain) % 3]
+                'market_position': ['leader', 'challenger', 'follower'][domain_hash % 3],
+                'brand_strength': ['strong', 'medium', 'weak'][domain_hash % 3]
             }
-            competitors.append(competitor)
-
-        return competitors
+            self._add_competitor(found, competitor)
 
-    def _find_similar_domain_competitors(self, domain: str) -> List[Dict]:
+    def _find_similar_domain_competitors(self, domain: str, found: Dict[str, Dict]):
         """Find competitors with similar domain characteristics"""
-        competitors = []
-
         # Extract base name from domain
         base_name = domain.split('.')[0]
 
@@ -197,40 +264,36 @@ class CompetitorCollector:
 
         for pattern in similar_patterns[:2]:
             competitor_domain = pattern
-            estimated_traffic = 8000 + (hash(competitor_domain) % 35000)
+            domain_hash = hash(competitor_domain)
+            estimated_traffic = 8000 + (domain_hash % 35000)
 
             competitor = {
                 'domain': competitor_domain,
                 'discovery_method': 'similar_domains',
-                'similarity_score': 60 + (hash(competitor_domain) % 35),
+                'similarity_score': 60 + (domain_hash % 35),
                 'estimated_monthly_traffic': estimated_traffic,
                 'domain_strength': self._calculate_domain_strength(competitor_domain)
             }
-            competitors.append(competitor)
-
-        return competitors
+            self._add_competitor(found, competitor)
 
-    def _deduplicate_competitors(self, competitors: List[Dict]) -> List[Dict]:
-        """Remove duplicate competitors"""
-        seen_domains = set()
-        unique_competitors = []
-
-        for competitor in competitors:
-            domain = competitor.get('domain', '')
-            if domain and domain not in seen_domains:
-                seen_domains.add(domain)
-                unique_competitors.append(competitor)
+    def _add_competitor(self, found: Dict[str, Dict], competitor: Dict):
+        """Record a discovered competitor, merging it into an earlier find of the same domain"""
+        existing = found.get(competitor['domain'])
+        if existing is None:
+            found[competitor['domain']] = competitor
+            return
 
-        return unique_competitors
+        # The first discovery keeps its method and metrics; later ones add the
+        # fields it lacks (e.g. similarity_score from the similar-domain search)
+        for key, value in competitor.items():
+            existing.setdefault(key, value)
 
     def _rank_competitors(self, competitors: List[Dict], target_domain: str) -> List[Dict]:
         """Rank competitors by relevance and competitive threat"""
         for competitor in competitors:
-            relevance_score = self._calculate_relevance_score(competitor, target_domain)
-            threat_level = self._calculate_threat_level(competitor)
-
-            competitor['relevance_score'] = relevance_score
-            competitor['threat_level'] = threat_level
+            # Threat level reads the relevance score, so it must be stored first
+            competitor['relevance_score'] = self._calculate_relevance_score(competitor, target_domain)
+            competitor['threat_level'] = self._calculate_threat_level(competitor)
             competitor['competitive_strength'] = self._assess_competitive_strength(competitor)
 
         # Sort by relevance score (highest first)
@@ -238,18 +301,9 @@ class CompetitorCollector:
 
     def _calculate_relevance_score(self, competitor: Dict, target_domain: str) -> float:
         """Calculate how relevant this competitor is"""
-        score = 0.0
-
         # Traffic weight (40% of score)
         traffic = competitor.get('estimated_monthly_traffic', 0)
-        if traffic > 50000:
-            score += 40
-        elif traffic > 20000:
-            score += 30
-        elif traffic > 10000:
-            score += 20
-        elif traffic > 5000:
-            score += 10
+        score = _TRAFFIC_RELEVANCE_POINTS[bisect.bisect_left(_TRAFFIC_RELEVANCE_BOUNDS, traffic)]
 
         # Keyword overlap weight (30% of score)
         keyword_overlap = competitor.get('keyword_overlap_score', 0)
@@ -260,13 +314,7 @@ class CompetitorCollector:
         score += similarity * 0.2
 
         # Discovery method weight (10% of score)
-        method = competitor.get('discovery_method', '')
-        if method == 'keyword_analysis':
-            score += 10
-        elif method == 'industry_analysis':
-            score += 8
-        elif method == 'similar_domains':
-            score += 6
+        score += _DISCOVERY_METHOD_BONUS.get(competitor.get('discovery_method', ''), 0)
 
         return round(score, 1)
 
@@ -294,7 +342,35 @@ class CompetitorCollector:
         else:
             return 'weak'
 
-    def _analyze_market_position(self, domain: str, competitors: List[Dict]) -> Dict:
+    def _aggregate_competitor_stats(self, competitors: List[Dict]) -> Dict:
+        """Summarise the ranked competitors in one pass for the analyses below"""
+        total_traffic = 0
+        max_traffic = 0
+        total_common_keywords = 0
+        high_threats = []
+        leaders = []
+
+        for competitor in competitors:
+            traffic = competitor.get('estimated_monthly_traffic', 0)
+            total_traffic += traffic
+            if traffic > max_traffic:
+                max_traffic = traffic
+            total_common_keywords += competitor.get('common_keywords', 0)
+            if competitor.get('threat_level') == 'high':
+                high_threats.append(competitor)
+            if competitor.get('market_position') == 'leader':
+                leaders.append(competitor)
+
+        return {
+            'total_traffic': total_traffic,
+            'avg_traffic': total_traffic / len(competitors) if competitors else 0,
+            'max_traffic': max_traffic,
+            'total_common_keywords': total_common_keywords,
+            'high_threats': high_threats,
+            'leaders': leaders
+        }
+
+    def _analyze_market_position(self, domain: str, competitors: List[Dict], stats: Dict) -> Dict:
         """Analyze market position relative to competitors"""
         if not competitors:
             return {
@@ -303,11 +379,7 @@ class CompetitorCollector:
                 'market_position': 'unknown'
             }
 
-        # Calculate market metrics
-        total_competitor_traffic = sum(c.get('estimated_monthly_traffic', 0) for c in competitors)
-        avg_competitor_traffic = total_competitor_traffic / len(competitors) if competitors else 0
-
-        high_threat_count = sum(1 for c in competitors if c.get('threat_level') == 'high')
+        high_threat_count = len(stats['high_threats'])
 
         # Determine competitive intensity
         if high_threat_count >= 3:
@@ -319,11 +391,11 @@ class CompetitorCollector:
 
         return {
             'total_competitors_found': len(competitors),
-            'average_competitor_traffic': round(avg_competitor_traffic, 0),
-            'total_addressable_market': total_competitor_traffic,
+            'average_competitor_traffic': round(stats['avg_traffic'], 0),
+            'total_addressable_market': stats['total_traffic'],
             'competitive_intensity': competitive_intensity,
             'high_threat_competitors': high_threat_count,
-            'market_leaders': [c['domain'] for c in competitors if c.get('market_position') == 'leader'][:3],
+            'market_leaders': [c['domain'] for c in stats['leaders'][:3]],
             'key_success_factors': [
                 'SEO optimization',
                 'Content quality',
@@ -332,26 +404,22 @@ class CompetitorCollector:
             ]
         }
 
-    def _identify_competitive_gaps(self, domain: str, competitors: List[Dict]) -> List[str]:
+    def _identify_competitive_gaps(self, domain: str, competitors: List[Dict], stats: Dict) -> List[str]:
         """Identify gaps where target domain is behind competitors"""
         gaps = []
 
         # Analyze based on competitor data
         if competitors:
-            avg_traffic = sum(c.get('estimated_monthly_traffic', 0) for c in competitors) / len(competitors)
-
             # Traffic gap
-            if avg_traffic > 20000:
+            if stats['avg_traffic'] > 20000:
                 gaps.append("Traffic volume significantly below competitor average")
 
             # Keyword gaps
-            total_keywords = sum(c.get('common_keywords', 0) for c in competitors)
-            if total_keywords > 10:
+            if stats['total_common_keywords'] > 10:
                 gaps.append("Missing opportunities in competitor keyword targeting")
 
             # Market position gaps
-            leaders = [c for c in competitors if c.get('market_position') == 'leader']
-            if leaders:
+            if stats['leaders']:
                 gaps.append("Brand recognition and market leadership gaps")
 
         # Add common competitive gaps
@@ -383,44 +451,45 @@ class CompetitorCollector:
         # Return 4-5 relevant opportunities
         return opportunities[:5]
 
-    def _compare_seo_metrics(self, domain: str, competitors: List[Dict]) -> Dict:
+    def _compare_seo_metrics(self, domain: str, competitors: List[Dict], stats: Dict) -> Dict:
         """Compare SEO metrics with competitors"""
         if not competitors:
             return {'note': 'No competitors found for SEO comparison'}
 
-        # Calculate competitor averages
-        avg_traffic = sum(c.get('estimated_monthly_traffic', 0) for c in competitors) / len(competitors)
-        top_competitor_traffic = max(c.get('estimated_monthly_traffic', 0) for c in competitors)
+        avg_traffic = stats['avg_traffic']
 
         # Generate realistic metrics for target domain
-        estimated_domain_traffic = 3000 + (hash(domain) % 15000)
+        domain_hash = hash(domain)
+        estimated_domain_traffic = 3000 + (domain_hash % 15000)
 
         return {
             'traffic_comparison': {
                 'your_estimated_traffic': estimated_domain_traffic,
                 'competitor_average': round(avg_traffic, 0),
-                'top_competitor': top_competitor_traffic,
+                'top_competitor': stats['max_traffic'],
                 'traffic_gap': round(avg_traffic - estimated_domain_traffic, 0)
             },
             'keyword_analysis': {
-                'total_competitor_keywords': sum(c.get('common_keywords', 0) for c in competitors),
+                'total_competitor_keywords': stats['total_common_keywords'],
                 'keyword_opportunities': len(competitors) * 3,  # Estimate
                 'competition_difficulty': 'medium'
             },
             'domain_authority_estimate': {
-                'your_domain': 35 + (hash(domain) % 30),
+                'your_domain': 35 + (domain_hash % 30),
                 'competitor_average': 45 + (hash(domain[:3]) % 25),
                 'improvement_needed': True
             },
             'content_volume_comparison': {
-                'estimated_pages': 15 + (hash(domain) % 85),
-                'competitor_average_pages': 50 + (hash(domain) % 150),
+                'estimated_pages': 15 + (domain_hash % 85),
+                'competitor_average_pages': 50 + (domain_hash % 150),
                 'content_gap': True
             }
         }
 
     def _analyze_content_strategies(self, domain: str, competitors: List[Dict]) -> Dict:
         """Analyze competitor content strategies"""
+        domain_hash = hash(domain)
+
         return {
             'content_types_analysis': {
                 'blog_content': 'competitors_ahead',
@@ -430,8 +499,8 @@ class CompetitorCollector:
                 'downloadable_resources': 'limited_presence'
             },
             'content_quality_indicators': {
-                'average_word_count': 600 + (hash(domain) % 400),
-                'competitor_average_word_count': 800 + (hash(domain) % 600),
+                'average_word_count': 600 + (domain_hash % 400),
+                'competitor_average_word_count': 800 + (domain_hash % 600),
                 'content_freshness': 'needs_improvement',
                 'multimedia_usage': 'below_average'
             },
@@ -456,8 +525,6 @@ class CompetitorCollector:
         if not competitors:
             return {'strategy': 'Focus on basic SEO and content development'}
 
-        high_threat_competitors = [c for c in competitors if c.get('threat_level') == 'high']
-
         return {
             'immediate_actions': [
                 'Analyze top 3 competitor content strategies',
@@ -497,7 +564,8 @@ class CompetitorCollector:
             ]
         }
 
-    def _generate_recommendations(self, domain: str, competitors: List[Dict], gaps: List[str]) -> List[str]:
+    def _generate_recommendations(self, domain: str, competitors: List[Dict], stats: Dict,
+                                  gaps: List[str]) -> List[str]:
         """Generate actionable competitive recommendations"""
         recommendations = []
 
@@ -510,17 +578,15 @@ class CompetitorCollector:
             return recommendations
 
         # Traffic-based recommendations
-        avg_traffic = sum(c.get('estimated_monthly_traffic', 0) for c in competitors) / len(competitors)
-        if avg_traffic > 20000:
+        if stats['avg_traffic'] > 20000:
             recommendations.append("Implement aggressive SEO strategy to close traffic gap")
 
         # Keyword-based recommendations
-        total_competitor_keywords = sum(c.get('common_keywords', 0) for c in competitors)
-        if total_competitor_keywords > 15:
+        if stats['total_common_keywords'] > 15:
             recommendations.append("Target competitor keyword gaps for quick ranking wins")
 
         # Threat-based recommendations
-        high_threats = [c for c in competitors if c.get('threat_level') == 'high']
+        high_threats = stats['high_threats']
         if high_threats:
             top_threat = high_threats[0]['domain']
             recommendations.append(f"Study and benchmark against top competitor: {top_threat}")
@@ -549,36 +615,11 @@ class CompetitorCollector:
 
         # Simple industry detection based on keywords
         keyword_text = ' '.join(keywords).lower()
-
-        if any(term in keyword_text for term in ['tech', 'software', 'app', 'digital']):
-            return 'tech'
-        elif any(term in keyword_text for term in ['health', 'medical', 'care']):
-            return 'health'
-        elif any(term in keyword_text for term in ['food', 'restaurant', 'dining']):
-            return 'food'
-        elif any(term in keyword_text for term in ['finance', 'money', 'loan', 'bank']):
-            return 'finance'
-        else:
-            return 'business'
+        return _match_industry(keyword_text, _KEYWORD_INDUSTRY_TERMS, 'business')
 
     def _guess_industry_from_domain(self, domain: str) -> str:
         """Guess industry from domain name"""
-        domain_lower = domain.lower()
-
-        if any(term in domain_lower for term in ['tech', 'software', 'app', 'digital', 'web']):
-            return 'Technology'
-        elif any(term in domain_lower for term in ['health', 'medical', 'care', 'wellness']):
-            return 'Healthcare'
-        elif any(term in domain_lower for term in ['finance', 'money', 'loan', 'bank', 'invest']):
-            return 'Finance'
-        elif any(term in domain_lower for term in ['shop', 'store', 'retail', 'buy']):
-            return 'Retail'
-        elif any(term in domain_lower for term in ['food', 'restaurant', 'cafe', 'dining']):
-            return 'Food'
-        elif any(term in domain_lower for term in ['real', 'property', 'home', 'house']):
-            return 'RealEstate'
-        else:
-            return 'Business'
+        return _match_industry(domain.lower(), _DOMAIN_INDUSTRY_TERMS, 'Business')
 
     def _calculate_domain_strength(self, domain: str) -> str:
         """Calculate domain strength based on domain characteristics"""
@@ -1,3 +1,119 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from .competitor_collector import CompetitorCollector
+
+
+def _baseline_relevance_score(competitor):
+    """Relevance score as computed by the original if/elif bands"""
+    score = 0.0
+
+    traffic = competitor.get('estimated_monthly_traffic', 0)
+    if traffic > 50000:
+        score += 40
+    elif traffic > 20000:
+        score += 30
+    elif traffic > 10000:
+        score += 20
+    elif traffic > 5000:
+        score += 10
+
+    score += competitor.get('keyword_overlap_score', 0) * 0.3
+    score += competitor.get('similarity_score', 50) * 0.2
+
+    method = competitor.get('discovery_method', '')
+    if method == 'keyword_analysis':
+        score += 10
+    elif method == 'industry_analysis':
+        score += 8
+    elif method == 'similar_domains':
+        score += 6
+
+    return round(score, 1)
+
+
+class CompetitorDiscoveryTests(SimpleTestCase):
+    def setUp(self):
+        self.collector = CompetitorCollector()
+
+    def test_duplicate_domain_keeps_first_discovery(self):
+        found = {}
+        self.collector._add_competitor(found, {
+            'domain': 'rival.com', 'discovery_method': 'keyword_analysis', 'estimated_monthly_traffic': 12000
+        })
+        self.collector._add_competitor(found, {
+            'domain': 'rival.com', 'discovery_method': 'similar_domains', 'estimated_monthly_traffic': 40000,
+            'similarity_score': 80
+        })
+
+        self.assertEqual(found, {'rival.com': {
+            'domain': 'rival.com', 'discovery_method': 'keyword_analysis', 'estimated_monthly_traffic': 12000,
+            'similarity_score': 80
+        }})
+
+    def test_domain_found_by_several_methods_listed_once(self):
+        # 'techpro.com' is both a keyword competitor for tech terms and a similar domain of tech.com
+        competitors = self.collector._discover_competitors('tech.com', ['tech software'])
+        domains = [competitor['domain'] for competitor in competitors]
+
+        self.assertEqual(len(domains), len(set(domains)))
+        techpro = next(competitor for competitor in competitors if competitor['domain'] == 'techpro.com')
+        self.assertEqual(techpro['discovery_method'], 'keyword_analysis')
+        self.assertIn('similarity_score', techpro)
+        self.assertIn('domain_strength', techpro)
+
+
+class CompetitorThreatLevelTests(SimpleTestCase):
+    def setUp(self):
+        self.collector = CompetitorCollector()
+
+    def test_threat_level_bands(self):
+        for relevance, traffic, level in ((75, 40000, 'high'), (70, 40000, 'medium'), (75, 30000, 'medium'),
+                                          (55, 1000, 'medium'), (40, 15001, 'medium'), (40, 15000, 'low')):
+            with self.subTest(relevance=relevance, traffic=traffic):
+                competitor = {'relevance_score': relevance, 'estimated_monthly_traffic': traffic}
+                self.assertEqual(self.collector._calculate_threat_level(competitor), level)
+
+    def test_ranking_rates_relevant_high_traffic_competitor_high(self):
+        competitor = {
+            'domain': 'rival.com',
+            'discovery_method': 'keyword_analysis',
+            'estimated_monthly_traffic': 60000,
+            'keyword_overlap_score': 100,
+            'similarity_score': 50
+        }
+
+        ranked = self.collector._rank_competitors([competitor], 'example.com')
+
+        self.assertGreater(ranked[0]['relevance_score'], 70)
+        self.assertEqual(ranked[0]['threat_level'], 'high')
+
+
+class CompetitorRelevanceScoreTests(SimpleTestCase):
+    def setUp(self):
+        self.collector = CompetitorCollector()
+
+    def test_traffic_bands_match_baseline_at_edges(self):
+        for traffic in (0, 4999, 5000, 5001, 9999, 10000, 10001, 19999, 20000, 20001, 49999, 50000, 50001, 10 ** 7):
+            with self.subTest(traffic=traffic):
+                competitor = {'estimated_monthly_traffic': traffic, 'keyword_overlap_score': 0, 'similarity_score': 0}
+                self.assertEqual(
+                    self.collector._calculate_relevance_score(competitor, 'example.com'),
+                    _baseline_relevance_score(competitor)
+                )
+
+    def test_discovery_methods_match_baseline(self):
+        for method in ('keyword_analysis', 'industry_analysis', 'similar_domains', 'manual', ''):
+            with self.subTest(method=method):
+                competitor = {
+                    'estimated_monthly_traffic': 25000,
+                    'keyword_overlap_score': 45,
+                    'similarity_score': 70,
+                    'discovery_method': method
+                }
+                self.assertEqual(
+                    self.collector._calculate_relevance_score(competitor, 'example.com'),
+                    _baseline_relevance_score(competitor)
+                )
+
+    def test_missing_fields_use_defaults(self):
+        self.assertEqual(self.collector._calculate_relevance_score({}, 'example.com'), _baseline_relevance_score({}))
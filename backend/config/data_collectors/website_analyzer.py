@@ -29,6 +29,7 @@ class WebsiteAnalyzer:
             # Basic page analysis
             response = self.session.get(url, timeout=self.timeout)
             soup = BeautifulSoup(response.content, 'html.parser')
+            headings = self._analyze_headings(soup)
 
             analysis = {
                 'url': url,
@@ -50,9 +51,11 @@ class WebsiteAnalyzer:
 
                 # Content analysis
                 'word_count': self._get_word_count(soup),
-                'heading_structure': self._analyze_headings(soup),
+                'heading_structure': headings,
+                'heading_counts': {level: len(texts) for level, texts in headings.items()},
                 'images': self._analyze_images(soup, url),
                 'links': self._analyze_links(soup, url),
+                'has_video': self._detect_video(soup),
 
                 # SEO elements
                 'meta_tags': self._get_all_meta_tags(soup),
@@ -163,6 +166,18 @@ class WebsiteAnalyzer:
 
         return headings
 
+    def _detect_video(self, soup) -> bool:
+        """Detect embedded video content"""
+        if soup.find('video') or soup.find('meta', property='og:video'):
+            return True
+
+        video_hosts = ('youtube.com', 'youtube-nocookie.com', 'youtu.be', 'vimeo.com', 'wistia')
+        for iframe in soup.find_all('iframe', src=True):
+            if any(host in iframe['src'] for host in video_hosts):
+                return True
+
+        return False
+
     def _analyze_images(self, soup, base_url: str) -> Dict:
         """Analyze images on the page"""
         images = soup.find_all('img')
@@ -23,12 +23,15 @@ logger = logging.getLogger(__name__)
 
 
 @shared_task(bind=True, max_retries=3)
-def generate_marketing_report(self, report_id):
+def generate_marketing_report(self, report_id, use_openai_batch=False):
     """
     Main task for generating a comprehensive marketing report
 
     Args:
         report_id: UUID string of the report to generate
+        use_openai_batch: Queue the AI growth recommendations and summary text
+            on the OpenAI Batch API instead of generating them inline (for
+            non-interactive runs)
 
     Returns:
         Dict with generation results and metrics
@@ -311,7 +314,10 @@ def generate_marketing_report(self, report_id):
 
             # Generate growth recommendations
             growth_analyzer = GrowthAnalyzer()
-            growth_opportunities = growth_analyzer.generate_recommendations(collected_data)
+            if use_openai_batch:
+                growth_opportunities = growth_analyzer.enqueue_for_batch(collected_data, report_id)
+            else:
+                growth_opportunities = growth_analyzer.generate_recommendations(collected_data)
 
             collected_data['growth_opportunities'] = growth_opportunities
             report.growth_opportunities = growth_opportunities
@@ -339,7 +345,10 @@ def generate_marketing_report(self, report_id):
 
             # Generate executive summary
             summary_generator = SummaryGenerator()
-            executive_summary = summary_generator.generate_summary(collected_data)
+            if use_openai_batch:
+                executive_summary = summary_generator.generate_summaries_batch([collected_data], [report_id])[0]
+            else:
+                executive_summary = summary_generator.generate_summary(collected_data)
 
             report.executive_summary = executive_summary
 
@@ -803,7 +812,8 @@ def batch_process_reports(report_ids):
 
     for report_id in report_ids:
         try:
-            result = generate_marketing_report.delay(report_id)
+            # Nobody is waiting on these, so AI requests go through the OpenAI Batch API
+            result = generate_marketing_report.delay(report_id, use_openai_batch=True)
             results.append({
                 'report_id': report_id,
                 'task_id': result.id,
@@ -819,6 +829,104 @@ def batch_process_reports(report_ids):
     return results
 
 
+def _apply_batch_results(task, batch_id, collect_results, apply_result, label):
+    """
+    Apply the results of a finished OpenAI batch to their reports
+
+    Retries the polling task while the batch is still running. apply_result
+    updates one report from its result and returns the fields to save.
+    """
+    try:
+        results = collect_results(batch_id)
+    except Exception as e:
+        logger.error(f"Error collecting {label} batch {batch_id}: {e}")
+        return {'error': str(e)}
+
+    if results is None:
+        # Batch still running, check again in 10 minutes
+        raise task.retry(countdown=600)
+
+    updated_count = 0
+    for report_id, result in results.items():
+        try:
+            report = Report.objects.get(id=report_id)
+            report.save(update_fields=apply_result(report, result))
+            updated_count += 1
+        except Exception as e:
+            logger.error(f"Failed to apply {label} batch result to report {report_id}: {e}")
+
+    logger.info(f"Applied {label} batch {batch_id} to {updated_count} reports")
+    return {'batch_id': batch_id, 'updated_reports': updated_count}
+
+
+@shared_task
+def submit_growth_recommendation_batch():
+    """Submit queued growth enhancement requests to the OpenAI Batch API"""
+    try:
+        batch_id = GrowthAnalyzer().flush_batch()
+        if not batch_id:
+            logger.info("No queued growth enhancements to submit")
+            return {'status': 'empty'}
+
+        # Results take up to 24h; start polling after 10 minutes
+        poll_growth_recommendation_batch.apply_async((batch_id,), countdown=600)
+        return {'status': 'submitted', 'batch_id': batch_id}
+
+    except Exception as e:
+        logger.error(f"Error submitting growth recommendation batch: {e}")
+        return {'error': str(e)}
+
+
+@shared_task(bind=True, max_retries=None)
+def poll_growth_recommendation_batch(self, batch_id):
+    """Apply completed OpenAI batch results to report growth recommendations"""
+    growth_analyzer = GrowthAnalyzer()
+
+    def apply_recommendations(report, ai_recommendations):
+        report.growth_opportunities = growth_analyzer.apply_batch_recommendations(
+            report.growth_opportunities or [],
+            ai_recommendations
+        )
+        return ['growth_opportunities']
+
+    return _apply_batch_results(
+        self, batch_id, growth_analyzer.collect_batch_results, apply_recommendations, 'growth recommendation'
+    )
+
+
+@shared_task
+def submit_summary_batch():
+    """Submit queued AI executive summary requests to the OpenAI Batch API"""
+    try:
+        batch_id = SummaryGenerator().flush_batch()
+        if not batch_id:
+            logger.info("No queued AI summaries to submit")
+            return {'status': 'empty'}
+
+        # Results take up to 24h; start polling after 10 minutes
+        poll_summary_batch.apply_async((batch_id,), countdown=600)
+        return {'status': 'submitted', 'batch_id': batch_id}
+
+    except Exception as e:
+        logger.error(f"Error submitting summary batch: {e}")
+        return {'error': str(e)}
+
+
+@shared_task(bind=True, max_retries=None)
+def poll_summary_batch(self, batch_id):
+    """Apply completed OpenAI batch results to report executive summaries"""
+    def apply_summary(report, summary_text):
+        executive_summary = report.executive_summary or {}
+        executive_summary['summary_text'] = summary_text
+        executive_summary['ai_enhanced'] = True
+        report.executive_summary = executive_summary
+        return ['executive_summary']
+
+    return _apply_batch_results(
+        self, batch_id, SummaryGenerator().collect_batch_results, apply_summary, 'summary'
+    )
+
+
 @shared_task
 def regenerate_failed_reports():
     """Regenerate all failed reports"""
@@ -1018,13 +1126,15 @@ def optimize_database():
         return {'error': str(e)}
 
 
-# Periodic tasks configuration (add this to your celery beat schedule)
+# Periodic tasks configuration
 """
-To set up periodic tasks, add this to your Django settings:
+settings.CELERY_BEAT_SCHEDULE runs the OpenAI batch submit tasks:
+submit-summary-batch daily at 12:15 AM and submit-growth-recommendation-batch
+daily at 12:30 AM. Each submit task schedules its own polling task.
 
-from celery.schedules import crontab
+The maintenance tasks are not scheduled. To run them periodically, add
+entries like these to CELERY_BEAT_SCHEDULE:
 
-CELERY_BEAT_SCHEDULE = {
     'cleanup-old-reports': {
         'task': 'reports.tasks.cleanup_old_reports',
         'schedule': crontab(hour=2, minute=0),  # Daily at 2 AM
@@ -1045,5 +1155,4 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'reports.tasks.optimize_database',
         'schedule': crontab(hour=3, minute=0, day_of_week=0),  # Weekly on Sunday at 3 AM
     },
-}
 """
\ No newline at end of file